@@ -0,0 +1,120 @@
+"""
+Measures how many events per second are constructed from API responses,
+for both event history pages and stream payloads, and converted from an
+event history to a pandas DataFrame.
+
+>> python benchmarks/bench_events.py
+
+"""
+
+import json
+import time
+
+import disruptive as dt
+
+N_EVENTS = 20000
+N_REPEATS = 5
+
+TARGET = 'projects/c0md3mm0c7pet5n7i5lg/devices/emuc0uc989qdqebrvv29so0'
+TIMESTAMP = '2021-04-21T08:15:43.512330Z'
+
+EVENTS = [
+    {
+        'eventId': 'c0sdkd2cpn0g00fjb9c0',
+        'targetName': TARGET,
+        'eventType': 'temperature',
+        'data': {'temperature': {
+            'value': 24.9,
+            'updateTime': TIMESTAMP,
+            'isBackfilled': False,
+            'samples': [
+                {'value': 24.9, 'sampleTime': TIMESTAMP},
+                {'value': 24.8, 'sampleTime': TIMESTAMP},
+            ],
+        }},
+        'timestamp': TIMESTAMP,
+    },
+    {
+        'eventId': 'c0sdkd2cpn0g00fjb9d0',
+        'targetName': TARGET,
+        'eventType': 'touch',
+        'data': {'touch': {'updateTime': TIMESTAMP}},
+        'timestamp': TIMESTAMP,
+    },
+    {
+        'eventId': 'c0sdkd2cpn0g00fjb9e0',
+        'targetName': TARGET,
+        'eventType': 'networkStatus',
+        'data': {'networkStatus': {
+            'signalStrength': 99,
+            'rssi': -50,
+            'updateTime': TIMESTAMP,
+            'cloudConnectors': [
+                {'id': 'emulated-ccon', 'signalStrength': 99, 'rssi': -50},
+            ],
+            'transmissionMode': 'LOW_POWER_STANDARD_MODE',
+        }},
+        'timestamp': TIMESTAMP,
+    },
+]
+
+
+def bench_history(lazy: bool = False) -> float:
+    # A page of events is decoded once, then constructed as a list.
+    page = json.dumps([EVENTS[i % len(EVENTS)] for i in range(N_EVENTS)])
+    best = float('inf')
+    for _ in range(N_REPEATS):
+        raw = json.loads(page)
+        t0 = time.perf_counter()
+        dt.events.Event.from_mixed_list(raw, lazy=lazy)
+        best = min(best, time.perf_counter() - t0)
+    return N_EVENTS / best
+
+
+def bench_columnar() -> float:
+    # A page of events is decoded once, then stored column by column.
+    page = json.dumps([EVENTS[i % len(EVENTS)] for i in range(N_EVENTS)])
+    best = float('inf')
+    for _ in range(N_REPEATS):
+        raw = json.loads(page)
+        t0 = time.perf_counter()
+        dt.ColumnarEventHistory(raw)
+        best = min(best, time.perf_counter() - t0)
+    return N_EVENTS / best
+
+
+def bench_to_pandas() -> float:
+    # A lazily constructed history is converted to a DataFrame.
+    page = json.dumps([EVENTS[i % len(EVENTS)] for i in range(N_EVENTS)])
+    best = float('inf')
+    for _ in range(N_REPEATS):
+        history = dt.EventHistory(
+            dt.events.Event.from_mixed_list(json.loads(page), lazy=True),
+        )
+        t0 = time.perf_counter()
+        history.to_pandas()
+        best = min(best, time.perf_counter() - t0)
+    return N_EVENTS / best
+
+
+def bench_stream() -> float:
+    # Each stream line is decoded and constructed on its own.
+    lines = [
+        json.dumps({'result': {'event': EVENTS[i % len(EVENTS)]}})
+        for i in range(N_EVENTS)
+    ]
+    best = float('inf')
+    for _ in range(N_REPEATS):
+        t0 = time.perf_counter()
+        for line in lines:
+            dt.events.Event(json.loads(line)['result']['event'])
+        best = min(best, time.perf_counter() - t0)
+    return N_EVENTS / best
+
+
+if __name__ == '__main__':
+    print('history:      {:>10,.0f} events/s'.format(bench_history()))
+    print('history lazy: {:>10,.0f} events/s'.format(bench_history(True)))
+    print('columnar:     {:>10,.0f} events/s'.format(bench_columnar()))
+    print('to_pandas:    {:>10,.0f} events/s'.format(bench_to_pandas()))
+    print('stream:       {:>10,.0f} events/s'.format(bench_stream()))
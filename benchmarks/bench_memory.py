@@ -0,0 +1,36 @@
+"""
+Measures the memory held by constructed events, not counting the
+decoded JSON response they are built from.
+
+>> python benchmarks/bench_memory.py
+
+"""
+
+import gc
+import json
+import tracemalloc
+
+import disruptive as dt
+from bench_events import EVENTS
+
+N_EVENTS = 20000
+
+
+def bytes_per_event(lazy: bool = False) -> float:
+    page = json.dumps([EVENTS[i % len(EVENTS)] for i in range(N_EVENTS)])
+    raw = json.loads(page)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    events = dt.events.Event.from_mixed_list(raw, lazy=lazy)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(events) == N_EVENTS
+    return (after - before) / N_EVENTS
+
+
+if __name__ == '__main__':
+    print('memory:      {:>8,.0f} bytes/event'.format(bytes_per_event()))
+    print('memory lazy: {:>8,.0f} bytes/event'.format(bytes_per_event(True)))
@@ -12,16 +12,84 @@ emulator_base_url = 'https://emulator.disruptive-technologies.com/v2'
 # If a request response contains an error for which a series of retries is
 # worth considering, these variable determine how long to wait without an
 # answer, and how many times the package should retry before raising an error.
+# If retry_policy below has a budget, retries may stop sooner once it is
+# spent, also when request_attempts is overridden per call.
 request_timeout = 3  # seconds
 request_attempts = 3  # attempts
 
+# Requests are sent through a shared, thread-safe session that keeps
+# connections alive between calls. This sets how many connections
+# are kept open to each host.
+request_pool_size = 10  # connections per host
+
+# Client-side rate limits in requests per second, keyed by base URL and
+# then by endpoint class, one of "events", "stream", "read", or "write".
+# "*" matches any base URL or class. Requests are then paced to stay
+# within the limits, which are lowered on 429 responses and recover
+# gradually. Default None results in no client-side rate limiting.
+# Example: {'*': {'*': 20, 'events': 5}}
+rate_limits = None
+
+# Backend used to decode JSON responses and stream lines. Either "auto",
+# which picks orjson or ujson if installed, or one of "orjson", "ujson",
+# and "json" for the standard library.
+json_decoder = 'auto'
+
+# If set, access tokens are shared between processes through this store,
+# for instance a FileTokenStore. Default None keeps tokens per process.
+token_store = None
+
+# Failed requests and stream reconnects are retried with jittered
+# exponential backoff, up to request_attempts times. Replace with a
+# RetryPolicy of your own to change this, for instance to set a deadline,
+# or override it per call with a retry_policy kwarg. To keep outages from
+# causing retry storms, give it a RetryBudget shared by all requests.
+# Example: RetryPolicy(budget=RetryBudget())
+from disruptive.retry import RetryPolicy as RetryPolicy  # noqa
+from disruptive.retry import RetryBudget as RetryBudget  # noqa
+retry_policy = RetryPolicy()
+
+# If set, requests to a base URL whose API keeps failing raise
+# CircuitBreakerOpen at once instead of waiting out every attempt,
+# until a probe request succeeds. Set to a CircuitBreaker to enable,
+# or override it per call with a circuit_breaker kwarg.
+# Default None results in no circuit breaking.
+from disruptive.circuitbreaker import CircuitBreaker as CircuitBreaker  # noqa
+circuit_breaker = None
+
+# If set, GET requests not answered within a percentile of recent
+# response times are sent once more, using whichever answers first.
+# Set to a HedgePolicy to enable, or override it per call with a
+# hedge_policy kwarg. Default None results in no hedged requests.
+from disruptive.hedging import HedgePolicy as HedgePolicy  # noqa
+hedge_policy = None
+
+# Hooks called as requests are sent and stream events arrive, for
+# instance a MetricsCollector keeping latencies, retries and bytes
+# received. Default empty list results in no instrumentation.
+from disruptive.instrumentation import Hooks as Hooks  # noqa
+from disruptive.instrumentation import MetricsCollector as MetricsCollector  # noqa
+hooks: list = []
+
+# If the opentelemetry-api package is installed, OpenTelemetry spans are
+# created for API calls, pages, token refreshes and stream connections,
+# and the trace context is added to request headers. Set False to
+# disable. Without OpenTelemetry installed, this has no effect.
+trace_requests = True
+
 # Authentication scheme.
 from disruptive.authentication import Auth as Auth  # noqa
+from disruptive.authentication import TokenStore as TokenStore  # noqa
+from disruptive.authentication import FileTokenStore as FileTokenStore  # noqa
 
 # Initialize package with environment variables authentication scheme.
 default_auth = Auth.init()
 
 # Additional helper modules.
+from disruptive import aio as aio  # noqa
+from disruptive.archive import EventHistoryWriter as EventHistoryWriter  # noqa
+from disruptive.cache import EventCache as EventCache  # noqa
+from disruptive.columnar import ColumnarEventHistory as ColumnarEventHistory  # noqa
 from disruptive import errors as errors  # noqa
 from disruptive import events as events  # noqa
 from disruptive import logging as logging  # noqa
@@ -0,0 +1,15 @@
+# Asynchronous twins of the resource methods.
+# Requires the optional aiohttp package to be installed.
+from disruptive.aio.requests import close_sessions as close_sessions  # noqa
+from disruptive.aio.resources.claim import Claim as Claim  # noqa
+from disruptive.aio.resources.data_connector import DataConnector as DataConnector  # noqa
+from disruptive.aio.resources.device import Device as Device  # noqa
+from disruptive.aio.resources.emulator import Emulator as Emulator  # noqa
+from disruptive.aio.resources.eventhistory import EventHistory as EventHistory  # noqa
+from disruptive.aio.resources.organization import Organization as Organization  # noqa
+from disruptive.aio.resources.project import Project as Project  # noqa
+from disruptive.aio.resources.role import Role as Role  # noqa
+from disruptive.aio.resources.service_account import ServiceAccount as ServiceAccount  # noqa
+from disruptive.aio.resources.stream import Stream as Stream  # noqa
+from disruptive.aio.resources.stream import StreamMultiplexer as StreamMultiplexer  # noqa
+from disruptive.aio.resources.stream import StreamHealth as StreamHealth  # noqa
@@ -0,0 +1,749 @@
+from __future__ import annotations
+
+import time
+import asyncio
+import threading
+import weakref
+from functools import partial
+from typing import Optional, Any, AsyncGenerator, Callable
+
+import disruptive as dt
+import disruptive.logging as dtlog
+import disruptive.errors as dterrors
+import disruptive.decoding as dtdecoding
+import disruptive.ratelimit as dtratelimit
+import disruptive.retry as dtretry
+import disruptive.hedging as dthedging
+import disruptive.instrumentation as dtinstrumentation
+import disruptive.tracing as dttracing
+import disruptive.requests as dtrequests
+
+# Pooled sessions shared by all requests, keyed by event loop and pool size.
+_sessions: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[int, Any]
+] = weakref.WeakKeyDictionary()
+_sessions_lock = threading.Lock()
+
+
+def _import_aiohttp() -> Any:
+    try:
+        import aiohttp  # type: ignore
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            'Missing package `aiohttp`.\n\n'
+            'disruptive.aio requires additional third-party packages.\n'
+            '>> pip install disruptive[extra]'
+        )
+    return aiohttp
+
+
+async def _get_token(auth: Any) -> str:
+    """
+    Returns the access token of an authentication object.
+
+    Exchanging an expired token is a blocking request, so it is then
+    done in a thread, leaving the event loop free. Tokens about to
+    expire are refreshed in the background without blocking.
+
+    """
+
+    if auth._has_expired():
+        token: str = await asyncio.to_thread(auth.get_token)
+    else:
+        token = auth.get_token()
+    return token
+
+
+def _pooled_session(pool_size: int) -> Any:
+    """
+    Returns the session of the running event loop for the
+    given pool size, creating it on first use.
+
+    Parameters
+    ----------
+    pool_size : int
+        Maximum number of connections kept open to each host.
+
+    Returns
+    -------
+    session : aiohttp.ClientSession
+        Session bound to the running event loop.
+
+    """
+
+    aiohttp = _import_aiohttp()
+    loop = asyncio.get_running_loop()
+    with _sessions_lock:
+        sessions = _sessions.setdefault(loop, {})
+        if pool_size not in sessions or sessions[pool_size].closed:
+            sessions[pool_size] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=0,
+                    limit_per_host=pool_size,
+                ),
+            )
+        return sessions[pool_size]
+
+
+async def close_sessions() -> None:
+    """
+    Closes the pooled sessions of the running event loop.
+
+    Should be awaited before the event loop is closed.
+
+    Examples
+    --------
+    >>> async def main():
+    ...     devices = await dt.aio.Device.list_devices('<PROJECT_ID>')
+    ...     await dt.aio.close_sessions()
+    >>>
+    >>> asyncio.run(main())
+
+    """
+
+    loop = asyncio.get_running_loop()
+    with _sessions_lock:
+        sessions = _sessions.pop(loop, {})
+    for session in sessions.values():
+        await session.close()
+
+
+def _flatten_params(params: dict) -> list[tuple[str, str]]:
+    # Unlike requests, aiohttp does not expand lists into repeated keys.
+    flat = []
+    for key, value in params.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for v in values:
+            flat.append((key, str(v)))
+    return flat
+
+
+def _parse_client_error(caught_error: Exception) -> tuple:
+    """
+    Asynchronous counterpart of :func:`disruptive.errors.parse_request_error`.
+
+    Parameters
+    ----------
+    caught_error : Exception
+        Client error that has been caught.
+
+    Returns
+    -------
+    error : Exception
+        Exception to be raised.
+    should_retry : bool
+        If the request should be retried or not.
+
+    """
+
+    aiohttp = _import_aiohttp()
+
+    # Read Timeouts should be attempted again.
+    if isinstance(caught_error, asyncio.TimeoutError):
+        return dterrors.ReadTimeout('Connection timed out.'), True
+
+    # Connection errors should be attempted again.
+    elif isinstance(caught_error, aiohttp.ClientConnectionError):
+        return (
+            dterrors.ConnectionError('Failed to establish connection.'),
+            True,
+        )
+    else:
+        # Unhandled error has been raised.
+        return caught_error, False
+
+
+class AsyncDTRequest():
+    """
+    Asynchronous twin of :class:`disruptive.requests.DTRequest`.
+
+    Arguments are unpacked and validated by DTRequest, meaning the
+    same configuration kwargs apply. Requests are sent with aiohttp,
+    which must be installed separately.
+
+    """
+
+    def __init__(self, method: str, url: str, **kwargs: Any):
+        # The token is fetched when sending, as it may need a blocking
+        # exchange, so DTRequest is told to skip authorization.
+        self._auth: Any = None
+        if not kwargs.get('skip_auth', False):
+            self._auth = kwargs.get('auth', dt.default_auth)
+
+        # Unpack and sanitize kwargs the same way as blocking requests.
+        self._req = dtrequests.DTRequest(
+            method, url, **dict(kwargs, skip_auth=True),
+        )
+
+    async def _request_wrapper(self) -> tuple[dtrequests.DTResponse, Any]:
+        aiohttp = _import_aiohttp()
+        req = self._req
+
+        # Add custom user agent.
+        headers = dict(req.headers)
+        headers['User-Agent'] = dtrequests.USER_AGENT
+
+        # Use the pooled session of this event loop unless one is provided.
+        session: Any = req.session
+        if session is None:
+            session = _pooled_session(req.request_pool_size)
+
+        # Define default response values.
+        status_code = None
+        res_headers: Any = {}
+
+        # Attempt to send the request.
+        try:
+            async with session.request(
+                method=req.method,
+                url=req.full_url,
+                params=_flatten_params(req.params),
+                headers=headers,
+                json=req.body,
+                data=req.data,
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=req.request_timeout,
+                    sock_read=req.request_timeout,
+                ),
+            ) as res:
+                status_code = res.status
+                res_headers = res.headers
+                payload = await res.read()
+
+            # Isolate the data of interest in the response.
+            data = dtdecoding.loads(payload)
+            return dtrequests.DTResponse(
+                data, status_code, res_headers, len(payload),
+            ), None
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return dtrequests.DTResponse({}, None, {}), e
+        except ValueError as e:
+            # Decoding fails when no json is returned (code 405).
+            if status_code is None:
+                return dtrequests.DTResponse({}, 0, {}), e
+            else:
+                return dtrequests.DTResponse({}, status_code, res_headers), e
+
+    async def _hedged_request(self,
+                              policy: dthedging.HedgePolicy,
+                              limiter: Optional[dtratelimit.RateLimiter],
+                              on_unused: Callable[..., Any],
+                              ) -> tuple[dtrequests.DTResponse, Any]:
+        """
+        Asynchronous counterpart of
+        :meth:`disruptive.requests.DTRequest._hedged_request`,
+        where the request not used is cancelled if it has not finished.
+
+        """
+
+        req = self._req
+        endpoint = req.base_url + dtratelimit.endpoint_template(req.url)
+        delay = policy.delay(endpoint)
+
+        # Record response times of first attempts only, being the
+        # ones a hedge is measured against.
+        start = time.monotonic()
+
+        def record(task: asyncio.Future) -> None:
+            if not task.cancelled():
+                policy.record(endpoint, time.monotonic() - start)
+
+        primary = asyncio.ensure_future(self._request_wrapper())
+        primary.add_done_callback(record)
+        if delay is None:
+            return await primary
+
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if len(done) > 0 or not policy.allow():
+            return await primary
+
+        dtlog.debug('Hedging request [{}] to {} after {:.3f}s.'.format(
+            req.method,
+            req.full_url,
+            delay,
+        ))
+
+        # The hedge waits its turn in the client-side rate limit, if any.
+        wait = limiter.acquire() if limiter is not None else 0.0
+
+        async def send_hedge() -> tuple[dtrequests.DTResponse, Any]:
+            if wait > 0:
+                await asyncio.sleep(wait)
+            return await self._request_wrapper()
+
+        hedge = asyncio.ensure_future(send_hedge())
+
+        # Use the first answer, unless the request itself failed.
+        used = None
+        pending = {primary, hedge}
+        try:
+            while used is None and len(pending) > 0:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    if task.result()[1] is None:
+                        used = task
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+        if used is None:
+            used = primary
+        elif used is hedge:
+            policy.record_win()
+
+        # The other request was still sent, and its response counts.
+        unused = primary if used is hedge else hedge
+        if unused.done() and not unused.cancelled():
+            on_unused(*unused.result())
+        result: tuple[dtrequests.DTResponse, Any] = used.result()
+        return result
+
+    def _observe_response(self,
+                          res: dtrequests.DTResponse,
+                          req_error: Any,
+                          attempt: int,
+                          start: float,
+                          limiter: Optional[dtratelimit.RateLimiter],
+                          breaker: Optional[Any],
+                          hooks: list,
+                          endpoint: str,
+                          ) -> tuple[Optional[Exception], bool]:
+        """
+        Asynchronous counterpart of
+        :meth:`disruptive.requests.DTRequest._observe_response`.
+
+        """
+
+        req = self._req
+
+        # Log the response.
+        dtlog.debug('Response [{}].'.format(
+            res.status_code
+        ))
+
+        # If _request_wrapper caught an exception, the request failed.
+        if req_error is not None:
+            error, should_retry = _parse_client_error(req_error)
+        else:
+            error, should_retry, _ = dterrors.parse_api_status_code(
+                res.status_code, res.data, res.headers, attempt
+            )
+
+        # Adapt the rate limit and circuit to the response.
+        if limiter is not None:
+            should_retry = dtratelimit.adapt(limiter, error, should_retry)
+        if breaker is not None:
+            breaker.record(req.base_url, error)
+        if isinstance(error, dterrors.TooManyRequests) \
+                and not req.retry_rate_limited:
+            should_retry = False
+        if hooks:
+            dtinstrumentation.emit(
+                hooks, 'on_response',
+                method=req.method,
+                endpoint=endpoint,
+                status_code=res.status_code,
+                duration=time.monotonic() - start,
+                attempt=attempt,
+                size=res.size,
+                error=error,
+            )
+        return error, should_retry
+
+    async def _send_request(self) -> dict:
+        """
+        Sends the request, retrying as long as the retry policy allows
+        and the error is considered worth another attempt.
+
+        Returns
+        -------
+        data : dict
+            Data contained in the response.
+
+        """
+
+        # All attempts share a single span, if tracing.
+        with dttracing.request_span(self._req.method, self._req.url) as span:
+            return await self._send_attempts(span)
+
+    async def _send_attempts(self, span: Any) -> dict:
+        req = self._req
+        if self._auth is not None:
+            req.headers['Authorization'] = await _get_token(self._auth)
+        limiter = dtratelimit.get_limiter(req.base_url, req.method, req.url)
+        breaker = req.circuit_breaker
+        backoff = req.retry_policy.begin(req.request_attempts)
+
+        # Hooks are given the endpoint without resource IDs.
+        hooks = dt.hooks
+        endpoint = dtratelimit.endpoint_template(req.url) if hooks else ''
+        while True:
+            # Fail fast while the API behind base_url is failing. Unlike
+            # for streams, the error is raised without being retried.
+            if breaker is not None:
+                breaker.allow(req.base_url)
+
+            # Wait for the client-side rate limit, if any.
+            if limiter is not None:
+                wait = limiter.acquire()
+                if wait > 0:
+                    dtlog.debug('Rate limited for {:.2f}s.'.format(wait))
+                    await asyncio.sleep(wait)
+
+            # Log the request.
+            dtlog.debug('Request [{}] to {}.'.format(
+                req.method,
+                req.full_url,
+            ))
+            if hooks:
+                dtinstrumentation.emit(
+                    hooks, 'on_request_start',
+                    method=req.method,
+                    endpoint=endpoint,
+                    attempt=backoff.attempt,
+                )
+            start = time.monotonic()
+
+            # Only first attempts of idempotent GET requests are hedged.
+            dttracing.inject(req.headers)
+            if req.hedge_policy is not None and req.method == 'GET' \
+                    and backoff.attempt == 0:
+                res, req_error = await self._hedged_request(
+                    req.hedge_policy, limiter, partial(
+                        self._observe_response,
+                        attempt=backoff.attempt,
+                        start=start,
+                        limiter=limiter,
+                        breaker=breaker,
+                        hooks=hooks,
+                        endpoint=endpoint,
+                    ),
+                )
+            else:
+                res, req_error = await self._request_wrapper()
+
+            error, should_retry = self._observe_response(
+                res, req_error,
+                attempt=backoff.attempt,
+                start=start,
+                limiter=limiter,
+                breaker=breaker,
+                hooks=hooks,
+                endpoint=endpoint,
+            )
+            dttracing.set_response(span, res.status_code, backoff.attempt)
+
+            # Check if retry is required and allowed by the policy.
+            if should_retry:
+                sleeptime = backoff.next_sleep(dtretry.retry_after(error))
+                if sleeptime is not None:
+                    dtlog.warning('Reconnecting in {:.1f}s.'.format(
+                        sleeptime,
+                    ))
+                    if hooks:
+                        dtinstrumentation.emit(
+                            hooks, 'on_retry',
+                            method=req.method,
+                            endpoint=endpoint,
+                            attempt=backoff.attempt,
+                            sleeptime=sleeptime,
+                            error=error,
+                        )
+                    await asyncio.sleep(sleeptime)
+
+                    dtlog.info('Connection attempt {} of {}.'.format(
+                        backoff.attempt,
+                        req.request_attempts,
+                    ))
+                    continue
+
+            # If set, raise the error chosen by the parser.
+            if error is not None:
+                raise error
+
+            data: dict = res.data
+            return data
+
+    @classmethod
+    async def get(cls, url: str, **kwargs: Any) -> dict:
+        req = cls('GET', url, **kwargs)
+        response: dict = await req._send_request()
+        return response
+
+    @classmethod
+    async def post(cls, url: str, **kwargs: Any) -> dict:
+        req = cls('POST', url, **kwargs)
+        response: dict = await req._send_request()
+        return response
+
+    @classmethod
+    async def patch(cls, url: str, **kwargs: Any) -> dict:
+        req = cls('PATCH', url, **kwargs)
+        response: dict = await req._send_request()
+        return response
+
+    @classmethod
+    async def delete(cls, url: str, **kwargs: Any) -> dict:
+        req = cls('DELETE', url, **kwargs)
+        response: dict = await req._send_request()
+        return response
+
+    @classmethod
+    async def paginated_get(cls,
+                            url: str,
+                            pagination_key: str,
+                            params: Optional[dict] = None,
+                            **kwargs: Any,
+                            ) -> list:
+        # Copy parameters as the page token is added to them.
+        params = dict(params) if params is not None else {}
+
+        # Initialize output list.
+        results = []
+
+        # Loop until paging has finished.
+        page_count = 0
+        while True:
+            page_count += 1
+            with dttracing.page_span(url, page_count):
+                response = await cls.get(url, params=params, **kwargs)
+            results += response[pagination_key]
+
+            if len(response['nextPageToken']) > 0:
+                params['pageToken'] = response['nextPageToken']
+            else:
+                break
+
+        return results
+
+    @staticmethod
+    async def stream(url: str, **kwargs: Any) -> AsyncGenerator:
+        """
+        Initializes and returns an asynchronous stream generator.
+
+        Parameters
+        ----------
+        url : str
+            API endpoint URL.
+        yield_pings : bool, optional
+            If True, ping events are yielded as well.
+
+        """
+
+        aiohttp = _import_aiohttp()
+
+        # Set ping constants.
+        PING_INTERVAL = 10
+        PING_JITTER = 2
+
+        # Reconnects share the rate limit of the stream endpoint, if any.
+        limiter = dtratelimit.get_limiter(dt.base_url, 'GET', url)
+        base_url = dt.base_url
+
+        # Hooks are given the endpoint without resource IDs.
+        hooks = dt.hooks
+        endpoint = dtratelimit.endpoint_template(url) if hooks else ''
+
+        # Expand url with base_url, keeping the endpoint for tracing.
+        path = url
+        url = dt.base_url + url
+
+        # Unpack kwargs.
+        params = kwargs['params'] if 'params' in kwargs else {}
+        headers = kwargs['headers'] if 'headers' in kwargs else {}
+        if 'request_attempts' in kwargs:
+            request_attempts = kwargs['request_attempts']
+        else:
+            request_attempts = dt.request_attempts
+        if 'session' in kwargs:
+            session = kwargs['session']
+        elif 'request_pool_size' in kwargs:
+            session = _pooled_session(kwargs['request_pool_size'])
+        else:
+            session = _pooled_session(dt.request_pool_size)
+        retry_policy = kwargs.get('retry_policy', dt.retry_policy)
+        breaker = kwargs.get('circuit_breaker', dt.circuit_breaker)
+        yield_pings = kwargs.get('yield_pings', False)
+
+        # Add ping parameter to dictionary.
+        params['ping_interval'] = str(PING_INTERVAL) + 's'
+
+        # Add custom user agent.
+        headers['User-Agent'] = dtrequests.USER_AGENT
+
+        # Reconnect as allowed by the retry policy, which is
+        # restarted each time the stream has recovered.
+        backoff = retry_policy.begin(request_attempts)
+        while True:
+            # Each connection records a single outcome to the circuit.
+            pending = False
+            span = None
+            try:
+                # Set the authorization header each retry in case we expire.
+                headers['Authorization'] = await _get_token(
+                    kwargs['auth'] if 'auth' in kwargs else dt.default_auth,
+                )
+
+                # Fail fast while the API is failing. The error is
+                # retried as any other, waiting for the circuit to probe.
+                if breaker is not None:
+                    breaker.allow(base_url)
+                    pending = True
+
+                # Wait for the client-side rate limit, if any.
+                if limiter is not None:
+                    await asyncio.sleep(limiter.acquire())
+
+                # Set up a stream connection.
+                # Connection will timeout and reconnect if no single event
+                # is received in an interval of ping_interval + ping_jitter.
+                dtlog.info('Starting stream...')
+                if hooks:
+                    dtinstrumentation.emit(
+                        hooks, 'on_request_start',
+                        method='GET',
+                        endpoint=endpoint,
+                        attempt=backoff.attempt,
+                    )
+                start = time.monotonic()
+                span = dttracing.start_stream_span(path, backoff.attempt)
+                dttracing.inject(headers, span)
+                async with session.request(
+                    method='GET',
+                    url=url,
+                    params=_flatten_params(params),
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(
+                        sock_read=PING_INTERVAL + PING_JITTER,
+                    ),
+                ) as stream:
+                    dttracing.end_span(span, stream.status)
+                    span = None
+                    if hooks:
+                        dtinstrumentation.emit(
+                            hooks, 'on_response',
+                            method='GET',
+                            endpoint=endpoint,
+                            status_code=stream.status,
+                            duration=time.monotonic() - start,
+                            attempt=backoff.attempt,
+                            size=0,
+                            error=None,
+                        )
+
+                    # Iterate through the events as they come in.
+                    async for line in stream.content:
+                        if len(line.strip()) == 0:
+                            continue
+
+                        # Decode the response payload and break on error.
+                        payload = dtdecoding.loads(line)
+                        if 'result' in payload:
+                            # Reset retry schedule.
+                            if backoff.attempt > 0:
+                                backoff = retry_policy.begin(
+                                    request_attempts,
+                                )
+
+                            # Record the connection as successful once.
+                            if breaker is not None and pending:
+                                breaker.record(base_url, None)
+                                pending = False
+
+                            # Check for ping event.
+                            event = payload['result']['event']
+                            if hooks:
+                                dtinstrumentation.emit(
+                                    hooks, 'on_stream_event',
+                                    endpoint=endpoint,
+                                    event_type=event['eventType'],
+                                    size=len(line),
+                                )
+                            if event['eventType'] == 'ping':
+                                dtlog.debug('Ping received.')
+                                if yield_pings:
+                                    yield event
+                                continue
+
+                            # Yield event to generator.
+                            yield event
+
+                        elif 'error' in payload:
+                            error, _, _ = dterrors.parse_api_status_code(
+                                payload['error']['code'],
+                                payload, None, 0
+                            )
+                            raise error
+
+                        else:
+                            raise dterrors.UnknownError(payload)
+
+                # If the stream finished, but without an error, retry.
+                msg = 'Stream ended without an error.'
+                raise dterrors.ConnectionError(msg)
+
+            except dterrors.DTApiError as e:
+                if breaker is not None and pending:
+                    breaker.record(base_url, e)
+
+                # Except for Unauthorized, retry all DTApiErrors.
+                if isinstance(e, dterrors.Unauthorized):
+                    raise e
+
+                sleeptime = backoff.next_sleep(dtretry.retry_after(e))
+                if sleeptime is not None:
+                    dtlog.warning('Reconnecting in {:.1f}s.'.format(
+                        sleeptime,
+                    ))
+                    if hooks:
+                        dtinstrumentation.emit(
+                            hooks, 'on_retry',
+                            method='GET',
+                            endpoint=endpoint,
+                            attempt=backoff.attempt,
+                            sleeptime=sleeptime,
+                            error=e,
+                        )
+                    await asyncio.sleep(sleeptime)
+
+                    dtlog.info('Connection attempt {} of {}.'.format(
+                        backoff.attempt,
+                        request_attempts,
+                    ))
+                else:
+                    raise e
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # ConnectionErrors should always be retried.
+                error, should_retry = _parse_client_error(e)
+                if breaker is not None and pending:
+                    breaker.record(base_url, error)
+                dttracing.end_span(span, error=error)
+
+                # Print the error and try again as allowed by the policy.
+                sleeptime = backoff.next_sleep() if should_retry else None
+                if sleeptime is not None:
+                    dtlog.warning('Reconnecting in {:.1f}s.'.format(
+                        sleeptime,
+                    ))
+                    if hooks:
+                        dtinstrumentation.emit(
+                            hooks, 'on_retry',
+                            method='GET',
+                            endpoint=endpoint,
+                            attempt=backoff.attempt,
+                            sleeptime=sleeptime,
+                            error=error,
+                        )
+                    await asyncio.sleep(sleeptime)
+
+                    dtlog.info('Connection attempt {} of {}.'.format(
+                        backoff.attempt,
+                        request_attempts,
+                    ))
+
+                else:
+                    raise error from e
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import Optional, Any
+
+import disruptive.aio.requests as dtaiorequests
+from disruptive.resources.claim import Claim as _Claim
+
+
+class Claim():
+    """
+    Awaitable versions of the :ref:`Claim <claim>` methods.
+    Returns the same output types as their blocking counterparts.
+
+    """
+
+    @staticmethod
+    async def claim_info(identifier: str,
+                         organization_id: Optional[str] = None,
+                         **kwargs: Any,
+                         ) -> _Claim:
+        """
+        Gets claiming information for a device or kit.
+        See :meth:`disruptive.Claim.claim_info`.
+
+        """
+
+        if not isinstance(identifier, str):
+            raise TypeError(f'Identifier must be str, got {type(identifier)}.')
+
+        url = f'/claimInfo?identifier={identifier}'
+
+        # Add organization resource name to url if provided.
+        if organization_id is not None:
+            url += f'&organization=organizations/{organization_id}'
+
+        return _Claim(await dtaiorequests.AsyncDTRequest.get(url, **kwargs))
+
+    @staticmethod
+    async def claim(target_project_id: str,
+                    kit_ids: Optional[list[str]] = None,
+                    device_ids: Optional[list[str]] = None,
+                    dry_run: bool = True,
+                    **kwargs: Any,
+                    ) -> tuple[list[_Claim.ClaimDevice], list[Exception]]:
+        """
+        Claim one or more devices and kits into a project.
+        See :meth:`disruptive.Claim.claim`.
+
+        """
+
+        url = f'/projects/{target_project_id}/devices:claim'
+        url += f'?dryRun={str(dry_run).lower()}'
+
+        body = {}
+        if kit_ids is not None:
+            body['kitIds'] = kit_ids
+        if device_ids is not None:
+            body['deviceIds'] = device_ids
+
+        res = await dtaiorequests.AsyncDTRequest.post(
+            url, body=body, **kwargs,
+        )
+
+        return (
+            [_Claim.ClaimDevice(d) for d in res['claimedDevices']],
+            _Claim._parse_claim_errors(res['claimErrors']),
+        )
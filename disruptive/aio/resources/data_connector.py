@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from typing import Optional, Any
+
+import disruptive.aio.requests as dtaiorequests
+from disruptive.resources.data_connector import (
+    DataConnector as _DataConnector,
+    Metric,
+)
+
+
+class DataConnector():
+    """
+    Awaitable versions of the :ref:`Data Connector <dataconnector>` methods.
+    Returns the same output types as their blocking counterparts.
+
+    """
+
+    @staticmethod
+    async def get_data_connector(data_connector_id: str,
+                                 project_id: str,
+                                 **kwargs: Any,
+                                 ) -> _DataConnector:
+        """
+        Gets the current state of a single Data Connector.
+        See :meth:`disruptive.DataConnector.get_data_connector`.
+
+        """
+
+        url = '/projects/{}/dataconnectors/{}'
+        url = url.format(project_id, data_connector_id)
+
+        # Return DataConnector object of GET request response.
+        return _DataConnector(await dtaiorequests.AsyncDTRequest.get(
+            url=url,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def list_data_connectors(project_id: str,
+                                   **kwargs: Any,
+                                   ) -> list[_DataConnector]:
+        """
+        List all available Data Connectors in the specified project.
+        See :meth:`disruptive.DataConnector.list_data_connectors`.
+
+        """
+
+        data_connectors = await dtaiorequests.AsyncDTRequest.paginated_get(
+            url='/projects/{}/dataconnectors'.format(project_id),
+            pagination_key='dataConnectors',
+            **kwargs,
+        )
+        return [_DataConnector(dcon) for dcon in data_connectors]
+
+    @staticmethod
+    async def create_data_connector(
+        project_id: str,
+        config: _DataConnector.HttpPushConfig,
+        display_name: str = '',
+        status: str = 'ACTIVE',
+        event_types: list[str] = [],
+        labels: list[str] = [],
+        **kwargs: Any,
+    ) -> _DataConnector:
+        """
+        Creates a new Data Connector in the specified project.
+        See :meth:`disruptive.DataConnector.create_data_connector`.
+
+        """
+
+        body: dict = dict()
+        body['status'] = status
+        body['events'] = event_types
+        body['labels'] = labels
+        if len(display_name) > 0:
+            body['displayName'] = display_name
+
+        # Add the appropriate field depending on config.
+        body['type'] = config.data_connector_type
+        key, value = config._to_dict()
+        body[key] = value
+
+        # Return DataConnector object of POST request response.
+        return _DataConnector(await dtaiorequests.AsyncDTRequest.post(
+            url='/projects/{}/dataconnectors'.format(project_id),
+            body=body,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def update_data_connector(
+        data_connector_id: str,
+        project_id: str,
+        config: Optional[_DataConnector.HttpPushConfig] = None,
+        display_name: Optional[str] = None,
+        status: Optional[str] = None,
+        event_types: Optional[list[str]] = None,
+        labels: Optional[list[str]] = None,
+        **kwargs: Any,
+    ) -> _DataConnector:
+        """
+        Updates the attributes of a specified Data Connector.
+        See :meth:`disruptive.DataConnector.update_data_connector`.
+
+        """
+
+        body: dict = dict()
+        if display_name is not None:
+            body['displayName'] = display_name
+        if status is not None:
+            body['status'] = status
+        if event_types is not None:
+            body['events'] = event_types
+        if labels is not None:
+            body['labels'] = labels
+
+        # Add the appropriate field depending on config.
+        if config is not None:
+            key, value = config._to_dict()
+            body[key] = value
+
+        # Construct URL.
+        url = '/projects/{}/dataconnectors/{}'
+        url = url.format(project_id, data_connector_id)
+
+        # Return DataConnector object of PATCH request response.
+        return _DataConnector(await dtaiorequests.AsyncDTRequest.patch(
+            url=url,
+            body=body,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def delete_data_connector(data_connector_id: str,
+                                    project_id: str,
+                                    **kwargs: Any,
+                                    ) -> None:
+        """
+        Deletes the specified Data Connector.
+        See :meth:`disruptive.DataConnector.delete_data_connector`.
+
+        """
+
+        url = '/projects/{}/dataconnectors/{}'
+        url = url.format(project_id, data_connector_id)
+
+        # Send DELETE request, but return nothing.
+        await dtaiorequests.AsyncDTRequest.delete(url=url, **kwargs)
+
+    @staticmethod
+    async def get_metrics(data_connector_id: str,
+                          project_id: str,
+                          **kwargs: Any,
+                          ) -> Metric:
+        """
+        Get the metrics of the last 3 hours for a Data Connector.
+        See :meth:`disruptive.DataConnector.get_metrics`.
+
+        """
+
+        url = '/projects/{}/dataconnectors/{}'
+        url = url.format(project_id, data_connector_id)
+        url += ':metrics'
+
+        # Return Metric object of GET request response.
+        return Metric(await dtaiorequests.AsyncDTRequest.get(
+            url=url,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def sync_data_connector(data_connector_id: str,
+                                  project_id: str,
+                                  **kwargs: Any,
+                                  ) -> None:
+        """
+        Synchronizes the current Data Connector state.
+        See :meth:`disruptive.DataConnector.sync_data_connector`.
+
+        """
+
+        url = '/projects/{}/dataconnectors/{}'
+        url = url.format(project_id, data_connector_id)
+        url += ':sync'
+
+        # Send POST request, but return nothing.
+        await dtaiorequests.AsyncDTRequest.post(url=url, **kwargs)
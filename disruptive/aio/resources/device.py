@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from typing import Optional, Any
+
+import disruptive.aio.requests as dtaiorequests
+from disruptive.resources.device import Device as _Device
+from disruptive.errors import TransferDeviceError, LabelUpdateError
+
+
+class Device():
+    """
+    Awaitable versions of the :ref:`Device <device>` methods.
+    Returns the same output types as their blocking counterparts.
+
+    """
+
+    @staticmethod
+    async def get_device(device_id: str,
+                         project_id: Optional[str] = None,
+                         **kwargs: Any,
+                         ) -> _Device:
+        """
+        Gets the current state of a single device.
+        See :meth:`disruptive.Device.get_device`.
+
+        """
+
+        # If project_id is not given, use wildcard "-".
+        if project_id is None:
+            project_id = '-'
+
+        # Construct URL
+        url = '/projects/{}/devices/{}'.format(project_id, device_id)
+
+        # Return Device object of GET request response.
+        return _Device(await dtaiorequests.AsyncDTRequest.get(url, **kwargs))
+
+    @staticmethod
+    async def list_devices(project_id: str,
+                           query: Optional[str] = None,
+                           device_ids: Optional[list[str]] = None,
+                           device_types: Optional[list[str]] = None,
+                           label_filters: Optional[dict[str, str]] = None,
+                           order_by: Optional[str] = None,
+                           **kwargs: Any,
+                           ) -> list[_Device]:
+        """
+        Gets a list of the current state of all devices in a project.
+        See :meth:`disruptive.Device.list_devices`.
+
+        """
+
+        # Construct parameters dictionary.
+        params: dict = dict()
+        if query is not None:
+            params['query'] = query
+        if device_ids is not None:
+            params['device_ids'] = device_ids
+        if device_types is not None:
+            params['device_types'] = device_types
+        if order_by is not None:
+            params['order_by'] = order_by
+
+        # Convert label_filters dictionary to list of strings.
+        if label_filters is not None:
+            labels_list = []
+            for key in label_filters:
+                labels_list.append(key + '=' + label_filters[key])
+            params['label_filters'] = labels_list
+
+        # Return list of Device objects of paginated GET response.
+        devices = await dtaiorequests.AsyncDTRequest.paginated_get(
+            url='/projects/{}/devices'.format(project_id),
+            pagination_key='devices',
+            params=params,
+            **kwargs,
+        )
+        return [_Device(device) for device in devices]
+
+    @staticmethod
+    async def transfer_devices(device_ids: list[str],
+                               source_project_id: str,
+                               target_project_id: str,
+                               **kwargs: Any,
+                               ) -> list[TransferDeviceError]:
+        """
+        Transfers all specified devices to the target project.
+        See :meth:`disruptive.Device.transfer_devices`.
+
+        """
+
+        # Construct list of devices.
+        name = 'projects/{}/devices/{}'
+        devices = [name.format(source_project_id, xid) for xid in device_ids]
+
+        # Sent POST request.
+        response = await dtaiorequests.AsyncDTRequest.post(
+            url='/projects/{}/devices:transfer'.format(
+                target_project_id
+            ),
+            body={'devices': devices},
+            **kwargs,
+        )
+
+        # Return any transferErrors found in response.
+        return [TransferDeviceError(err) for err in response['transferErrors']]
+
+    @staticmethod
+    async def set_label(device_id: str,
+                        project_id: str,
+                        key: str,
+                        value: str,
+                        **kwargs: Any,
+                        ) -> list[LabelUpdateError]:
+        """
+        Set a label key and value for a single device.
+        See :meth:`disruptive.Device.set_label`.
+
+        """
+
+        return await Device.batch_update_labels(
+            device_ids=[device_id],
+            project_id=project_id,
+            set_labels={key: value},
+            **kwargs,
+        )
+
+    @staticmethod
+    async def remove_label(device_id: str,
+                           project_id: str,
+                           key: str,
+                           **kwargs: Any,
+                           ) -> list[LabelUpdateError]:
+        """
+        Remove a label (key and value) from a single device.
+        See :meth:`disruptive.Device.remove_label`.
+
+        """
+
+        return await Device.batch_update_labels(
+            device_ids=[device_id],
+            project_id=project_id,
+            remove_labels=[key],
+            **kwargs,
+        )
+
+    @staticmethod
+    async def batch_update_labels(device_ids: list[str],
+                                  project_id: str,
+                                  set_labels: Optional[dict[str, str]] = None,
+                                  remove_labels: Optional[list[str]] = None,
+                                  **kwargs: Any,
+                                  ) -> list[LabelUpdateError]:
+        """
+        Add, update, or remove multiple labels on multiple devices.
+        See :meth:`disruptive.Device.batch_update_labels`.
+
+        """
+
+        # Construct list of devices.
+        name = 'projects/{}/devices/{}'
+        devices = [name.format(project_id, xid) for xid in device_ids]
+
+        # Construct request body dictionary.
+        body: dict = dict()
+        body['devices'] = devices
+        if set_labels is not None:
+            body['addLabels'] = set_labels
+        if remove_labels is not None:
+            body['removeLabels'] = remove_labels
+
+        # Construct URL.
+        url = '/projects/{}/devices:batchUpdate'.format(project_id)
+
+        # Sent POST request.
+        response = await dtaiorequests.AsyncDTRequest.post(
+            url, body=body, **kwargs,
+        )
+
+        # Return any batchErrors found in response.
+        return [LabelUpdateError(err) for err in response['batchErrors']]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import Optional, Any
+
+import disruptive
+import disruptive.aio.requests as dtaiorequests
+from disruptive.resources.device import Device
+
+
+class Emulator():
+    """
+    Awaitable versions of the :ref:`Emulator <emulator>` methods.
+    Returns the same output types as their blocking counterparts.
+
+    """
+
+    @staticmethod
+    async def create_device(project_id: str,
+                            device_type: str,
+                            display_name: Optional[str] = None,
+                            labels: dict[str, str] = {},
+                            **kwargs: Any,
+                            ) -> Device:
+        """
+        Create a new emulated device with specified type and labels.
+        See :meth:`disruptive.Emulator.create_device`.
+
+        """
+
+        # Construct body dictionary, copying labels to leave input as is.
+        body: dict = dict()
+        body['type'] = device_type
+        body['labels'] = dict(labels)
+
+        # Add display_name to labels dictionary in body.
+        if display_name is not None:
+            body['labels']['name'] = display_name
+
+        # Return Device object of POST request response.
+        return Device(await dtaiorequests.AsyncDTRequest.post(
+            url='/projects/{}/devices'.format(project_id),
+            base_url=disruptive.emulator_base_url,
+            body=body,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def delete_device(device_id: str,
+                            project_id: str,
+                            **kwargs: Any,
+                            ) -> None:
+        """
+        Deletes the specified emulated device.
+        See :meth:`disruptive.Emulator.delete_device`.
+
+        """
+
+        # Send DELETE request, but return nothing.
+        await dtaiorequests.AsyncDTRequest.delete(
+            url='/projects/{}/devices/{}'.format(project_id, device_id),
+            base_url=disruptive.emulator_base_url,
+            **kwargs,
+        )
+
+    @staticmethod
+    async def publish_event(device_id: str,
+                            project_id: str,
+                            data: disruptive.events.Touch |
+                            disruptive.events.Temperature |
+                            disruptive.events.ObjectPresent |
+                            disruptive.events.Humidity |
+                            disruptive.events.ObjectPresentCount |
+                            disruptive.events.TouchCount |
+                            disruptive.events.WaterPresent |
+                            disruptive.events.NetworkStatus |
+                            disruptive.events.BatteryStatus |
+                            disruptive.events.ConnectionStatus |
+                            disruptive.events.EthernetStatus |
+                            disruptive.events.CellularStatus |
+                            disruptive.events.Co2 |
+                            disruptive.events.Pressure |
+                            disruptive.events.Motion |
+                            disruptive.events.DeskOccupancy |
+                            disruptive.events.Contact |
+                            disruptive.events.ProbeWireStatus,
+                            **kwargs: Any,
+                            ) -> None:
+        """
+        From the specified device, publish an event of the given type.
+        See :meth:`disruptive.Emulator.publish_event`.
+
+        """
+
+        url = '/projects/{}/devices/{}:publish'.format(project_id, device_id)
+
+        # Send POST request, but return nothing.
+        await dtaiorequests.AsyncDTRequest.post(
+            url=url,
+            base_url=disruptive.emulator_base_url,
+            body={data.event_type: data._raw},
+            **kwargs,
+        )
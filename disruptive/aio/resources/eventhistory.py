@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Optional, Any
+from datetime import datetime
+
+import disruptive.aio.requests as dtaiorequests
+import disruptive.transforms as dttrans
+from disruptive.events.events import Event
+from disruptive.resources.eventhistory import EventHistory as _EventHistory
+
+
+class EventHistory():
+    """
+    Awaitable versions of the :ref:`EventHistory <eventhistory>` methods.
+    Returns the same output types as their blocking counterparts.
+
+    """
+
+    @staticmethod
+    async def list_events(device_id: str,
+                          project_id: str,
+                          event_types: Optional[list[str]] = None,
+                          start_time: Optional[str | datetime] = None,
+                          end_time: Optional[str | datetime] = None,
+                          **kwargs: Any,
+                          ) -> _EventHistory:
+        """
+        Get the event history for a single device.
+        See :meth:`disruptive.EventHistory.list_events`.
+
+        """
+
+        # Construct URL.
+        url = '/projects/{}/devices/{}/events'.format(project_id, device_id)
+
+        # Construct parameters dictionary.
+        params: dict = dict()
+        if event_types is not None:
+            params['eventTypes'] = event_types
+
+        # Sanitize timestamps as they must be iso8601 format.
+        start_time_iso8601 = dttrans.to_iso8601(start_time)
+        if start_time_iso8601 is not None:
+            params['startTime'] = start_time_iso8601
+        end_time_iso8601 = dttrans.to_iso8601(end_time)
+        if end_time_iso8601 is not None:
+            params['endTime'] = end_time_iso8601
+
+        # Send paginated GET request.
+        res = await dtaiorequests.AsyncDTRequest.paginated_get(
+            url=url,
+            pagination_key='events',
+            params=params,
+            **kwargs,
+        )
+
+        # Return list of Event objects of paginated GET response.
+        return _EventHistory(Event.from_mixed_list(res))
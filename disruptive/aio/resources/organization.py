@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from typing import Any
+
+import disruptive.aio.requests as dtaiorequests
+from disruptive.outputs import Member
+from disruptive.resources.organization import Organization as _Organization
+
+
+class Organization():
+    """
+    Awaitable versions of the :ref:`Organization <organization>` methods.
+    Returns the same output types as their blocking counterparts.
+
+    """
+
+    @staticmethod
+    async def get_organization(organization_id: str,
+                               **kwargs: Any,
+                               ) -> _Organization:
+        """
+        Gets an organization specified by its ID.
+        See :meth:`disruptive.Organization.get_organization`.
+
+        """
+
+        # Return Organization object of GET request response.
+        return _Organization(await dtaiorequests.AsyncDTRequest.get(
+            url='/organizations/{}'.format(organization_id),
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def list_organizations(**kwargs: Any) -> list[_Organization]:
+        """
+        Gets a list of all available organizations.
+        See :meth:`disruptive.Organization.list_organizations`.
+
+        """
+
+        orgs = await dtaiorequests.AsyncDTRequest.paginated_get(
+            url='/organizations',
+            pagination_key='organizations',
+            **kwargs,
+        )
+        return [_Organization(org) for org in orgs]
+
+    @staticmethod
+    async def list_members(organization_id: str,
+                           **kwargs: Any,
+                           ) -> list[Member]:
+        """
+        Gets a list of all members in an organization.
+        See :meth:`disruptive.Organization.list_members`.
+
+        """
+
+        # Return list of Member objects of paginated GET response.
+        members = await dtaiorequests.AsyncDTRequest.paginated_get(
+            url='/organizations/{}/members'.format(organization_id),
+            pagination_key='members',
+            **kwargs,
+        )
+        return [Member(m) for m in members]
+
+    @staticmethod
+    async def add_member(organization_id: str,
+                         email: str,
+                         roles: list[str],
+                         **kwargs: Any,
+                         ) -> Member:
+        """
+        Add a new member to the specified organization.
+        See :meth:`disruptive.Organization.add_member`.
+
+        """
+
+        # Construct request body.
+        body: dict = dict()
+        body['roles'] = ['roles/' + r for r in roles]
+        body['email'] = email
+
+        # Return Member object of POST request response.
+        return Member(await dtaiorequests.AsyncDTRequest.post(
+            url='/organizations/{}/members'.format(organization_id),
+            body=body,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def get_member(member_id: str,
+                         organization_id: str,
+                         **kwargs: Any,
+                         ) -> Member:
+        """
+        Get a member from the specified organization.
+        See :meth:`disruptive.Organization.get_member`.
+
+        """
+
+        # Return Member object of GET request response.
+        return Member(await dtaiorequests.AsyncDTRequest.get(
+            url='/organizations/{}/members/{}'.format(
+                organization_id,
+                member_id,
+            ),
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def remove_member(member_id: str,
+                            organization_id: str,
+                            **kwargs: Any,
+                            ) -> None:
+        """
+        Revoke a member's membership in the specified organization.
+        See :meth:`disruptive.Organization.remove_member`.
+
+        """
+
+        # Send DELETE request, but return nothing.
+        await dtaiorequests.AsyncDTRequest.delete(
+            url='/organizations/{}/members/{}'.format(
+                organization_id,
+                member_id,
+            ),
+            **kwargs,
+        )
+
+    @staticmethod
+    async def get_member_invite_url(member_id: str,
+                                    organization_id: str,
+                                    **kwargs: Any,
+                                    ) -> str:
+        """
+        Get the invite URL for a member with pending invite.
+        See :meth:`disruptive.Organization.get_member_invite_url`.
+
+        """
+
+        url = '/organizations/{}/members/{}'.format(
+            organization_id,
+            member_id,
+        ) + ':getInviteUrl'
+
+        # Return url string in GET response.
+        response = await dtaiorequests.AsyncDTRequest.get(url=url, **kwargs)
+        invite_url: str = response['inviteUrl']
+        return invite_url
+
+    @staticmethod
+    async def list_permissions(organization_id: str,
+                               **kwargs: Any,
+                               ) -> list[str]:
+        """
+        List permissions available to the caller in an organization.
+        See :meth:`disruptive.Organization.list_permissions`.
+
+        """
+
+        # Return list of permissions in GET response.
+        permissions: list[str] = \
+            await dtaiorequests.AsyncDTRequest.paginated_get(
+                url='/organizations/{}/permissions'.format(organization_id),
+                pagination_key='permissions',
+                **kwargs,
+            )
+        return permissions
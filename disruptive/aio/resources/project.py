@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+from typing import Optional, Any
+
+import disruptive.aio.requests as dtaiorequests
+from disruptive.outputs import Member
+from disruptive.resources.project import Project as _Project
+
+
+class Project():
+    """
+    Awaitable versions of the :ref:`Project <project>` methods.
+    Returns the same output types as their blocking counterparts.
+
+    """
+
+    @staticmethod
+    async def get_project(project_id: str, **kwargs: Any) -> _Project:
+        """
+        Gets a project specified by its ID.
+        See :meth:`disruptive.Project.get_project`.
+
+        """
+
+        url = '/projects/{}'.format(project_id)
+
+        # Return Project object of GET request response.
+        return _Project(await dtaiorequests.AsyncDTRequest.get(
+            url=url,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def list_projects(organization_id: Optional[str] = None,
+                            query: Optional[str] = None,
+                            **kwargs: Any,
+                            ) -> list[_Project]:
+        """
+        Gets a list of all available projects.
+        See :meth:`disruptive.Project.list_projects`.
+
+        """
+
+        # Construct parameters dictionary.
+        params = {}
+        if organization_id is not None:
+            params['organization'] = 'organizations/' + organization_id
+        if query is not None:
+            params['query'] = query
+
+        # Return list of Project objects of paginated GET response.
+        responses = await dtaiorequests.AsyncDTRequest.paginated_get(
+            url='/projects',
+            pagination_key='projects',
+            params=params,
+            **kwargs,
+        )
+        return [_Project(r) for r in responses]
+
+    @staticmethod
+    async def create_project(organization_id: str,
+                             display_name: str,
+                             **kwargs: Any,
+                             ) -> _Project:
+        """
+        Create a new project in an organization.
+        See :meth:`disruptive.Project.create_project`.
+
+        """
+
+        # Construct request body.
+        body: dict = dict()
+        body['organization'] = 'organizations/' + organization_id
+        body['displayName'] = display_name
+
+        # Return Project object of POST request response.
+        return _Project(await dtaiorequests.AsyncDTRequest.post(
+            url='/projects',
+            body=body,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def update_project(project_id: str,
+                             display_name: Optional[str] = None,
+                             **kwargs: Any,
+                             ) -> None:
+        """
+        Updates the display name a specified project.
+        See :meth:`disruptive.Project.update_project`.
+
+        """
+
+        # Construct request body.
+        body = {}
+        if display_name is not None:
+            body['displayName'] = display_name
+
+        # Send PATCH request, but return nothing.
+        await dtaiorequests.AsyncDTRequest.patch(
+            url='/projects/' + project_id,
+            body=body,
+            **kwargs,
+        )
+
+    @staticmethod
+    async def delete_project(project_id: str, **kwargs: Any) -> None:
+        """
+        Deletes a specified project.
+        See :meth:`disruptive.Project.delete_project`.
+
+        """
+
+        # Send DELETE request, but return nothing.
+        await dtaiorequests.AsyncDTRequest.delete(
+            url='/projects/' + project_id,
+            **kwargs,
+        )
+
+    @staticmethod
+    async def list_members(project_id: str, **kwargs: Any) -> list[Member]:
+        """
+        Gets all members in a project.
+        See :meth:`disruptive.Project.list_members`.
+
+        """
+
+        # Return list of Member objects of paginated GET response.
+        members = await dtaiorequests.AsyncDTRequest.paginated_get(
+            url='/projects/{}/members'.format(project_id),
+            pagination_key='members',
+            **kwargs,
+        )
+        return [Member(m) for m in members]
+
+    @staticmethod
+    async def add_member(project_id: str,
+                         email: str,
+                         roles: list[str],
+                         **kwargs: Any,
+                         ) -> Member:
+        """
+        Add a new member to a project.
+        See :meth:`disruptive.Project.add_member`.
+
+        """
+
+        # Construct request body.
+        body: dict = dict()
+        body['roles'] = ['roles/' + r for r in roles]
+        body['email'] = email
+
+        # Return Member object of POST request response.
+        return Member(await dtaiorequests.AsyncDTRequest.post(
+            url='/projects/{}/members'.format(project_id),
+            body=body,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def get_member(member_id: str,
+                         project_id: str,
+                         **kwargs: Any,
+                         ) -> Member:
+        """
+        Get a member from a project.
+        See :meth:`disruptive.Project.get_member`.
+
+        """
+
+        # Return Member object of GET request response.
+        return Member(await dtaiorequests.AsyncDTRequest.get(
+            url='/projects/{}/members/{}'.format(project_id, member_id),
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def update_member(member_id: str,
+                            project_id: str,
+                            roles: list[str],
+                            **kwargs: Any,
+                            ) -> Member:
+        """
+        Update the role(s) of a member in a project.
+        See :meth:`disruptive.Project.update_member`.
+
+        """
+
+        # Construct request body.
+        body: dict = dict()
+        if roles is not None:
+            body['roles'] = ['roles/' + r for r in roles]
+
+        # Return updated Member object of PATCH request response.
+        return Member(await dtaiorequests.AsyncDTRequest.patch(
+            url='/projects/{}/members/{}'.format(project_id, member_id),
+            body=body,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def remove_member(member_id: str,
+                            project_id: str,
+                            **kwargs: Any,
+                            ) -> None:
+        """
+        Revoke a member's membership in a project.
+        See :meth:`disruptive.Project.remove_member`.
+
+        """
+
+        # Send DELETE request, but return nothing.
+        await dtaiorequests.AsyncDTRequest.delete(
+            url='/projects/{}/members/{}'.format(project_id, member_id),
+            **kwargs,
+        )
+
+    @staticmethod
+    async def get_member_invite_url(member_id: str,
+                                    project_id: str,
+                                    **kwargs: Any,
+                                    ) -> str:
+        """
+        Get the invite URL for a member with pending invite.
+        See :meth:`disruptive.Project.get_member_invite_url`.
+
+        """
+
+        url = '/projects/{}/members/{}'.format(
+            project_id,
+            member_id,
+        ) + ':getInviteUrl'
+
+        # Return url string in GET response.
+        response = await dtaiorequests.AsyncDTRequest.get(url=url, **kwargs)
+        invite_url: str = response['inviteUrl']
+        return invite_url
+
+    @staticmethod
+    async def list_permissions(project_id: str, **kwargs: Any) -> list[str]:
+        """
+        List permissions available to the caller in a project.
+        See :meth:`disruptive.Project.list_permissions`.
+
+        """
+
+        # Return list of permissions in GET response.
+        permissions: list[str] = \
+            await dtaiorequests.AsyncDTRequest.paginated_get(
+                url='/projects/{}/permissions'.format(project_id),
+                pagination_key='permissions',
+                **kwargs,
+            )
+        return permissions
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Any
+
+import disruptive.aio.requests as dtaiorequests
+from disruptive.resources.role import Role as _Role
+
+
+class Role():
+    """
+    Awaitable versions of the :ref:`Role <role>` methods.
+    Returns the same output types as their blocking counterparts.
+
+    """
+
+    @staticmethod
+    async def get_role(role: str, **kwargs: Any) -> _Role:
+        """
+        Gets a role specified by its name.
+        See :meth:`disruptive.Role.get_role`.
+
+        """
+
+        return _Role(await dtaiorequests.AsyncDTRequest.get(
+            url='/roles/' + role,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def list_roles(**kwargs: Any) -> list[_Role]:
+        """
+        Gets a list of all available roles.
+        See :meth:`disruptive.Role.list_roles`.
+
+        """
+
+        response = await dtaiorequests.AsyncDTRequest.paginated_get(
+            url='/roles',
+            pagination_key='roles',
+            **kwargs,
+        )
+        return [_Role(r) for r in response]
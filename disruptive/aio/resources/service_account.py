@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from typing import Optional, Any
+
+import disruptive.aio.requests as dtaiorequests
+from disruptive.resources.service_account import (
+    ServiceAccount as _ServiceAccount,
+    Key,
+)
+
+
+class ServiceAccount():
+    """
+    Awaitable versions of the :ref:`ServiceAccount <serviceaccount>` methods.
+    Returns the same output types as their blocking counterparts.
+
+    """
+
+    @staticmethod
+    async def get_service_account(service_account_id: str,
+                                  project_id: str,
+                                  **kwargs: Any,
+                                  ) -> _ServiceAccount:
+        """
+        Gets a Service Account specified by its ID.
+        See :meth:`disruptive.ServiceAccount.get_service_account`.
+
+        """
+
+        url = '/projects/{}/serviceaccounts/{}'.format(
+            project_id,
+            service_account_id,
+        )
+
+        # Return ServiceAccount object of GET request response.
+        return _ServiceAccount(await dtaiorequests.AsyncDTRequest.get(
+            url=url,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def list_service_accounts(project_id: str,
+                                    **kwargs: Any,
+                                    ) -> list[_ServiceAccount]:
+        """
+        Gets a list of all Service Accounts in a project.
+        See :meth:`disruptive.ServiceAccount.list_service_accounts`.
+
+        """
+
+        # Return list of ServiceAccount objects of paginated GET response.
+        service_accounts = await dtaiorequests.AsyncDTRequest.paginated_get(
+            url='/projects/{}/serviceaccounts'.format(project_id),
+            pagination_key='serviceAccounts',
+            **kwargs,
+        )
+        return [_ServiceAccount(sa) for sa in service_accounts]
+
+    @staticmethod
+    async def create_service_account(project_id: str,
+                                     display_name: str = '',
+                                     basic_auth_enabled: bool = False,
+                                     **kwargs: Any,
+                                     ) -> _ServiceAccount:
+        """
+        Create a new Service Account in the specified project.
+        See :meth:`disruptive.ServiceAccount.create_service_account`.
+
+        """
+
+        # Construct body.
+        body: dict = dict()
+        body['enableBasicAuth'] = basic_auth_enabled
+        if len(display_name) > 0:
+            body['displayName'] = display_name
+
+        # Return ServiceAccount object of POST request response.
+        return _ServiceAccount(await dtaiorequests.AsyncDTRequest.post(
+            url='/projects/{}/serviceaccounts'.format(project_id),
+            body=body,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def update_service_account(service_account_id: str,
+                                     project_id: str,
+                                     display_name: Optional[str] = None,
+                                     basic_auth_enabled: Optional[bool] = None,
+                                     **kwargs: Any,
+                                     ) -> _ServiceAccount:
+        """
+        Updates the attributes of a specified Service Account.
+        See :meth:`disruptive.ServiceAccount.update_service_account`.
+
+        """
+
+        url = '/projects/{}/serviceaccounts/{}'.format(
+            project_id,
+            service_account_id,
+        )
+
+        # Construct body.
+        body: dict = dict()
+        if display_name is not None:
+            body['displayName'] = display_name
+        if basic_auth_enabled is not None:
+            body['enableBasicAuth'] = basic_auth_enabled
+
+        # Return ServiceAccount object of PATCH request response.
+        return _ServiceAccount(await dtaiorequests.AsyncDTRequest.patch(
+            url=url,
+            body=body,
+            **kwargs,
+        ))
+
+    @staticmethod
+    async def delete_service_account(service_account_id: str,
+                                     project_id: str,
+                                     **kwargs: Any,
+                                     ) -> None:
+        """
+        Deletes the specified Service Account.
+        See :meth:`disruptive.ServiceAccount.delete_service_account`.
+
+        """
+
+        url = '/projects/{}/serviceaccounts/{}'.format(
+            project_id,
+            service_account_id,
+        )
+
+        # Send DELETE request, but return nothing.
+        await dtaiorequests.AsyncDTRequest.delete(url=url, **kwargs)
+
+    @staticmethod
+    async def get_key(key_id: str,
+                      service_account_id: str,
+                      project_id: str,
+                      **kwargs: Any,
+                      ) -> Key:
+        """
+        Get the key of a Service Account.
+        See :meth:`disruptive.ServiceAccount.get_key`.
+
+        """
+
+        url = '/projects/{}/serviceaccounts/{}/keys/{}'.format(
+            project_id,
+            service_account_id,
+            key_id,
+        )
+
+        # Return Key object of GET request response.
+        return Key(await dtaiorequests.AsyncDTRequest.get(url=url, **kwargs))
+
+    @staticmethod
+    async def list_keys(service_account_id: str,
+                        project_id: str,
+                        **kwargs: Any,
+                        ) -> list[Key]:
+        """
+        Gets a list of all keys for a Service Account.
+        See :meth:`disruptive.ServiceAccount.list_keys`.
+
+        """
+
+        url = '/projects/{}/serviceaccounts/{}/keys'.format(
+            project_id,
+            service_account_id,
+        )
+
+        # Return list of Key objects of paginated GET response.
+        keys = await dtaiorequests.AsyncDTRequest.paginated_get(
+            url=url,
+            pagination_key='keys',
+            **kwargs,
+        )
+        return [Key(key) for key in keys]
+
+    @staticmethod
+    async def create_key(service_account_id: str,
+                         project_id: str,
+                         **kwargs: Any,
+                         ) -> Key:
+        """
+        Create a new key for the specified Service Account.
+        See :meth:`disruptive.ServiceAccount.create_key`.
+
+        """
+
+        url = '/projects/{}/serviceaccounts/{}/keys'.format(
+            project_id,
+            service_account_id,
+        )
+
+        # Return Key object of POST request response.
+        response = await dtaiorequests.AsyncDTRequest.post(url=url, **kwargs)
+        return Key._with_secret(response)
+
+    @staticmethod
+    async def delete_key(key_id: str,
+                         service_account_id: str,
+                         project_id: str,
+                         **kwargs: Any,
+                         ) -> None:
+        """
+        Deletes a key in the specified Service Account.
+        See :meth:`disruptive.ServiceAccount.delete_key`.
+
+        """
+
+        url = '/projects/{}/serviceaccounts/{}/keys/{}'.format(
+            project_id,
+            service_account_id,
+            key_id,
+        )
+
+        # Send DELETE request, but return nothing.
+        await dtaiorequests.AsyncDTRequest.delete(url=url, **kwargs)
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import sys
+import time
+import asyncio
+import threading
+from typing import AsyncGenerator, Generator, Optional, Any
+
+import disruptive as dt
+import disruptive.errors as dterrors
+import disruptive.logging as dtlog
+import disruptive.retry as dtretry
+import disruptive.aio.requests as dtaiorequests
+from disruptive.events.events import Event
+from disruptive.resources.stream import Stream as _Stream
+
+# Restarts of a multiplexed stream are not limited in number.
+_UNLIMITED = sys.maxsize
+
+
+class Stream():
+    """
+    Awaitable versions of the :ref:`Stream <stream>` methods.
+    Returns the same output types as their blocking counterparts.
+
+    """
+
+    @staticmethod
+    async def event_stream(project_id: str,
+                           device_ids: Optional[list[str]] = None,
+                           label_filters: Optional[dict] = None,
+                           device_types: Optional[list[str]] = None,
+                           event_types: Optional[list[str]] = None,
+                           **kwargs: Any,
+                           ) -> AsyncGenerator:
+        """
+        Stream events for one, multiple, or all device(s) in a project.
+        See :meth:`disruptive.Stream.event_stream`.
+
+        Examples
+        --------
+        >>> async for event in dt.aio.Stream.event_stream('<PROJECT_ID>'):
+        ...     print(event)
+
+        """
+
+        # Construct parameters dictionary.
+        params = _Stream._stream_params(
+            device_ids, label_filters, device_types, event_types,
+        )
+
+        # Relay generator output.
+        url = '/projects/{}/devices:stream'.format(project_id)
+        async for event in dtaiorequests.AsyncDTRequest.stream(
+            url, params=params, **kwargs,
+        ):
+            yield Event(event)
+
+
+class StreamHealth():
+    """
+    Health statistics of a single project stream in a
+    :class:`StreamMultiplexer`.
+
+    Attributes
+    ----------
+    project_id : str
+        Unique ID of the streamed project.
+    events_received : int
+        Number of events received, not counting pings.
+    reconnects : int
+        Number of times the stream has been restarted after
+        exhausting its request attempts.
+    last_message_time : float, None
+        Unix time of the last event or ping received.
+    last_error : Exception, None
+        The last error that stopped the stream.
+    failed : bool
+        True if the stream has stopped for good, for instance
+        due to missing permissions.
+
+    """
+
+    def __init__(self, project_id: str) -> None:
+        self.project_id = project_id
+        self.events_received = 0
+        self.reconnects = 0
+        self.last_message_time: Optional[float] = None
+        self.last_error: Optional[Exception] = None
+        self.failed = False
+
+    def __repr__(self) -> str:
+        return '{}.{}({})'.format(
+            self.__class__.__module__,
+            self.__class__.__name__,
+            ', '.join('{}={}'.format(k, repr(v))
+                      for k, v in vars(self).items()),
+        )
+
+
+class StreamMultiplexer():
+    """
+    Streams events from many projects, merged into a single iterator.
+
+    All streams run as tasks on a single event loop, sharing the same
+    authentication routine and connection pool. Events are buffered in a
+    bounded queue. When full, streams stop reading until it is drained.
+
+    If a stream exhausts its request attempts it is restarted with a
+    backoff drawn from the retry policy, unless the error is one that
+    retrying will not fix, such as :ref:`Unauthorized <unauthorized_error>`
+    or :ref:`Forbidden <forbidden_error>`, or is not an API error at all.
+    Iteration ends when every stream has failed this way.
+
+    Can be iterated with both :code:`async for` and :code:`for`. The latter
+    runs the event loop in a single background thread.
+
+    Attributes
+    ----------
+    health : dict[str, StreamHealth]
+        Health statistics of each stream, keyed by project ID.
+
+    Examples
+    --------
+    >>> # Stream events from every available project.
+    >>> projects = dt.Project.list_projects()
+    >>> mux = dt.aio.StreamMultiplexer([p.project_id for p in projects])
+    >>> for event in mux:
+    ...     print(event)
+
+    """
+
+    def __init__(self,
+                 project_ids: list[str],
+                 device_ids: Optional[list[str]] = None,
+                 label_filters: Optional[dict] = None,
+                 device_types: Optional[list[str]] = None,
+                 event_types: Optional[list[str]] = None,
+                 buffer_size: int = 1000,
+                 **kwargs: Any,
+                 ) -> None:
+        """
+        Parameters
+        ----------
+        project_ids : list[str]
+            Unique IDs of the projects to stream.
+        device_ids : list[str], optional
+            Only includes events from the specified device(s).
+        label_filters : dict[str, Optional[str]], optional
+            Filter devices by their labels.
+        device_types : list[str], optional
+            Only includes events from devices with specified
+            :ref:`type(s) <device_type_constants>`.
+        event_types : list[str], optional
+            Only includes events of the specified :ref:`type(s) <event_types>`.
+        buffer_size : int, optional
+            Maximum number of events buffered before streams are paused.
+        **kwargs
+            Arbitrary keyword arguments.
+            See the :ref:`Configuration <configuration>` page.
+
+        """
+
+        # Check that buffer_size > 0.
+        if buffer_size <= 0:
+            raise dterrors.ConfigurationError(
+                'Parameter buffer_size has value {}, but must be '
+                'integer greater than 0.'.format(buffer_size)
+            )
+
+        self._params = _Stream._stream_params(
+            device_ids, label_filters, device_types, event_types,
+        )
+        self._buffer_size = buffer_size
+        self._kwargs = kwargs
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: list[asyncio.Task] = []
+        self._n_running = 0
+
+        self.health = {pid: StreamHealth(pid) for pid in project_ids}
+
+    def __aiter__(self) -> AsyncGenerator[Event, None]:
+        return self._aiter()
+
+    def __iter__(self) -> Generator[Event, None, None]:
+        # Run the streams on an event loop in a single background thread.
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+
+        def run(coroutine: Any) -> Any:
+            return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+        try:
+            run(self.start())
+            while True:
+                event = run(self._next())
+                if event is None:
+                    break
+                yield event
+        finally:
+            run(self.close())
+            run(dtaiorequests.close_sessions())
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    async def start(self) -> None:
+        """
+        Starts a task for each stream on the running event loop.
+        Called automatically when iterated.
+
+        """
+
+        if self._queue is not None:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self._buffer_size)
+        self._n_running = len(self.health)
+        self._tasks = [
+            asyncio.ensure_future(self._run_stream(health))
+            for health in self.health.values()
+        ]
+
+    async def close(self) -> None:
+        """
+        Stops all streams.
+
+        """
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _aiter(self) -> AsyncGenerator[Event, None]:
+        await self.start()
+        try:
+            while True:
+                event = await self._next()
+                if event is None:
+                    break
+                yield event
+        finally:
+            await self.close()
+
+    async def _next(self) -> Optional[Event]:
+        # None is returned once every stream has failed.
+        assert self._queue is not None
+        if self._n_running == 0 and self._queue.empty():
+            return None
+        event: Optional[Event] = await self._queue.get()
+        return event
+
+    async def _run_stream(self, health: StreamHealth) -> None:
+        assert self._queue is not None
+        url = '/projects/{}/devices:stream'.format(health.project_id)
+
+        # The retry policy decides the sleeps between restarts,
+        # backing off at its cap once it gives up.
+        retry_policy = self._kwargs.get('retry_policy', dt.retry_policy)
+        restarts = retry_policy.begin(_UNLIMITED)
+        try:
+            while True:
+                connected = False
+                try:
+                    async for event in dtaiorequests.AsyncDTRequest.stream(
+                        url,
+                        params=dict(self._params),
+                        yield_pings=True,
+                        **self._kwargs,
+                    ):
+                        health.last_message_time = time.time()
+                        connected = True
+                        if event['eventType'] == 'ping':
+                            continue
+
+                        health.events_received += 1
+
+                        # Blocks while the buffer is full.
+                        await self._queue.put(Event(event))
+
+                except Exception as e:
+                    health.last_error = e
+
+                    # Errors that will not resolve by retrying.
+                    if not isinstance(e, dterrors.DTApiError) or (
+                        isinstance(e, dterrors.UsageError)
+                        and not isinstance(e, dterrors.TooManyRequests)
+                    ):
+                        health.failed = True
+                        dtlog.error('Stream for project {} failed: {}'.format(
+                            health.project_id, repr(e),
+                        ))
+                        return
+
+                # Restart the stream, backing off from scratch
+                # if it was connected since the last restart.
+                if connected:
+                    restarts = retry_policy.begin(_UNLIMITED)
+                sleeptime = restarts.next_sleep(
+                    dtretry.retry_after(health.last_error),
+                )
+                if sleeptime is None:
+                    sleeptime = retry_policy.cap
+                dtlog.warning('Restarting stream for {} in {:.1f}s.'.format(
+                    health.project_id, sleeptime,
+                ))
+                await asyncio.sleep(sleeptime)
+                health.reconnects += 1
+
+        finally:
+            # Wake a waiting consumer once no streams are left running.
+            self._n_running -= 1
+            if self._n_running == 0 and self._queue.empty():
+                self._queue.put_nowait(None)
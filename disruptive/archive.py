@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import os
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional, Any, Iterable
+
+import disruptive.errors as dterrors
+from disruptive.columnar import ColumnarEventHistory, _import_pyarrow
+
+# Supported file formats and their file extensions.
+PARQUET = 'parquet'
+FEATHER = 'feather'
+FILE_FORMATS = {
+    PARQUET: '.parquet',
+    FEATHER: '.feather',
+}
+
+# What to do with files already in a partition when it is first written.
+APPEND = 'append'
+OVERWRITE = 'overwrite'
+MODES = [APPEND, OVERWRITE]
+
+
+class EventHistoryWriter():
+    """
+    Writes raw events into Parquet or Arrow IPC (Feather) files,
+    partitioned by project, device, event type, and day::
+
+        <path>/project_id=<ID>/device_id=<ID>/event_type=<TYPE>/
+            date=<YYYY-MM-DD>/part-<RUN>-<N>.parquet
+
+    Events are written page by page as they are given, so memory use
+    depends on the number of open partitions and `row_group_size`,
+    not on the length of the history. As the partition columns are
+    part of the path, `device_id` is not stored in the files.
+
+    Each writer adds new part files, so existing partitions can be
+    appended to by later runs. The written files can be read back
+    as a single dataset with hive partitioning.
+
+    Requires the installation of additional packages.
+    >> pip install pyarrow
+    or
+    >> pip install disruptive[extra]
+
+    Parameters
+    ----------
+    path : str
+        Root directory of the partitioned files.
+    file_format : str, optional
+        Either "parquet" or "feather". Defaults to "parquet".
+    mode : str, optional
+        If "append", new files are added next to existing ones.
+        If "overwrite", existing files in each partition are
+        removed when the partition is first written to.
+        Defaults to "append".
+    row_group_size : int, optional
+        Number of events buffered per partition before being
+        written as a single row group or record batch.
+    max_open_files : int, optional
+        Maximum number of partitions with an open file. When exceeded,
+        the least recently written partition is flushed and closed.
+
+    Examples
+    --------
+    >>> # Archive the events of every device in a project.
+    >>> with dt.EventHistoryWriter('archive/') as writer:
+    ...     for _, events in dt.EventHistory.iter_events_bulk(
+    ...         project_id='<PROJECT_ID>',
+    ...     ):
+    ...         writer.write(event.raw for event in events)
+
+    >>> # Read the archive back with pyarrow.
+    >>> import pyarrow.dataset as ds
+    >>> table = ds.dataset('archive/', partitioning='hive').to_table()
+
+    """
+
+    def __init__(self,
+                 path: str,
+                 file_format: str = PARQUET,
+                 mode: str = APPEND,
+                 row_group_size: int = 65536,
+                 max_open_files: int = 64,
+                 ) -> None:
+        # Check that file_format and mode are known.
+        if file_format not in FILE_FORMATS:
+            raise dterrors.ConfigurationError(
+                'Parameter file_format has value {}, but must be one '
+                'of {}.'.format(file_format, list(FILE_FORMATS))
+            )
+        if mode not in MODES:
+            raise dterrors.ConfigurationError(
+                'Parameter mode has value {}, but must be one '
+                'of {}.'.format(mode, MODES)
+            )
+
+        # Check that row_group_size and max_open_files > 0.
+        for name, value in [
+            ('row_group_size', row_group_size),
+            ('max_open_files', max_open_files),
+        ]:
+            if value <= 0:
+                raise dterrors.ConfigurationError(
+                    'Parameter {} has value {}, but must be '
+                    'integer greater than 0.'.format(name, value)
+                )
+
+        # Fail early if pyarrow is missing.
+        _import_pyarrow()
+
+        self.path = path
+        self.file_format = file_format
+        self.mode = mode
+        self.row_group_size = row_group_size
+        self.max_open_files = max_open_files
+
+        # Part files written by this writer are named after the run.
+        self._run = '{:%Y%m%dT%H%M%S}-{}'.format(
+            datetime.now(timezone.utc), uuid.uuid4().hex[:8],
+        )
+        self._n_files = 0
+        self._partitions: OrderedDict[str, _Partition] = OrderedDict()
+        self._seen: set[str] = set()
+
+        #: Paths of all files written, in order of creation.
+        self.files: list[str] = []
+
+    def __enter__(self) -> EventHistoryWriter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def write(self, events: Iterable[dict]) -> None:
+        """
+        Writes raw events, as returned by the API, into their partitions.
+
+        Parameters
+        ----------
+        events : Iterable[dict]
+            Unmodified event JSON, typically a single page of history.
+
+        """
+
+        pa = _import_pyarrow()
+        import pyarrow.compute as pc  # type: ignore
+
+        # The project is only found in the target name.
+        by_project: dict[str, list[dict]] = {}
+        for event in events:
+            by_project.setdefault(
+                _project_id(event['targetName']), [],
+            ).append(event)
+
+        for project_id, project_events in by_project.items():
+            history = ColumnarEventHistory(project_events)
+            for event_type, batch in history.to_arrow().items():
+                device_ids = batch.column('device_id').dictionary_decode()
+                days = pc.strftime(
+                    batch.column('update_time'), format='%Y-%m-%d',
+                )
+                batch = pa.RecordBatch.from_arrays(
+                    batch.columns[1:], names=batch.schema.names[1:],
+                )
+
+                for device_id in pc.unique(device_ids).to_pylist():
+                    of_device = pc.equal(device_ids, device_id)
+                    for day in pc.unique(days.filter(of_device)).to_pylist():
+                        mask = pc.and_(of_device, pc.is_null(days)) \
+                            if day is None \
+                            else pc.and_(of_device, pc.equal(days, day))
+                        self._partition(
+                            project_id, device_id, event_type, day,
+                        ).append(batch.filter(mask))
+
+    def flush(self) -> None:
+        """
+        Writes all buffered events to their files.
+
+        """
+
+        for partition in self._partitions.values():
+            partition.flush()
+
+    def close(self) -> None:
+        """
+        Writes all buffered events and closes all open files.
+
+        """
+
+        while len(self._partitions) > 0:
+            _, partition = self._partitions.popitem(last=False)
+            partition.close()
+
+    def _partition(self,
+                   project_id: str,
+                   device_id: str,
+                   event_type: str,
+                   day: Optional[str],
+                   ) -> _Partition:
+        directory = os.path.join(
+            self.path,
+            'project_id={}'.format(project_id),
+            'device_id={}'.format(device_id),
+            'event_type={}'.format(event_type),
+            'date={}'.format(day if day is not None else 'unknown'),
+        )
+
+        partition = self._partitions.get(directory)
+        if partition is not None:
+            self._partitions.move_to_end(directory)
+            return partition
+
+        # Close the least recently written partition if too many are open.
+        if len(self._partitions) >= self.max_open_files:
+            _, oldest = self._partitions.popitem(last=False)
+            oldest.close()
+
+        os.makedirs(directory, exist_ok=True)
+        if directory not in self._seen:
+            self._seen.add(directory)
+            if self.mode == OVERWRITE:
+                _remove_files(directory, FILE_FORMATS[self.file_format])
+
+        self._n_files += 1
+        file_path = os.path.join(directory, 'part-{}-{:05d}{}'.format(
+            self._run, self._n_files, FILE_FORMATS[self.file_format],
+        ))
+        self.files.append(file_path)
+
+        partition = _Partition(
+            file_path, self.file_format, self.row_group_size,
+        )
+        self._partitions[directory] = partition
+        return partition
+
+
+class _Partition():
+    """
+    Buffers the record batches of a single partition and
+    writes them to its file in groups of `row_group_size`.
+
+    """
+
+    def __init__(self,
+                 file_path: str,
+                 file_format: str,
+                 row_group_size: int,
+                 ) -> None:
+        self.file_path = file_path
+        self.file_format = file_format
+        self.row_group_size = row_group_size
+
+        self._batches: list = []
+        self._n_rows = 0
+        self._writer: Any = None
+
+    def append(self, batch: Any) -> None:
+        pa = _import_pyarrow()
+        if self.file_format == FEATHER:
+            # Dictionaries may not change between batches of an IPC file.
+            batch = pa.RecordBatch.from_arrays([
+                column.dictionary_decode()
+                if pa.types.is_dictionary(column.type) else column
+                for column in batch.columns
+            ], names=batch.schema.names)
+
+        self._batches.append(batch)
+        self._n_rows += batch.num_rows
+        if self._n_rows >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._n_rows == 0:
+            return
+
+        pa = _import_pyarrow()
+        table = pa.Table.from_batches(self._batches)
+        if self._writer is None:
+            self._writer = self._open(table.schema)
+        self._writer.write_table(table)
+
+        self._batches = []
+        self._n_rows = 0
+
+    def close(self) -> None:
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _open(self, schema: Any) -> Any:
+        if self.file_format == PARQUET:
+            import pyarrow.parquet as pq  # type: ignore
+            return pq.ParquetWriter(self.file_path, schema)
+        else:
+            import pyarrow.ipc as ipc  # type: ignore
+            return ipc.new_file(self.file_path, schema)
+
+
+def _project_id(target_name: str) -> str:
+    # Target names are on the form projects/<ID>/devices/<ID>.
+    parts = target_name.strip(' /').split('/')
+    return parts[1] if len(parts) > 1 else ''
+
+
+def _remove_files(directory: str, extension: str) -> None:
+    for name in os.listdir(directory):
+        if name.endswith(extension):
+            os.remove(os.path.join(directory, name))
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 import os
+import sys
+import abc
 import json
 import time
+import tempfile
+import threading
+import contextlib
 import urllib.parse
-from typing import Any
+from typing import Any, Optional, Iterator
 import base64
 import hmac
 import hashlib
 
+import disruptive as dt
 from disruptive import requests as dtrequests, errors as dterrors
+from disruptive import logging as dtlog
+from disruptive import tracing as dttracing
 
 
 def base64url_encode(data: bytes) -> str:
@@ -52,13 +60,202 @@ def create_jwt(payload: dict,
     return f"{message}.{signature_encoded}"
 
 
+class TokenStore(abc.ABC):
+    """
+    Interface of access token stores shared between processes, letting
+    them reuse a valid token instead of each exchanging their own.
+
+    Tokens are keyed by the service account key ID and token endpoint.
+    Implementations must override :meth:`get` and :meth:`set`, and
+    should override :meth:`lock`.
+
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[tuple[str, float]]:
+        """
+        Returns the stored token and its expiration in unixtime,
+        or None if no token is stored under the key.
+
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, token: str, expiration: float) -> None:
+        """
+        Stores a token and its expiration in unixtime under the key.
+
+        """
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """
+        Context manager held while a token is exchanged, so that only
+        one process at a time exchanges a token for the same key.
+        The default implementation does not lock.
+
+        """
+
+        yield
+
+
+class FileTokenStore(TokenStore):
+    """
+    Shares access tokens between processes through files in a directory,
+    one per key, guarded by an exclusive file lock while exchanging.
+
+    The files hold access tokens, and are therefore
+    only readable by the current user.
+
+    Parameters
+    ----------
+    path : str, optional
+        Directory of the token files, created if missing. It must be
+        owned by the current user and not accessible by others.
+        Defaults to `disruptive/tokens` in the user's cache directory.
+
+    Raises
+    ------
+    ConfigurationError
+        If the directory is owned by another user or
+        accessible by others.
+
+    Examples
+    --------
+    >>> # Share tokens between all processes of a gunicorn app.
+    >>> dt.token_store = dt.FileTokenStore('/var/run/myapp/tokens')
+
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        if path is None:
+            path = _user_cache_dir('tokens')
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        _verify_private_dir(path)
+        self.path = path
+
+    def get(self, key: str) -> Optional[tuple[str, float]]:
+        try:
+            with open(self._file(key), 'r') as f:
+                cached = json.load(f)
+            return cached['token'], float(cached['expiration'])
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or partially written files count as no token.
+            return None
+
+    def set(self, key: str, token: str, expiration: float) -> None:
+        # Write to a temporary file first, so that readers
+        # never see a partially written token.
+        fd, tmp_path = tempfile.mkstemp(dir=self.path)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'token': token, 'expiration': expiration}, f)
+            os.replace(tmp_path, self._file(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        fd = os.open(self._file(key) + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            _lock_file(fd)
+            try:
+                yield
+            finally:
+                _unlock_file(fd)
+        finally:
+            os.close(fd)
+
+    def _file(self, key: str) -> str:
+        # Keys contain URLs, so use a digest as file name.
+        return os.path.join(
+            self.path, hashlib.sha256(key.encode('utf-8')).hexdigest(),
+        )
+
+
+def _user_cache_dir(name: str) -> str:
+    # A directory of the user's own, which others can not pre-create.
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') \
+            or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'disruptive', name)
+
+
+def _verify_private_dir(path: str) -> None:
+    # An existing directory is left as is by os.makedirs(), so verify
+    # that no other user can read, plant, or replace tokens in it.
+    # Windows has no such permission bits, and relies on the default
+    # directory being in the user's profile.
+    if not hasattr(os, 'getuid'):
+        return
+
+    st = os.stat(path)
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise dterrors.ConfigurationError(
+            'Token directory {} must be owned by the current user and '
+            'not be accessible by others.'.format(path)
+        )
+
+
+if sys.platform == 'win32':
+    import msvcrt
+
+    def _lock_file(fd: int) -> None:
+        # LK_LOCK gives up after 10 attempts, so keep trying.
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def _unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
 class _AuthRoutineBase(object):
 
+    # Seconds before expiration at which the token is refreshed in the
+    # background, so that requests do not wait for the exchange.
+    refresh_margin: float = 60
+
+    # Seconds to wait before retrying a failed background refresh.
+    _background_retry_interval: float = 5
+
     def __init__(self) -> None:
         # Set default attributes.
-        self._expiration: int = 0
+        self._expiration: float = 0
         self._token: str = ''
 
+        # Held while refreshing. Only threads holding an expired token
+        # wait for it, while the others keep using the still valid one.
+        self._lock = threading.Lock()
+        self._background: Optional[threading.Thread] = None
+        self._background_retry_at: float = 0
+        self._refresh_count = 0
+
+    @property
+    def refresh_count(self) -> int:
+        """
+        Number of times an access token has been exchanged,
+        not counting tokens read from a token store.
+
+        """
+
+        return self._refresh_count
+
     def _has_expired(self) -> bool:
         """
         Evaluates whether the access token has expired.
@@ -75,11 +272,18 @@ class _AuthRoutineBase(object):
         else:
             return False
 
+    def _expires_soon(self) -> bool:
+        return time.time() > self._expiration - self.refresh_margin
+
     def get_token(self) -> str:
         """
         Returns the access token.
         If the token has expired, renew it.
 
+        The token is renewed by a single thread, with any other thread
+        waiting for the result. If it is about to expire, it is renewed
+        in the background while the current token is returned.
+
         Returns
         -------
         token : str
@@ -89,20 +293,72 @@ class _AuthRoutineBase(object):
 
         # Check expiration time.
         if self._has_expired():
-            # Renew access token.
-            self.refresh()
+            with self._lock:
+                # Another thread may have renewed it while waiting.
+                if self._has_expired():
+                    self._refresh()
+
+        elif self._expires_soon():
+            self._refresh_in_background()
 
         return self._token
 
     def refresh(self) -> None:
         """
-        This function does nothing and is overwritten in all
-        child classes. It only exists for consistency purposes
-        as it is called in get_token().
+        Refreshes the access token, after waiting for
+        any refresh already in progress.
 
         """
 
-        pass
+        with self._lock:
+            self._refresh()
+
+    def _refresh(self) -> None:
+        # Must be called while holding the lock.
+        if self._renew_token():
+            self._refresh_count += 1
+
+    def _renew_token(self) -> bool:
+        # Overwritten in child classes to renew the token. Returns
+        # True if a new token was exchanged rather than reused.
+        return False
+
+    def _refresh_in_background(self) -> None:
+        # Never waits, so that requests keep using the current token
+        # while another thread is refreshing or starting a refresh.
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if self._background is not None \
+                    and self._background.is_alive():
+                return
+            if time.time() < self._background_retry_at:
+                return
+
+            self._background = threading.Thread(
+                target=self._background_refresh,
+                name='disruptive-token-refresh',
+                daemon=True,
+            )
+            self._background.start()
+        finally:
+            self._lock.release()
+
+    def _background_refresh(self) -> None:
+        with self._lock:
+            # The token may already have been renewed.
+            if not self._expires_soon():
+                return
+            try:
+                self._refresh()
+            except Exception as e:
+                # The current token is still valid, so only log the
+                # error and let a later call try again.
+                self._background_retry_at = \
+                    time.time() + self._background_retry_interval
+                dtlog.warning('Background token refresh failed: {}'.format(
+                    e,
+                ))
 
 
 class Unauthenticated(_AuthRoutineBase):
@@ -111,7 +367,7 @@ class Unauthenticated(_AuthRoutineBase):
         # Inherit parent class methods and attributes.
         super().__init__()
 
-    def refresh(self) -> None:
+    def _renew_token(self) -> bool:
         """
         If called, this function does nothing but raise an error as no
         authentication routine has been called to update the configuration
@@ -152,6 +408,15 @@ class ServiceAccountAuth(_AuthRoutineBase):
     ----------
     token_endpoint : str
         URL to which the jwt is exchanged for an access token.
+    refresh_margin : float
+        Seconds before expiration at which the access
+        token is refreshed in the background.
+    refresh_count : int
+        Number of times an access token has been exchanged,
+        not counting tokens read from a token store.
+    token_store : TokenStore, optional
+        If set, access tokens are shared through this store.
+        Defaults to the package-wide `token_store` setting.
 
     """
 
@@ -171,6 +436,9 @@ class ServiceAccountAuth(_AuthRoutineBase):
         # Default to HS256 algorithm.
         self._algorithm = self.supported_algorithms[0]
 
+        # Falls back to the package-wide store if not set.
+        self.token_store: Optional[TokenStore] = None
+
     @property
     def key_id(self) -> str:
         return self._key_id
@@ -231,11 +499,52 @@ class ServiceAccountAuth(_AuthRoutineBase):
         This first exchanges the JWT for an access token, then updates
         the expiration and token attributes with the response.
 
+        If a token store is set, a valid token in the store is used
+        instead, and new tokens are written to it.
+
         """
 
-        response: dict = self._get_access_token()
-        self._expiration = time.time() + response['expires_in']
-        self._token = 'Bearer {}'.format(response['access_token'])
+        super().refresh()
+
+    def _renew_token(self) -> bool:
+        with dttracing.refresh_span(self.token_endpoint):
+            return self._refresh_token()
+
+    def _refresh_token(self) -> bool:
+        # Returns False if a token was read from the store instead.
+        store = self.token_store or dt.token_store
+        if store is None:
+            response: dict = self._get_access_token()
+            self._expiration = time.time() + response['expires_in']
+            self._token = 'Bearer {}'.format(response['access_token'])
+            return True
+
+        # Reuse a token exchanged by another process if still valid.
+        key = '{}@{}'.format(self.key_id, self.token_endpoint)
+        if self._use_stored_token(store, key):
+            return False
+
+        # Only one process exchanges, and the others waiting
+        # for the lock then find the new token in the store.
+        with store.lock(key):
+            if self._use_stored_token(store, key):
+                return False
+
+            response = self._get_access_token()
+            self._expiration = time.time() + response['expires_in']
+            self._token = 'Bearer {}'.format(response['access_token'])
+            store.set(key, self._token, self._expiration)
+            return True
+
+    def _use_stored_token(self, store: TokenStore, key: str) -> bool:
+        # Tokens about to expire are not reused, as they
+        # would immediately be refreshed in the background.
+        stored = store.get(key)
+        if stored is None or stored[1] - self.refresh_margin <= time.time():
+            return False
+
+        self._token, self._expiration = stored
+        return True
 
     def _get_access_token(self) -> dict:
         """
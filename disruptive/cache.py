@@ -0,0 +1,408 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Any, Callable, Iterable
+
+import disruptive.errors as dterrors
+import disruptive.transforms as dttrans
+
+# Coverage key used when all event types are fetched.
+_ALL_TYPES = '*'
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS events (
+    event_id TEXT PRIMARY KEY,
+    project_id TEXT NOT NULL,
+    device_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    update_time INTEGER NOT NULL,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_by_device
+    ON events (project_id, device_id, update_time);
+CREATE INDEX IF NOT EXISTS events_by_time
+    ON events (update_time);
+CREATE TABLE IF NOT EXISTS coverage (
+    project_id TEXT NOT NULL,
+    device_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    synced_from INTEGER NOT NULL,
+    synced_until INTEGER NOT NULL,
+    PRIMARY KEY (project_id, device_id, event_type)
+);
+'''
+
+
+class EventCache():
+    """
+    Local SQLite cache of device event history, keyed by
+    project, device, and event type.
+
+    For each key, the cache remembers the time range it has synced.
+    When a cached range is requested again, only the parts outside of
+    it are fetched, which for a moving window is just the new events
+    since the last call. The rest is served locally.
+
+    A cache can be shared between threads, and is given to
+    :meth:`EventHistory.list_events` through the `cache` parameter.
+
+    Eviction runs at the start of each call, so the events of
+    a range are kept until the next call even if they are
+    older than `max_age`.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the SQLite database file, created if missing.
+        Defaults to ":memory:", keeping the cache in memory only.
+    max_age : float, timedelta, optional
+        If provided, events with an update time older than this many
+        seconds are evicted, and are then fetched again if requested.
+    max_events : int, optional
+        If provided, the oldest events are evicted once the cache
+        holds more than this many events.
+    overlap : float, timedelta, optional
+        Seconds before the end of a synced range that are fetched
+        again, picking up events that arrived late. Defaults to 60.
+
+    Examples
+    --------
+    >>> # Refresh a dashboard of the last 7 days, only fetching new events.
+    >>> cache = dt.EventCache('events.sqlite', max_age=timedelta(days=8))
+    >>> events = dt.EventHistory.list_events(
+    ...     device_id='<DEVICE_ID>',
+    ...     project_id='<PROJECT_ID>',
+    ...     start_time=datetime.utcnow() - timedelta(7),
+    ...     cache=cache,
+    ... )
+
+    """
+
+    def __init__(self,
+                 path: str = ':memory:',
+                 max_age: Optional[float | timedelta] = None,
+                 max_events: Optional[int] = None,
+                 overlap: float | timedelta = 60,
+                 ) -> None:
+        # Check that max_events > 0.
+        if max_events is not None and max_events <= 0:
+            raise dterrors.ConfigurationError(
+                'Parameter max_events has value {}, but must be '
+                'integer greater than 0.'.format(max_events)
+            )
+
+        self.path = path
+        self.max_age = _to_seconds(max_age)
+        self.max_events = max_events
+        self.overlap = _to_seconds(overlap) or 0.0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+        #: Number of events fetched from the API and stored in the cache.
+        self.fetched = 0
+        #: Number of events served without being fetched.
+        self.served = 0
+
+    def __enter__(self) -> EventCache:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT COUNT(*) FROM events',
+            ).fetchone()
+        return int(row[0])
+
+    def list_events(self,
+                    project_id: str,
+                    device_id: str,
+                    event_types: Optional[list[str]],
+                    start_time: datetime,
+                    end_time: datetime,
+                    fetch: Callable[[datetime, datetime], Iterable[dict]],
+                    ) -> list[dict]:
+        """
+        Returns the raw events of a device in the range
+        [start_time, end_time), fetching any part of the range
+        not already cached.
+
+        Parameters
+        ----------
+        project_id : str
+            Unique ID of the target project.
+        device_id : str
+            Unique ID of the target device.
+        event_types : list[str], optional
+            If provided, only events of these types are returned.
+        start_time : datetime
+            Start of the range, inclusive.
+        end_time : datetime
+            End of the range, exclusive.
+        fetch : Callable[[datetime, datetime], Iterable[dict]]
+            Fetches the raw events of the requested types
+            between a start and end time from the API.
+
+        Returns
+        -------
+        events : list[dict]
+            Raw events in the range, ordered by update time.
+
+        """
+
+        start = dttrans.to_epoch_ns(start_time)
+        end = dttrans.to_epoch_ns(end_time)
+        keys = sorted(set(event_types)) if event_types else [_ALL_TYPES]
+
+        # Evict before fetching so that the requested range is kept
+        # until the next call, even if older than max_age.
+        self.evict()
+
+        # Fetch the parts of the range not covered for every key.
+        n_fetched = 0
+        for fetch_start, fetch_end in self._missing(
+            project_id, device_id, keys, start, end,
+        ):
+            events = list(fetch(_to_datetime(fetch_start),
+                                _to_datetime(fetch_end)))
+            self._insert(project_id, device_id, events)
+            n_fetched += len(events)
+
+        with self._lock, self._connection:
+            for key in keys:
+                self._extend_coverage(project_id, device_id, key, start, end)
+
+        query = 'SELECT raw FROM events WHERE project_id = ? ' \
+            'AND device_id = ? AND update_time >= ? AND update_time < ?'
+        params: list = [project_id, device_id, start, end]
+        if event_types:
+            query += ' AND event_type IN ({})'.format(
+                ', '.join('?' * len(keys))
+            )
+            params += keys
+        query += ' ORDER BY update_time, rowid'
+
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+
+        events = [json.loads(raw) for raw, in rows]
+        self.fetched += n_fetched
+        self.served += max(len(events) - n_fetched, 0)
+        return events
+
+    def invalidate(self,
+                   project_id: Optional[str] = None,
+                   device_id: Optional[str] = None,
+                   event_types: Optional[list[str]] = None,
+                   ) -> None:
+        """
+        Removes cached events and synced ranges, so that they are
+        fetched again on the next call. Each given parameter narrows
+        what is removed, and if none are given the cache is emptied.
+
+        Parameters
+        ----------
+        project_id : str, optional
+            Only remove events of this project.
+        device_id : str, optional
+            Only remove events of this device.
+        event_types : list[str], optional
+            Only remove events of these types. Ranges synced for
+            all event types are then removed as well.
+
+        """
+
+        conditions = []
+        params: list = []
+        if project_id is not None:
+            conditions.append('project_id = ?')
+            params.append(project_id)
+        if device_id is not None:
+            conditions.append('device_id = ?')
+            params.append(device_id)
+
+        events_where = list(conditions)
+        coverage_where = list(conditions)
+        events_params = list(params)
+        coverage_params = list(params)
+        if event_types is not None:
+            events_where.append('event_type IN ({})'.format(
+                ', '.join('?' * len(event_types))
+            ))
+            events_params += event_types
+            coverage_where.append('event_type IN ({})'.format(
+                ', '.join('?' * (len(event_types) + 1))
+            ))
+            coverage_params += list(event_types) + [_ALL_TYPES]
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                'DELETE FROM events' + _where(events_where), events_params,
+            )
+            self._connection.execute(
+                'DELETE FROM coverage' + _where(coverage_where),
+                coverage_params,
+            )
+
+    def clear(self) -> None:
+        """
+        Removes all cached events and synced ranges.
+
+        """
+
+        self.invalidate()
+
+    def evict(self) -> None:
+        """
+        Removes events older than `max_age` and, if more than `max_events`
+        remain, the oldest ones. Synced ranges are shortened to match,
+        so that evicted events are fetched again if requested.
+
+        """
+
+        cutoffs = []
+        if self.max_age is not None:
+            now = dttrans.to_epoch_ns(datetime.now(timezone.utc))
+            cutoffs.append(now - int(self.max_age * 1_000_000_000))
+
+        with self._lock, self._connection:
+            if self.max_events is not None:
+                # Update time of the oldest event to keep.
+                row = self._connection.execute(
+                    'SELECT update_time FROM events '
+                    'ORDER BY update_time DESC LIMIT 1 OFFSET ?',
+                    (self.max_events - 1,),
+                ).fetchone()
+                if row is not None:
+                    cutoffs.append(row[0])
+
+            if len(cutoffs) == 0:
+                return
+            cutoff = max(cutoffs)
+
+            self._connection.execute(
+                'DELETE FROM events WHERE update_time < ?', (cutoff,),
+            )
+            self._connection.execute(
+                'DELETE FROM coverage WHERE synced_until <= ?', (cutoff,),
+            )
+            self._connection.execute(
+                'UPDATE coverage SET synced_from = ? WHERE synced_from < ?',
+                (cutoff, cutoff),
+            )
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+
+        """
+
+        with self._lock:
+            self._connection.close()
+
+    def _missing(self,
+                 project_id: str,
+                 device_id: str,
+                 keys: list[str],
+                 start: int,
+                 end: int,
+                 ) -> list[tuple[int, int]]:
+        # Only the range covered by all keys can be served locally.
+        with self._lock:
+            rows = [self._connection.execute(
+                'SELECT synced_from, synced_until FROM coverage '
+                'WHERE project_id = ? AND device_id = ? AND event_type = ?',
+                (project_id, device_id, key),
+            ).fetchone() for key in keys]
+
+        if any(row is None for row in rows):
+            return [(start, end)]
+
+        synced_from = max(row[0] for row in rows)
+        synced_until = min(row[1] for row in rows)
+        synced_until -= int(self.overlap * 1_000_000_000)
+        if end <= synced_from or start >= synced_until:
+            return [(start, end)]
+
+        missing = []
+        if start < synced_from:
+            missing.append((start, synced_from))
+        if end > synced_until:
+            missing.append((synced_until, end))
+        return missing
+
+    def _extend_coverage(self,
+                         project_id: str,
+                         device_id: str,
+                         key: str,
+                         start: int,
+                         end: int,
+                         ) -> None:
+        # Ranges are kept contiguous. A range not overlapping
+        # the synced one replaces it, as the gap is unknown.
+        row = self._connection.execute(
+            'SELECT synced_from, synced_until FROM coverage '
+            'WHERE project_id = ? AND device_id = ? AND event_type = ?',
+            (project_id, device_id, key),
+        ).fetchone()
+        if row is not None and start <= row[1] and end >= row[0]:
+            start, end = min(start, row[0]), max(end, row[1])
+
+        self._connection.execute(
+            'INSERT OR REPLACE INTO coverage VALUES (?, ?, ?, ?, ?)',
+            (project_id, device_id, key, start, end),
+        )
+
+    def _insert(self,
+                project_id: str,
+                device_id: str,
+                events: list[dict],
+                ) -> None:
+        rows = [(
+            event['eventId'],
+            project_id,
+            device_id,
+            event['eventType'],
+            _update_time(event),
+            json.dumps(event),
+        ) for event in events]
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?)',
+                rows,
+            )
+
+
+def _update_time(event: dict) -> int:
+    # Only labelsChanged is missing updateTime in data.
+    data = event.get('data') or {}
+    data = data.get(event['eventType'], data)
+    timestamp = data.get('updateTime', event.get('timestamp'))
+    return 0 if timestamp is None else dttrans.to_epoch_ns(timestamp)
+
+
+def _to_datetime(ns: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+def _to_seconds(value: Optional[float | timedelta]) -> Optional[float]:
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return value
+
+
+def _where(conditions: list[str]) -> str:
+    if len(conditions) == 0:
+        return ''
+    return ' WHERE ' + ' AND '.join(conditions)
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import time
+import threading
+from collections import deque
+from typing import Optional
+
+import disruptive.logging as dtlog
+import disruptive.errors as dterrors
+
+# Circuit states.
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class Circuit():
+    """
+    State of the circuit of a single base URL.
+
+    Attributes
+    ----------
+    state : str
+        One of "closed", "open", or "half_open".
+    consecutive_failures : int
+        Failed attempts since the last successful one.
+    opened_count : int
+        Number of times the circuit has opened.
+    rejected_count : int
+        Number of requests failed fast while the circuit was open.
+
+    """
+
+    def __init__(self, window: int) -> None:
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_count = 0
+        self.rejected_count = 0
+
+        # Whether each of the most recent attempts failed.
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed attempts in the window."""
+        if len(self._outcomes) == 0:
+            return 0.0
+        return sum(self._outcomes) / len(self._outcomes)
+
+    def __repr__(self) -> str:
+        return '{}(state={!r}, consecutive_failures={}, error_rate={:.2f})'\
+            .format(
+                self.__class__.__name__,
+                self.state,
+                self.consecutive_failures,
+                self.error_rate,
+            )
+
+
+class CircuitBreaker():
+    """
+    Fails requests fast while the API behind a base URL is degraded,
+    rather than having each call wait out every attempt and timeout.
+
+    Each base URL, like `base_url`, `emulator_base_url`, or the token
+    endpoint, has its own :class:`Circuit`. Only attempts failing with
+    a ServerError or ConnectionError count as failures. A circuit opens
+    after `failure_threshold` consecutive failures, or once at least
+    `error_rate` of the last `window` attempts have failed. While open,
+    requests raise CircuitBreakerOpen without being sent, while streams
+    wait for the next probe before reconnecting. After `reset_timeout`
+    seconds, the circuit is half-open and lets `half_open_probes`
+    requests through. A successful probe closes the circuit, and a
+    failed one opens it again.
+
+    The package-wide breaker is `disruptive.circuit_breaker`. Single
+    calls can override it with the `circuit_breaker` keyword argument.
+
+    Parameters
+    ----------
+    failure_threshold : int, optional
+        Consecutive failed attempts that open the circuit.
+    error_rate : float, optional
+        Share of failed attempts in the window that opens the circuit.
+    window : int, optional
+        Number of most recent attempts the error rate is taken over,
+        only considered once that many attempts have been made.
+    reset_timeout : float, optional
+        Seconds the circuit stays open before probing.
+    half_open_probes : int, optional
+        Concurrent requests let through while half-open.
+
+    Attributes
+    ----------
+    circuits : dict[str, Circuit]
+        Circuit of each base URL requested so far.
+
+    """
+
+    def __init__(self,
+                 failure_threshold: int = 5,
+                 error_rate: float = 0.5,
+                 window: int = 20,
+                 reset_timeout: float = 30.0,
+                 half_open_probes: int = 1,
+                 ) -> None:
+        # Check that all integer arguments are >= 1.
+        for name, value in [('failure_threshold', failure_threshold),
+                            ('window', window),
+                            ('half_open_probes', half_open_probes)]:
+            if value < 1:
+                raise dterrors.ConfigurationError(
+                    'Circuit breaker has {} {}, but must be integer '
+                    'greater than 0.'.format(name, value)
+                )
+
+        # Check that 0 < error_rate <= 1 and reset_timeout > 0.
+        if not 0 < error_rate <= 1 or reset_timeout <= 0:
+            raise dterrors.ConfigurationError(
+                'Circuit breaker has error_rate {} and reset_timeout {}, '
+                'but must have error_rate in (0, 1] and reset_timeout '
+                'greater than 0.'.format(error_rate, reset_timeout)
+            )
+
+        self.failure_threshold = failure_threshold
+        self.error_rate = error_rate
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+
+        self.circuits: dict[str, Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, base_url: str) -> str:
+        """
+        Returns the state of the circuit of a base URL.
+
+        Parameters
+        ----------
+        base_url : str
+            Base URL of the circuit.
+
+        Returns
+        -------
+        state : str
+            One of "closed", "open", or "half_open".
+
+        """
+
+        with self._lock:
+            circuit = self.circuits.get(base_url)
+            return circuit.state if circuit is not None else CLOSED
+
+    def allow(self, base_url: str) -> None:
+        """
+        Claims a request to a base URL.
+
+        Parameters
+        ----------
+        base_url : str
+            Base URL of the request.
+
+        Raises
+        ------
+        CircuitBreakerOpen
+            If the circuit is open, or half-open with
+            all probes already in flight.
+
+        """
+
+        with self._lock:
+            circuit = self._circuit(base_url)
+            if circuit.state == CLOSED:
+                return
+
+            now = time.monotonic()
+            remaining = circuit._opened_at + self.reset_timeout - now
+            if circuit.state == OPEN and remaining <= 0:
+                dtlog.info('Circuit of {} is half-open.'.format(base_url))
+                circuit.state = HALF_OPEN
+                circuit._opened_at = now
+                circuit._probes = 0
+
+            # Probes that never reported back free their slot
+            # once another reset_timeout has passed.
+            elif circuit.state == HALF_OPEN and remaining <= 0:
+                circuit._opened_at = now
+                circuit._probes = 0
+
+            if circuit.state == HALF_OPEN \
+                    and circuit._probes < self.half_open_probes:
+                circuit._probes += 1
+                return
+
+            circuit.rejected_count += 1
+            raise dterrors.CircuitBreakerOpen(
+                'Circuit of {} is open after repeated failures.'.format(
+                    base_url,
+                ),
+                retry_after=max(0.0, remaining),
+            )
+
+    def record(self, base_url: str, error: Optional[Exception]) -> None:
+        """
+        Records the outcome of a request attempt to a base URL.
+
+        Parameters
+        ----------
+        base_url : str
+            Base URL of the request.
+        error : Exception, None
+            Error of the attempt, if any.
+
+        """
+
+        # Rejected requests were never sent, so there is no outcome.
+        if isinstance(error, dterrors.CircuitBreakerOpen):
+            return
+
+        failed = is_failure(error)
+        with self._lock:
+            circuit = self._circuit(base_url)
+            circuit._outcomes.append(failed)
+            if not failed:
+                circuit.consecutive_failures = 0
+                if circuit.state != CLOSED:
+                    dtlog.info('Circuit of {} is closed.'.format(base_url))
+                    circuit.state = CLOSED
+                    circuit._outcomes.clear()
+                return
+
+            circuit.consecutive_failures += 1
+            if circuit.state == HALF_OPEN \
+                    or circuit.consecutive_failures >= self.failure_threshold \
+                    or (len(circuit._outcomes) == self.window
+                        and circuit.error_rate >= self.error_rate):
+                self._open(base_url, circuit)
+
+    def reset(self, base_url: Optional[str] = None) -> None:
+        """
+        Closes the circuit of a base URL, or of all if not given.
+
+        """
+
+        with self._lock:
+            if base_url is None:
+                self.circuits.clear()
+            else:
+                self.circuits.pop(base_url, None)
+
+    def _circuit(self, base_url: str) -> Circuit:
+        circuit = self.circuits.get(base_url)
+        if circuit is None:
+            circuit = self.circuits[base_url] = Circuit(self.window)
+        return circuit
+
+    def _open(self, base_url: str, circuit: Circuit) -> None:
+        if circuit.state != OPEN:
+            dtlog.warning('Circuit of {} is open for {}s.'.format(
+                base_url, self.reset_timeout,
+            ))
+            circuit.opened_count += 1
+        circuit.state = OPEN
+        circuit._opened_at = time.monotonic()
+
+
+def is_failure(error: Optional[Exception]) -> bool:
+    """
+    Returns True if `error` counts as a failure of the API,
+    being a ServerError or ConnectionError.
+
+    """
+
+    return isinstance(error, (dterrors.ServerError, dterrors.ConnectionError))
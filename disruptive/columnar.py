@@ -0,0 +1,919 @@
+from __future__ import annotations
+
+from array import array
+from datetime import datetime
+from typing import Optional, Any, Iterable, Iterator
+
+import disruptive.events.events as dtevents
+import disruptive.transforms as dttrans
+
+# Kinds of column storage.
+_FLOAT = 'float'
+_BOOL = 'bool'
+_CATEGORY = 'category'
+_STRING = 'string'
+_TIMESTAMP = 'timestamp'
+
+# Kinds of nested columns, which are kept as the raw JSON values
+# until exported. Lists of objects have the fields in _STRUCTS.
+_LABELS = 'labels'
+_KEYS = 'keys'
+_TEMPERATURE_SAMPLES = 'temperature_samples'
+_HUMIDITY_SAMPLES = 'humidity_samples'
+_CLOUD_CONNECTORS = 'cloud_connectors'
+_NESTED = (
+    _LABELS, _KEYS, _TEMPERATURE_SAMPLES, _HUMIDITY_SAMPLES, _CLOUD_CONNECTORS,
+)
+
+# Typecode of the array used to store each kind. Categories are stored
+# as codes into a list of unique values, while strings are kept as is.
+_TYPECODES = {
+    _FLOAT: 'd',
+    _BOOL: 'b',
+    _CATEGORY: 'i',
+}
+
+# Missing timestamps are stored as the NumPy NaT value.
+_NAT = -2**63
+
+# Columns shared by all event types.
+_COMMON_COLUMNS = [
+    ('device_id', _CATEGORY),
+    ('event_id', _STRING),
+    ('update_time', _TIMESTAMP),
+]
+
+# For each kind of list of objects, the field name, JSON field and kind.
+_STRUCTS: dict[str, list[tuple[str, str, str]]] = {
+    _TEMPERATURE_SAMPLES: [
+        ('value', 'value', _FLOAT),
+        ('sample_time', 'sampleTime', _TIMESTAMP),
+    ],
+    _HUMIDITY_SAMPLES: [
+        ('temperature', 'temperature', _FLOAT),
+        ('relative_humidity', 'relativeHumidity', _FLOAT),
+        ('sample_time', 'sampleTime', _TIMESTAMP),
+    ],
+    _CLOUD_CONNECTORS: [
+        ('id', 'id', _STRING),
+        ('signal_strength', 'signalStrength', _FLOAT),
+        ('rssi', 'rssi', _FLOAT),
+    ],
+}
+
+# For each event type, the output column name, eventData field and kind.
+# Numeric fields are stored as float64 so that missing values become NaN.
+_SCHEMAS: dict[str, list[tuple[str, str, str]]] = {
+    dtevents.TOUCH: [],
+    dtevents.TEMPERATURE: [
+        ('celsius', 'value', _FLOAT),
+        ('is_backfilled', 'isBackfilled', _BOOL),
+        ('samples', 'samples', _TEMPERATURE_SAMPLES),
+    ],
+    dtevents.OBJECT_PRESENT: [
+        ('state', 'state', _CATEGORY),
+    ],
+    dtevents.HUMIDITY: [
+        ('celsius', 'temperature', _FLOAT),
+        ('relative_humidity', 'relativeHumidity', _FLOAT),
+        ('is_backfilled', 'isBackfilled', _BOOL),
+        ('samples', 'samples', _HUMIDITY_SAMPLES),
+    ],
+    dtevents.OBJECT_PRESENT_COUNT: [
+        ('total', 'total', _FLOAT),
+    ],
+    dtevents.TOUCH_COUNT: [
+        ('total', 'total', _FLOAT),
+    ],
+    dtevents.WATER_PRESENT: [
+        ('state', 'state', _CATEGORY),
+    ],
+    dtevents.NETWORK_STATUS: [
+        ('signal_strength', 'signalStrength', _FLOAT),
+        ('rssi', 'rssi', _FLOAT),
+        ('transmission_mode', 'transmissionMode', _CATEGORY),
+        ('cloud_connectors', 'cloudConnectors', _CLOUD_CONNECTORS),
+    ],
+    dtevents.BATTERY_STATUS: [
+        ('percentage', 'percentage', _FLOAT),
+    ],
+    dtevents.LABELS_CHANGED: [
+        ('added', 'added', _LABELS),
+        ('modified', 'modified', _LABELS),
+        ('removed', 'removed', _KEYS),
+    ],
+    dtevents.CONNECTION_STATUS: [
+        ('connection', 'connection', _CATEGORY),
+    ],
+    dtevents.ETHERNET_STATUS: [
+        ('mac_address', 'macAddress', _STRING),
+        ('ip_address', 'ipAddress', _STRING),
+    ],
+    dtevents.CELLULAR_STATUS: [
+        ('signal_strength', 'signalStrength', _FLOAT),
+    ],
+    dtevents.CO2: [
+        ('ppm', 'ppm', _FLOAT),
+    ],
+    dtevents.PRESSURE: [
+        ('pascal', 'pascal', _FLOAT),
+    ],
+    dtevents.MOTION: [
+        ('state', 'state', _CATEGORY),
+    ],
+    dtevents.DESK_OCCUPANCY: [
+        ('state', 'state', _CATEGORY),
+    ],
+    dtevents.CONTACT: [
+        ('state', 'state', _CATEGORY),
+    ],
+    dtevents.PROBE_WIRE_STATUS: [
+        ('state', 'state', _CATEGORY),
+    ],
+}
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy  # type: ignore
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            'Missing package `numpy`.\n\n'
+            'Columnar event history requires additional '
+            'third-party packages.\n'
+            '>> pip install disruptive[extra]'
+        )
+    return numpy
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow  # type: ignore
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            'Missing package `pyarrow`.\n\n'
+            'to_arrow() requires additional third-party packages.\n'
+            '>> pip install disruptive[extra]'
+        )
+    return pyarrow
+
+
+def _arrow_type(kind: str) -> Any:
+    pa = _import_pyarrow()
+    if kind == _FLOAT:
+        return pa.float64()
+    elif kind == _BOOL:
+        return pa.bool_()
+    elif kind == _CATEGORY:
+        return pa.dictionary(pa.int32(), pa.string())
+    elif kind == _STRING:
+        return pa.string()
+    elif kind == _LABELS:
+        return pa.map_(pa.string(), pa.string())
+    elif kind == _KEYS:
+        return pa.list_(pa.string())
+    elif kind in _STRUCTS:
+        return pa.list_(pa.struct([
+            (name, _arrow_type(child)) for name, _, child in _STRUCTS[kind]
+        ]))
+    else:
+        return pa.timestamp('ns', tz='UTC')
+
+
+def _nested_array(values: list, kind: str) -> Any:
+    # Converts raw JSON values of a nested kind to an Arrow array.
+    # Timestamps in lists of objects are parsed by Arrow, as a whole.
+    pa = _import_pyarrow()
+    import pyarrow.compute as pc  # type: ignore
+
+    if kind not in _STRUCTS:
+        return pa.array(values, type=_arrow_type(kind))
+
+    fields = _STRUCTS[kind]
+    raw = pa.array(values, type=pa.list_(pa.struct([
+        (field, pa.string() if child == _TIMESTAMP else _arrow_type(child))
+        for _, field, child in fields
+    ])))
+    children = [
+        pc.cast(raw.values.field(i), _arrow_type(child))
+        if child == _TIMESTAMP else raw.values.field(i)
+        for i, (_, _, child) in enumerate(fields)
+    ]
+    return pa.ListArray.from_arrays(
+        raw.offsets,
+        pa.StructArray.from_arrays(
+            children, names=[name for name, _, _ in fields],
+        ),
+        mask=raw.is_null() if raw.null_count > 0 else None,
+    )
+
+
+def arrow_schema(event_type: str) -> Any:
+    """
+    Returns the fixed Arrow schema of an event type, as used by
+    :meth:`EventTable.to_arrow`.
+
+    Parameters
+    ----------
+    event_type : str
+        Type of event.
+
+    Returns
+    -------
+    schema : pyarrow.Schema
+        Name and type of each column.
+
+    """
+
+    pa = _import_pyarrow()
+    return pa.schema([
+        (name, _arrow_type(kind)) for name, kind in _COMMON_COLUMNS + [
+            (name, kind) for name, _, kind in _SCHEMAS.get(event_type, [])
+        ]
+    ])
+
+
+class EventTable():
+    """
+    Events of a single type stored column by column in compact arrays.
+
+    Numeric columns are kept in typed arrays which are exported to NumPy
+    without copying. The `update_time` column holds nanoseconds since
+    epoch, and repeated strings like `device_id` are stored as integer
+    codes into a list of unique values. Nested fields, like samples and
+    labels, are kept as they are until exported.
+
+    Exported arrays are snapshots. If events are appended after an
+    export, the table first moves its columns to new arrays, leaving
+    those already exported unchanged.
+
+    Attributes
+    ----------
+    event_type : str
+        Type of the events in the table.
+
+    """
+
+    def __init__(self, event_type: str) -> None:
+        self.event_type = event_type
+
+        # Fields of eventData, mapped by column name.
+        self._fields = {
+            name: field for name, field, _ in _SCHEMAS.get(event_type, [])
+        }
+
+        # Set once arrays sharing memory with the columns are exported.
+        self._exported = False
+
+        self._kinds: dict[str, str] = {}
+        self._columns: dict[str, Any] = {}
+        self._categories: dict[str, list[str]] = {}
+        self._codes: dict[str, dict[str, int]] = {}
+        for name, kind in _COMMON_COLUMNS + [
+            (name, kind) for name, _, kind in _SCHEMAS.get(event_type, [])
+        ]:
+            self._kinds[name] = kind
+            if kind == _TIMESTAMP:
+                self._columns[name] = array('q')
+            elif kind == _STRING or kind in _NESTED:
+                self._columns[name] = []
+            else:
+                self._columns[name] = array(_TYPECODES[kind])
+            if kind == _CATEGORY:
+                self._categories[name] = []
+                self._codes[name] = {}
+
+    def __len__(self) -> int:
+        return len(self._columns['event_id'])
+
+    def __repr__(self) -> str:
+        return '{}(event_type={}, rows={})'.format(
+            self.__class__.__name__,
+            repr(self.event_type),
+            len(self),
+        )
+
+    def __getitem__(self, key: Any) -> EventTable:
+        # Slices are applied to the arrays directly, while
+        # index arrays and boolean masks go through NumPy.
+        if isinstance(key, slice):
+            return self._derive({
+                name: column[key] for name, column in self._columns.items()
+            })
+        return self.take(key)
+
+    @property
+    def columns(self) -> list[str]:
+        """
+        Names of the columns in the table.
+
+        """
+
+        return list(self._columns)
+
+    def append(self, event: dict) -> None:
+        """
+        Appends a single raw event, as returned by the API.
+
+        Parameters
+        ----------
+        event : dict
+            Unmodified event JSON.
+
+        """
+
+        data = event['data'] or {}
+        data = data.get(self.event_type, data) or {}
+
+        # Arrays can not grow while exported, so they are copied first.
+        if self._exported:
+            self._unshare()
+
+        columns = self._columns
+        self._append_category(
+            'device_id', event['targetName'].rsplit('/', 1)[-1].strip(),
+        )
+        columns['event_id'].append(event['eventId'])
+
+        # Only labelsChanged is missing updateTime in data.
+        timestamp = data.get('updateTime', event.get('timestamp'))
+        columns['update_time'].append(
+            _NAT if timestamp is None else dttrans.to_epoch_ns(timestamp)
+        )
+
+        for name, field in self._fields.items():
+            value = data.get(field)
+            kind = self._kinds[name]
+            if kind == _FLOAT:
+                columns[name].append(
+                    float('nan') if value is None else value
+                )
+            elif kind == _BOOL:
+                # The stream has been known to send booleans as strings.
+                columns[name].append(value is True or value == 'True')
+            elif kind == _CATEGORY:
+                self._append_category(name, value)
+            else:
+                columns[name].append(value)
+
+    def column(self, name: str) -> Any:
+        """
+        Returns a single column as a NumPy array. Numeric columns share
+        memory with the table, and `update_time` is of type datetime64[ns].
+
+        Parameters
+        ----------
+        name : str
+            Name of the column.
+
+        Returns
+        -------
+        column : numpy.ndarray
+            Values of the column.
+
+        """
+
+        np = _import_numpy()
+        self._exported = True
+
+        kind = self._kinds[name]
+        column = self._columns[name]
+        if kind == _STRING:
+            return np.array(column, dtype=object)
+        elif kind in _NESTED:
+            return np.fromiter(column, dtype=object, count=len(column))
+        elif kind == _CATEGORY:
+            categories = np.array(
+                self._categories[name] + [None], dtype=object,
+            )
+            return categories[np.frombuffer(column, dtype=np.int32)]
+        elif kind == _TIMESTAMP:
+            return self._int64(column).view('datetime64[ns]')
+        elif kind == _BOOL:
+            return np.frombuffer(column, dtype=np.int8).view(bool)
+        else:
+            return np.frombuffer(column, dtype=np.float64)
+
+    def to_numpy(self) -> dict[str, Any]:
+        """
+        Exports all columns as NumPy arrays.
+
+        Returns
+        -------
+        columns : dict[str, numpy.ndarray]
+            Arrays of each column, keyed by column name.
+
+        """
+
+        return {name: self.column(name) for name in self._columns}
+
+    def to_pandas(self) -> Any:
+        """
+        Exports the table as a pandas DataFrame. Numeric columns are handed
+        over without copying, and categories become pandas Categoricals.
+
+        Requires the installation of additional packages.
+        >> pip install disruptive[extra]
+
+        Raises
+        ------
+        ModuleNotFoundError
+            If the pandas package is not installed.
+
+        """
+
+        try:
+            import pandas  # type: ignore
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                'Missing package `pandas`.\n\n'
+                'to_pandas() requires additional third-party packages.\n'
+                '>> pip install disruptive[extra]'
+            )
+        np = _import_numpy()
+        self._exported = True
+
+        data: dict[str, Any] = {}
+        for name, kind in self._kinds.items():
+            if kind == _CATEGORY:
+                data[name] = pandas.Categorical.from_codes(
+                    np.frombuffer(self._columns[name], dtype=np.int32),
+                    categories=self._categories[name],
+                )
+            elif kind == _TIMESTAMP:
+                data[name] = pandas.Series(
+                    self.column(name), copy=False,
+                ).dt.tz_localize('UTC')
+            else:
+                data[name] = self.column(name)
+
+        return pandas.DataFrame(data, copy=False)
+
+    def to_polars(self) -> Any:
+        """
+        Exports the table as a polars DataFrame.
+
+        Requires the installation of additional packages.
+        >> pip install disruptive[extra]
+
+        Raises
+        ------
+        ModuleNotFoundError
+            If the polars package is not installed.
+
+        """
+
+        try:
+            import polars as pl  # type: ignore
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                'Missing package `polars`.\n\n'
+                'to_polars() requires additional third-party packages.\n'
+                '>> pip install disruptive[extra]'
+            )
+        self._exported = True
+
+        series = []
+        for name, kind in self._kinds.items():
+            if kind == _TIMESTAMP:
+                series.append(pl.Series(
+                    name, self._int64(self._columns[name]),
+                ).cast(pl.Datetime('ns', 'UTC')))
+            elif kind in _NESTED:
+                series.append(pl.Series(
+                    name, _nested_array(self._columns[name], kind),
+                ))
+            elif kind in (_CATEGORY, _STRING):
+                series.append(pl.Series(
+                    name, self.column(name).tolist(), dtype=pl.String,
+                ))
+            else:
+                series.append(pl.Series(name, self.column(name)))
+
+        return pl.DataFrame(series)
+
+    def to_arrow(self) -> Any:
+        """
+        Exports the table as a pyarrow RecordBatch with the fixed schema
+        of its event type, see :func:`arrow_schema`. Numeric columns and
+        category codes are handed over without copying.
+
+        Requires the installation of additional packages.
+        >> pip install disruptive[extra]
+
+        Raises
+        ------
+        ModuleNotFoundError
+            If the pyarrow package is not installed.
+
+        """
+
+        pa = _import_pyarrow()
+        import pyarrow.compute as pc  # type: ignore
+
+        schema = arrow_schema(self.event_type)
+        n = len(self)
+        self._exported = True
+
+        arrays = []
+        for name, kind in self._kinds.items():
+            column = self._columns[name]
+            if kind == _STRING:
+                arrays.append(pa.array(column, type=pa.string()))
+            elif kind in _NESTED:
+                arrays.append(_nested_array(column, kind))
+            elif kind == _BOOL:
+                arrays.append(pc.cast(pa.Array.from_buffers(
+                    pa.int8(), n, [None, pa.py_buffer(column)],
+                ), pa.bool_()))
+            elif kind == _FLOAT:
+                arrays.append(pa.Array.from_buffers(
+                    pa.float64(), n, [None, pa.py_buffer(column)],
+                ))
+            elif kind == _CATEGORY:
+                indices = _with_nulls(pa.Array.from_buffers(
+                    pa.int32(), n, [None, pa.py_buffer(column)],
+                ), -1)
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    indices, pa.array(self._categories[name], pa.string()),
+                ))
+            else:
+                arrays.append(_with_nulls(pa.Array.from_buffers(
+                    pa.int64(), n, [None, pa.py_buffer(column)],
+                ), _NAT).view(pa.timestamp('ns', tz='UTC')))
+
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def _to_frame(self, index: Any) -> Any:
+        """
+        Exports the table as a pyarrow Table in the layout of
+        :meth:`EventHistory.to_pandas`, with columns named after the
+        eventData fields and one row per temperature sample.
+
+        Parameters
+        ----------
+        index : numpy.ndarray
+            Position of each row in the output, added as the `_index`
+            column so that tables of several event types can be ordered.
+
+        """
+
+        pa = _import_pyarrow()
+        import pyarrow.compute as pc  # type: ignore
+
+        batch = self.to_arrow()
+        columns = {
+            'device_id': batch.column('device_id'),
+            'event_id': batch.column('event_id'),
+            'event_type': pa.DictionaryArray.from_arrays(
+                pa.repeat(pa.scalar(0, pa.int32()), len(self)),
+                pa.array([self.event_type], pa.string()),
+            ),
+            '_index': pa.array(index, pa.int64()),
+        }
+
+        if self.event_type == dtevents.TEMPERATURE:
+            # Each sample is a row of its own, repeating its event.
+            samples = batch.column('samples')
+            parents = pc.list_parent_indices(samples)
+            columns = {n: c.take(parents) for n, c in columns.items()}
+            values = pc.list_flatten(samples)
+            columns['value'] = values.field('value')
+            columns['sample_time'] = values.field('sample_time')
+        else:
+            # Only labelsChanged has no updateTime in its data.
+            if self.event_type != dtevents.LABELS_CHANGED:
+                columns['update_time'] = batch.column('update_time')
+            for name, field, _ in _SCHEMAS.get(self.event_type, []):
+                columns[dttrans.camel_to_snake_case(field)] = \
+                    batch.column(name)
+
+        return pa.table(columns)
+
+    def take(self, indices: Any) -> EventTable:
+        """
+        Selects rows by an array of indices or a boolean mask.
+
+        Parameters
+        ----------
+        indices : array_like
+            Integer positions or a boolean mask of the same length.
+
+        Returns
+        -------
+        table : EventTable
+            New table with the selected rows.
+
+        """
+
+        np = _import_numpy()
+
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+
+        columns: dict[str, Any] = {}
+        for name, column in self._columns.items():
+            if isinstance(column, list):
+                columns[name] = [column[i] for i in indices.tolist()]
+            else:
+                selected = np.frombuffer(column, dtype=column.typecode)
+                columns[name] = array(
+                    column.typecode, selected[indices].tobytes(),
+                )
+
+        return self._derive(columns)
+
+    def filter(self,
+               device_ids: Optional[list[str]] = None,
+               start_time: Optional[str | datetime] = None,
+               end_time: Optional[str | datetime] = None,
+               ) -> EventTable:
+        """
+        Selects rows by source device and time range,
+        using vectorized comparisons.
+
+        Parameters
+        ----------
+        device_ids : list[str], optional
+            If provided, only events from these devices are kept.
+        start_time : str, datetime, optional
+            If provided, only events at or after this time are kept.
+        end_time : str, datetime, optional
+            If provided, only events before this time are kept.
+
+        Returns
+        -------
+        table : EventTable
+            New table with the selected rows.
+
+        """
+
+        np = _import_numpy()
+
+        mask = np.ones(len(self), dtype=bool)
+        if device_ids is not None:
+            codes = [
+                self._codes['device_id'][d] for d in device_ids
+                if d in self._codes['device_id']
+            ]
+            mask &= np.isin(
+                np.frombuffer(self._columns['device_id'], dtype=np.int32),
+                codes,
+            )
+
+        update_time = self._int64(self._columns['update_time'])
+        if start_time is not None:
+            mask &= update_time >= dttrans.to_epoch_ns(start_time)
+        if end_time is not None:
+            mask &= update_time < dttrans.to_epoch_ns(end_time)
+
+        return self.take(mask)
+
+    def between(self,
+                start_time: str | datetime,
+                end_time: str | datetime,
+                ) -> EventTable:
+        """
+        Selects rows in the time range [start_time, end_time).
+        Same as :meth:`filter` with only a time range.
+
+        """
+
+        return self.filter(start_time=start_time, end_time=end_time)
+
+    def _append_category(self, name: str, value: Optional[str]) -> None:
+        # Missing values point one past the last category.
+        if value is None:
+            code = -1
+        else:
+            codes = self._codes[name]
+            code = codes.get(value, -1)
+            if code < 0:
+                code = codes[value] = len(codes)
+                self._categories[name].append(value)
+        self._columns[name].append(code)
+
+    def _derive(self, columns: dict[str, Any]) -> EventTable:
+        # New table sharing the category lists of this one.
+        table = EventTable.__new__(EventTable)
+        table.event_type = self.event_type
+        table._exported = False
+        table._fields = self._fields
+        table._kinds = self._kinds
+        table._columns = columns
+        table._categories = {
+            name: list(c) for name, c in self._categories.items()
+        }
+        table._codes = {name: dict(c) for name, c in self._codes.items()}
+        return table
+
+    def _unshare(self) -> None:
+        # Exported arrays keep the memory of the old columns.
+        for name, column in self._columns.items():
+            if isinstance(column, array):
+                self._columns[name] = array(column.typecode, column)
+        self._exported = False
+
+    @staticmethod
+    def _int64(column: array) -> Any:
+        np = _import_numpy()
+        return np.frombuffer(column, dtype=np.int64)
+
+
+def _with_nulls(values: Any, missing: int) -> Any:
+    # Replaces the value used for missing entries with nulls.
+    # The array is only copied if at least one entry is missing.
+    pa = _import_pyarrow()
+    import pyarrow.compute as pc  # type: ignore
+
+    is_missing = pc.equal(values, missing)
+    if not pc.any(is_missing).as_py():
+        return values
+    return pc.if_else(is_missing, pa.scalar(None, values.type), values)
+
+
+class ColumnarEventHistory():
+    """
+    Event history stored column by column, with one
+    :class:`EventTable` per event type.
+
+    Unlike :class:`EventHistory`, no object is created per event, which
+    keeps memory use low and lets long histories be exported to NumPy,
+    pandas, or polars without converting row by row.
+
+    Parameters
+    ----------
+    events : Iterable[dict], optional
+        Raw events, as returned by the API, to add to the history.
+
+    Examples
+    --------
+    >>> # Fetch 30 days of temperature events and select a single day.
+    >>> history = dt.EventHistory.list_events_columnar(
+    ...     device_id='<DEVICE_ID>',
+    ...     project_id='<PROJECT_ID>',
+    ...     event_types=[dt.events.TEMPERATURE],
+    ...     start_time=datetime.utcnow() - timedelta(30),
+    ... )
+    >>> day = history[dt.events.TEMPERATURE].between(
+    ...     '2024-01-01T00:00:00Z',
+    ...     '2024-01-02T00:00:00Z',
+    ... )
+    >>> celsius = day.column('celsius')
+
+    """
+
+    def __init__(self, events: Iterable[dict] = ()) -> None:
+        self.tables: dict[str, EventTable] = {}
+        self.extend(events)
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self.tables.values())
+
+    def __repr__(self) -> str:
+        return '{}({})'.format(
+            self.__class__.__name__,
+            ', '.join(
+                '{}={}'.format(event_type, len(table))
+                for event_type, table in self.tables.items()
+            ),
+        )
+
+    def __contains__(self, event_type: str) -> bool:
+        return event_type in self.tables
+
+    def __getitem__(self, event_type: str) -> EventTable:
+        return self.tables[event_type]
+
+    def __iter__(self) -> Iterator[EventTable]:
+        return iter(self.tables.values())
+
+    @property
+    def event_types(self) -> list[str]:
+        """
+        Event types with at least one event in the history.
+
+        """
+
+        return list(self.tables)
+
+    def append(self, event: dict) -> None:
+        """
+        Appends a single raw event, as returned by the API.
+
+        """
+
+        event_type = event['eventType']
+        table = self.tables.get(event_type)
+        if table is None:
+            table = self.tables[event_type] = EventTable(event_type)
+        table.append(event)
+
+    def extend(self, events: Iterable[dict]) -> None:
+        """
+        Appends raw events, as returned by the API.
+
+        """
+
+        for event in events:
+            self.append(event)
+
+    def filter(self,
+               event_types: Optional[list[str]] = None,
+               device_ids: Optional[list[str]] = None,
+               start_time: Optional[str | datetime] = None,
+               end_time: Optional[str | datetime] = None,
+               ) -> ColumnarEventHistory:
+        """
+        Selects events by type, source device, and time range.
+        See :meth:`EventTable.filter`.
+
+        Returns
+        -------
+        history : ColumnarEventHistory
+            New history with the selected events.
+
+        """
+
+        history = ColumnarEventHistory()
+        for event_type, table in self.tables.items():
+            if event_types is None or event_type in event_types:
+                history.tables[event_type] = table.filter(
+                    device_ids, start_time, end_time,
+                )
+        return history
+
+    def to_pandas(self) -> dict[str, Any]:
+        """
+        Exports each event type as a pandas DataFrame.
+        See :meth:`EventTable.to_pandas`.
+
+        Returns
+        -------
+        frames : dict[str, pandas.DataFrame]
+            DataFrame of each event type, keyed by event type.
+
+        """
+
+        return {t: table.to_pandas() for t, table in self.tables.items()}
+
+    def to_polars(self) -> dict[str, Any]:
+        """
+        Exports each event type as a polars DataFrame.
+        See :meth:`EventTable.to_polars`.
+
+        Returns
+        -------
+        frames : dict[str, polars.DataFrame]
+            DataFrame of each event type, keyed by event type.
+
+        """
+
+        return {t: table.to_polars() for t, table in self.tables.items()}
+
+    def to_arrow(self) -> dict[str, Any]:
+        """
+        Exports each event type as a pyarrow RecordBatch.
+        See :meth:`EventTable.to_arrow`.
+
+        Returns
+        -------
+        batches : dict[str, pyarrow.RecordBatch]
+            RecordBatch of each event type, keyed by event type.
+
+        """
+
+        return {t: table.to_arrow() for t, table in self.tables.items()}
+
+    def to_arrow_table(self) -> Any:
+        """
+        Exports all event types as a single pyarrow Table, with an added
+        `event_type` column. Columns missing from an event type are null.
+
+        Events are grouped by event type, in the order of
+        :attr:`event_types`.
+
+        Returns
+        -------
+        table : pyarrow.Table
+            Events of all types in a single table.
+
+        """
+
+        pa = _import_pyarrow()
+
+        tables = []
+        for event_type, batch in self.to_arrow().items():
+            event_types = pa.DictionaryArray.from_arrays(
+                pa.repeat(pa.scalar(0, pa.int32()), batch.num_rows),
+                pa.array([event_type], pa.string()),
+            )
+            tables.append(pa.Table.from_batches([batch]).add_column(
+                2, 'event_type', event_types,
+            ))
+
+        if len(tables) == 0:
+            return pa.table({})
+
+        return pa.concat_tables(tables, promote_options='default')
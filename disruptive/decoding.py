@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+import importlib
+from typing import Any, Callable
+
+import disruptive as dt
+import disruptive.errors as dterrors
+
+# Known decoder backends, in order of preference for "auto".
+AUTO = 'auto'
+BACKENDS = ['orjson', 'ujson', 'json']
+
+# Resolved loads function of each decoder setting.
+_decoders: dict[str, Callable[[bytes | str], Any]] = {}
+
+
+def get_decoder(name: str) -> Callable[[bytes | str], Any]:
+    """
+    Returns the loads function of a JSON decoder backend.
+
+    Parameters
+    ----------
+    name : str
+        One of "orjson", "ujson", or "json", or "auto" for the
+        fastest one installed, falling back to the standard library.
+
+    Returns
+    -------
+    loads : Callable[[bytes | str], Any]
+        Decodes a JSON document from bytes or str.
+
+    Raises
+    ------
+    ConfigurationError
+        If the backend is not known.
+    ModuleNotFoundError
+        If the backend is not installed.
+
+    """
+
+    decoder = _decoders.get(name)
+    if decoder is not None:
+        return decoder
+
+    if name == AUTO:
+        # The standard library is used if no faster backend is installed.
+        decoder = json.loads
+        for backend in BACKENDS[:-1]:
+            try:
+                decoder = _import_loads(backend)
+                break
+            except ModuleNotFoundError:
+                continue
+    elif name in BACKENDS:
+        try:
+            decoder = _import_loads(name)
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                'Missing package `{}`.\n\n'
+                'The json_decoder setting requires additional '
+                'third-party packages.\n'
+                '>> pip install {}'.format(name, name)
+            )
+    else:
+        raise dterrors.ConfigurationError(
+            'Configuration parameter json_decoder has value {}, but must '
+            'be one of {}.'.format(name, [AUTO] + BACKENDS)
+        )
+
+    _decoders[name] = decoder
+    return decoder
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Decodes a JSON document with the backend set by the
+    package-wide `json_decoder` setting.
+
+    Bytes are decoded directly, without first decoding them to str.
+    Invalid documents raise a ValueError for every backend.
+
+    """
+
+    return get_decoder(dt.json_decoder)(data)
+
+
+def _import_loads(backend: str) -> Callable[[bytes | str], Any]:
+    if backend == 'json':
+        return json.loads
+    loads: Callable[[bytes | str], Any] = importlib.import_module(
+        backend
+    ).loads
+    return loads
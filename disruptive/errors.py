@@ -192,11 +192,21 @@ class TooManyRequests(UsageError):
     The response contained a status code of 429.
     https://developer.d21s.com/docs/error-codes#429
 
+    Attributes
+    ----------
+    retry_after : int, None
+        Seconds to wait before retrying, if given by the Retry-After header.
+
     """
 
-    def __init__(self, message: str | dict) -> None:
+    def __init__(self,
+                 message: str | dict,
+                 retry_after: Optional[int] = None,
+                 ) -> None:
         super().__init__(message)
 
+        self.retry_after = retry_after
+
 
 class FormatError(UsageError):
     """
@@ -241,6 +251,28 @@ class ReadTimeout(ConnectionError):
         super().__init__(message)
 
 
+class CircuitBreakerOpen(ConnectionError):
+    """
+    The request was not sent, as the circuit breaker of its base URL
+    is open after repeated server or connection errors.
+
+    Attributes
+    ----------
+    retry_after : float, None
+        Seconds until the circuit lets a probe request through.
+        Streams wait this long before reconnecting.
+
+    """
+
+    def __init__(self,
+                 message: str | dict,
+                 retry_after: Optional[float] = None,
+                 ) -> None:
+        super().__init__(message)
+
+        self.retry_after = retry_after
+
+
 # ------------------------- UnknownError -------------------------
 class UnknownError(DTApiError):
     """
@@ -338,8 +370,9 @@ def parse_request_error(caught_error: Exception,
         Exception to be raised.
     should_retry : bool
         If the request should be retried or not.
-    nth_attempt : int
-        Iterated attempt count.
+    sleeptime : int
+        Deprecated, and no longer used by the package. Retries now
+        sleep as decided by :class:`~disruptive.RetryPolicy`.
 
     """
 
@@ -370,7 +403,7 @@ def parse_api_status_code(status_code: Optional[int],
                           ) -> Any:
     """
     Depending on the status code, returns an exception, retry boolean
-    and, incemented retry attempt.
+    and, a deprecated sleeptime.
 
     Parameters
     ----------
@@ -389,8 +422,10 @@ def parse_api_status_code(status_code: Optional[int],
         The exception to be raised.
     should_retry : bool
         If the request should be retried.
-    nth_attempt : int
-        Incremented retry attempt count.
+    sleeptime : int
+        Deprecated, and no longer used by the package. Retries now
+        sleep as decided by :class:`~disruptive.RetryPolicy`, which
+        waits out the `retry_after` of a :class:`TooManyRequests`.
 
     """
 
@@ -418,11 +453,8 @@ def parse_api_status_code(status_code: Optional[int],
         return Conflict(data), False, None
     elif status_code == 429:
         if 'Retry-After' in headers:
-            return (
-                TooManyRequests(data),
-                True,
-                int(headers['Retry-After']),
-            )
+            retry_after = int(headers['Retry-After'])
+            return TooManyRequests(data, retry_after), True, retry_after
         else:
             return TooManyRequests(data), False, None
     elif status_code == 500:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional, Union
+from typing import Optional, Union, Any
 
 import disruptive
 import disruptive.logging as dtlog
@@ -49,6 +49,8 @@ class _EventData(dtoutputs.OutputBase):
 
     """
 
+    __slots__ = ('timestamp', 'event_type')
+
     def __init__(self, data: dict, event_type: str) -> None:
         """
         Constructs the _EventData object by inheriting parent.
@@ -66,16 +68,15 @@ class _EventData(dtoutputs.OutputBase):
 
         # If timestamp is provided, verify type and set attribute.
         if 'updateTime' in data:
-            # Raw should be iso8601 str format, while
-            # attribute should be type datetime.
-            ts_iso8601 = dttrans.to_iso8601(data['updateTime'])
+            # Raw should be iso8601 str format, while attribute should be
+            # type datetime. Strings are validated once by the conversion.
             ts_datetime = dttrans.to_datetime(data['updateTime'])
 
             # If we can not verify iso8601 format, remove field.
-            if ts_iso8601 is not None:
-                data['updateTime'] = ts_iso8601
-            else:
+            if ts_datetime is None:
                 del data['updateTime']
+            elif not isinstance(data['updateTime'], str):
+                data['updateTime'] = dttrans.to_iso8601(ts_datetime)
 
             # Set datetime return as timestamp attribute.
             self.timestamp = ts_datetime
@@ -161,6 +162,8 @@ class Touch(_EventData):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, timestamp: Optional[datetime | str] = None):
         """
         Constructs the Touch object.
@@ -206,13 +209,11 @@ class Touch(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'touch')
 
         return obj
 
@@ -242,6 +243,8 @@ class Temperature(_EventData):
 
     """
 
+    __slots__ = ('celsius', 'samples', 'fahrenheit', 'is_backfilled')
+
     def __init__(self,
                  celsius: float,
                  samples: Optional[list] = None,
@@ -312,21 +315,17 @@ class Temperature(_EventData):
         # Convert samples dictionaries to TemperatureSample objects.
         sample_objs = []
         for sample in data['samples']:
-            sample_objs.append(TemperatureSample(
-                celsius=sample['value'],
-                timestamp=sample['sampleTime'],
-            ))
-
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            celsius=data['value'],
-            samples=sample_objs,
-            is_backfilled=data['isBackfilled'],
-            timestamp=data['updateTime'],
-        )
+            sample_objs.append(TemperatureSample._from_raw(sample))
+
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.celsius = data['value']
+        obj.samples = sample_objs
+        obj.fahrenheit = dttrans._celsius_to_fahrenheit(data['value'])
+        obj.is_backfilled = data['isBackfilled']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'temperature')
 
         return obj
 
@@ -358,6 +357,8 @@ class TemperatureSample(dtoutputs.OutputBase):
 
     """
 
+    __slots__ = ('celsius', 'fahrenheit', 'timestamp')
+
     def __init__(self,
                  celsius: float,
                  timestamp: datetime | str,
@@ -398,11 +399,11 @@ class TemperatureSample(dtoutputs.OutputBase):
 
     @classmethod
     def _from_raw(cls, data: dict) -> TemperatureSample:
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            celsius=data['value'],
-            timestamp=data['sampleTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.celsius = data['value']
+        obj.fahrenheit = dttrans._celsius_to_fahrenheit(data['value'])
+        obj.timestamp = dttrans.to_datetime(data['sampleTime'])
 
         # Inherit parent class.
         dtoutputs.OutputBase.__init__(obj, data)
@@ -431,6 +432,8 @@ class ObjectPresent(_EventData):
 
     """
 
+    __slots__ = ('state',)
+
     STATE_PRESENT = 'PRESENT'
     STATE_NOT_PRESENT = 'NOT_PRESENT'
 
@@ -488,14 +491,12 @@ class ObjectPresent(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            state=data['state'],
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.state = data['state']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'objectPresent')
 
         return obj
 
@@ -526,6 +527,14 @@ class Humidity(_EventData):
 
     """
 
+    __slots__ = (
+        'celsius',
+        'fahrenheit',
+        'relative_humidity',
+        'samples',
+        'is_backfilled',
+    )
+
     def __init__(self,
                  celsius: float,
                  relative_humidity: float,
@@ -602,23 +611,18 @@ class Humidity(_EventData):
         # Convert samples dictionaries to HumiditySample objects.
         sample_objs = []
         for sample in data['samples']:
-            sample_objs.append(HumiditySample(
-                celsius=sample['temperature'],
-                relative_humidity=sample['relativeHumidity'],
-                timestamp=sample['sampleTime'],
-            ))
-
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            celsius=data['temperature'],
-            relative_humidity=data['relativeHumidity'],
-            samples=sample_objs,
-            is_backfilled=data['isBackfilled'],
-            timestamp=data['updateTime'],
-        )
+            sample_objs.append(HumiditySample._from_raw(sample))
+
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.celsius = data['temperature']
+        obj.fahrenheit = dttrans._celsius_to_fahrenheit(data['temperature'])
+        obj.relative_humidity = data['relativeHumidity']
+        obj.samples = sample_objs
+        obj.is_backfilled = data['isBackfilled']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'humidity')
 
         return obj
 
@@ -652,6 +656,8 @@ class HumiditySample(dtoutputs.OutputBase):
 
     """
 
+    __slots__ = ('celsius', 'fahrenheit', 'relative_humidity', 'timestamp')
+
     def __init__(self,
                  celsius: float,
                  relative_humidity: float,
@@ -698,12 +704,12 @@ class HumiditySample(dtoutputs.OutputBase):
 
     @classmethod
     def _from_raw(cls, data: dict) -> HumiditySample:
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            celsius=data['temperature'],
-            relative_humidity=data['relativeHumidity'],
-            timestamp=data['sampleTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.celsius = data['temperature']
+        obj.fahrenheit = dttrans._celsius_to_fahrenheit(data['temperature'])
+        obj.relative_humidity = data['relativeHumidity']
+        obj.timestamp = dttrans.to_datetime(data['sampleTime'])
 
         # Inherit parent class.
         dtoutputs.OutputBase.__init__(obj, data)
@@ -735,6 +741,8 @@ class ObjectPresentCount(_EventData):
 
     """
 
+    __slots__ = ('total',)
+
     def __init__(self,
                  total: int,
                  timestamp: Optional[datetime | str] = None,
@@ -789,14 +797,12 @@ class ObjectPresentCount(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            total=data['total'],
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.total = data['total']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'objectPresentCount')
 
         return obj
 
@@ -822,6 +828,8 @@ class TouchCount(_EventData):
 
     """
 
+    __slots__ = ('total',)
+
     def __init__(self,
                  total: int,
                  timestamp: Optional[datetime | str] = None,
@@ -876,14 +884,12 @@ class TouchCount(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            total=data['total'],
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.total = data['total']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'touchCount')
 
         return obj
 
@@ -908,6 +914,8 @@ class WaterPresent(_EventData):
 
     """
 
+    __slots__ = ('state',)
+
     STATE_PRESENT = 'PRESENT'
     STATE_NOT_PRESENT = 'NOT_PRESENT'
 
@@ -964,14 +972,12 @@ class WaterPresent(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            state=data['state'],
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.state = data['state']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'waterPresent')
 
         return obj
 
@@ -1000,6 +1006,8 @@ class NetworkStatusCloudConnector(dtoutputs.OutputBase):
 
     """
 
+    __slots__ = ('device_id', 'signal_strength', 'rssi')
+
     def __init__(self,
                  device_id: str,
                  signal_strength: int,
@@ -1060,14 +1068,13 @@ class NetworkStatusCloudConnector(dtoutputs.OutputBase):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            device_id=data['id'],
-            signal_strength=data['signalStrength'],
-            rssi=data['rssi'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.device_id = data['id']
+        obj.signal_strength = data['signalStrength']
+        obj.rssi = data['rssi']
 
-        # Re-inherit from parent, but now providing response data.
+        # Inherit parent class.
         dtoutputs.OutputBase.__init__(obj, data)
 
         return obj
@@ -1095,6 +1102,13 @@ class NetworkStatus(_EventData):
 
     """
 
+    __slots__ = (
+        'signal_strength',
+        'rssi',
+        'transmission_mode',
+        'cloud_connectors',
+    )
+
     def __init__(self,
                  signal_strength: Optional[int] = None,
                  rssi: Optional[int] = None,
@@ -1179,17 +1193,15 @@ class NetworkStatus(_EventData):
                 NetworkStatusCloudConnector._from_raw(ccon)
             )
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            signal_strength=data['signalStrength'],
-            rssi=data['rssi'],
-            transmission_mode=data['transmissionMode'],
-            cloud_connectors=cloud_connectors,
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.signal_strength = data['signalStrength']
+        obj.rssi = data['rssi']
+        obj.transmission_mode = data['transmissionMode']
+        obj.cloud_connectors = cloud_connectors
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'networkStatus')
 
         return obj
 
@@ -1229,6 +1241,8 @@ class BatteryStatus(_EventData):
 
     """
 
+    __slots__ = ('percentage',)
+
     def __init__(self,
                  percentage: int,
                  timestamp: Optional[datetime | str] = None,
@@ -1282,14 +1296,12 @@ class BatteryStatus(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            percentage=data['percentage'],
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.percentage = data['percentage']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'batteryStatus')
 
         return obj
 
@@ -1319,6 +1331,8 @@ class LabelsChanged(_EventData):
 
     """
 
+    __slots__ = ('added', 'modified', 'removed')
+
     def __init__(self,
                  added: dict[str, str],
                  modified: dict[str, str],
@@ -1384,16 +1398,14 @@ class LabelsChanged(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            added=data['added'],
-            modified=data['modified'],
-            removed=data['removed'],
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.added = data['added']
+        obj.modified = data['modified']
+        obj.removed = data['removed']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'labelsChanged')
 
         return obj
 
@@ -1430,6 +1442,8 @@ class ConnectionStatus(_EventData):
 
     """
 
+    __slots__ = ('connection', 'available')
+
     CONNECTION_SDS: str = 'SDS'
     CONNECTION_ETHERNET: str = 'ETHERNET'
     CONNECTION_CELLULAR: str = 'CELLULAR'
@@ -1498,15 +1512,13 @@ class ConnectionStatus(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            connection=data['connection'],
-            available=data['available'],
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.connection = data['connection']
+        obj.available = data['available']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'connectionStatus')
 
         return obj
 
@@ -1536,6 +1548,8 @@ class EthernetStatus(_EventData):
 
     """
 
+    __slots__ = ('mac_address', 'ip_address')
+
     def __init__(self,
                  mac_address: str,
                  ip_address: str,
@@ -1596,15 +1610,13 @@ class EthernetStatus(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            mac_address=data['macAddress'],
-            ip_address=data['ipAddress'],
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.mac_address = data['macAddress']
+        obj.ip_address = data['ipAddress']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'ethernetStatus')
 
         return obj
 
@@ -1632,6 +1644,8 @@ class CellularStatus(_EventData):
 
     """
 
+    __slots__ = ('signal_strength',)
+
     def __init__(self,
                  signal_strength: int,
                  timestamp: Optional[datetime | str] = None,
@@ -1685,14 +1699,12 @@ class CellularStatus(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            signal_strength=data['signalStrength'],
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.signal_strength = data['signalStrength']
 
-        # Re-inherit from parent using a full raw dictionary.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'cellularStatus')
 
         return obj
 
@@ -1718,6 +1730,8 @@ class Co2(_EventData):
 
     """
 
+    __slots__ = ('ppm',)
+
     def __init__(self,
                  ppm: int,
                  timestamp: Optional[datetime | str] = None,
@@ -1771,14 +1785,12 @@ class Co2(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            ppm=data['ppm'],
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.ppm = data['ppm']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'co2')
 
         return obj
 
@@ -1804,6 +1816,8 @@ class Pressure(_EventData):
 
     """
 
+    __slots__ = ('pascal',)
+
     def __init__(self,
                  pascal: float,
                  timestamp: Optional[datetime | str] = None,
@@ -1857,14 +1871,12 @@ class Pressure(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            pascal=data['pascal'],
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.pascal = data['pascal']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'pressure')
 
         return obj
 
@@ -1890,6 +1902,8 @@ class Motion(_EventData):
 
     """
 
+    __slots__ = ('state',)
+
     STATE_MOTION_DETECTED = 'MOTION_DETECTED'
     STATE_NO_MOTION_DETECTED = 'NO_MOTION_DETECTED'
 
@@ -1947,14 +1961,12 @@ class Motion(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            state=data['state'],
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.state = data['state']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'motion')
 
         return obj
 
@@ -1984,6 +1996,8 @@ class DeskOccupancy(_EventData):
 
     """
 
+    __slots__ = ('state', 'remarks')
+
     STATE_OCCUPIED = 'OCCUPIED'
     STATE_NOT_OCCUPIED = 'NOT_OCCUPIED'
 
@@ -2049,15 +2063,13 @@ class DeskOccupancy(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            state=data['state'],
-            timestamp=data['updateTime'],
-            remarks=data['remarks'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.state = data['state']
+        obj.remarks = data['remarks']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'deskOccupancy')
 
         return obj
 
@@ -2085,6 +2097,8 @@ class Contact(_EventData):
 
     """
 
+    __slots__ = ('state',)
+
     STATE_CLOSED: str = 'CLOSED'
     STATE_OPEN: str = 'OPEN'
 
@@ -2141,14 +2155,12 @@ class Contact(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            state=data['state'],
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.state = data['state']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'contact')
 
         return obj
 
@@ -2172,6 +2184,8 @@ class ProbeWireStatus(_EventData):
 
     """
 
+    __slots__ = ('state',)
+
     STATE_INVALID_WIRE_CONFIGURATION: str = 'INVALID_WIRE_CONFIGURATION'
     STATE_INVALID_COEFFICIENT_CONFIGURATION: str \
         = 'INVALID_COEFFICIENT_CONFIGURATION'
@@ -2234,14 +2248,12 @@ class ProbeWireStatus(_EventData):
 
         """
 
-        # Construct the object with unpacked parameters.
-        obj = cls(
-            state=data['state'],
-            timestamp=data['updateTime'],
-        )
+        # Set attributes directly, skipping the repack in the constructor.
+        obj = cls.__new__(cls)
+        obj.state = data['state']
 
-        # Re-inherit from parent, but now providing response data.
-        _EventData.__init__(obj, data, obj.event_type)
+        # Inherit parent class, which also sets the timestamp.
+        _EventData.__init__(obj, data, 'probeWireStatus')
 
         return obj
 
@@ -2270,20 +2282,52 @@ class Event(dtoutputs.OutputBase):
         Unique ID of the source project.
     data : :ref:`Event Data <eventdata>`
         An object representing type-specific event data.
+        If constructed with `lazy`, it is decoded on first access.
     raw : dict[str, str]
         Unmodified API response JSON.
 
     """
 
-    def __init__(self, event: dict):
+    __slots__ = (
+        'event_id',
+        'event_type',
+        'device_id',
+        'project_id',
+        'data',
+    )
+
+    def __init__(self, event: dict, lazy: bool = False):
         # Inherit attributes from ResponseBase parent.
         dtoutputs.OutputBase.__init__(self, event)
 
         # Unpack attributes from dictionary.
         self.event_id: str = event['eventId']
         self.event_type: str = event['eventType']
-        self.device_id: str = event['targetName'].split('/')[-1]
-        self.project_id: str = event['targetName'].split('/')[1]
+        target_name = event['targetName'].split('/')
+        self.device_id: str = target_name[-1]
+        self.project_id: str = target_name[1]
+
+        # In lazy mode, data is left for __getattr__ to decode.
+        if not lazy:
+            self.data = self._decode_data()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached while data has not yet been decoded in lazy mode.
+        if name == 'data':
+            self.data = self._decode_data()
+            return self.data
+
+        raise AttributeError('{} object has no attribute {}'.format(
+            repr(self.__class__.__name__), repr(name),
+        ))
+
+    def __str__(self) -> str:
+        # Make sure lazy data is decoded before it is printed.
+        self.data
+        return dtoutputs.OutputBase.__str__(self)
+
+    def _decode_data(self) -> Optional[_EventType]:
+        event = self._raw
 
         # Since labelsChanged is the only event that does not
         # contain an updateTime field in data, we provide the
@@ -2292,13 +2336,16 @@ class Event(dtoutputs.OutputBase):
             event['data']['updateTime'] = event['timestamp']
 
         # Initialize the appropriate data class.
-        self.data = _EventData.from_event_type(
+        return _EventData.from_event_type(
             event['data'],
             self.event_type,
         )
 
     @classmethod
-    def from_mixed_list(cls, events: list[dict]) -> list[Event]:
+    def from_mixed_list(cls,
+                        events: list[dict],
+                        lazy: bool = False,
+                        ) -> list[Event]:
         """
         Construct Event objects for each event in list.
 
@@ -2306,6 +2353,8 @@ class Event(dtoutputs.OutputBase):
         ----------
         events : list[dict]
             List of raw event response dictionaries.
+        lazy : bool, optional
+            If True, the data of each event is decoded on first access.
 
         Returns
         -------
@@ -2320,7 +2369,7 @@ class Event(dtoutputs.OutputBase):
         # Iterate events in list.
         for event in events:
             # Initialize instance and append to output.
-            object_list.append(cls(event))
+            object_list.append(cls(event, lazy))
 
         return object_list
 
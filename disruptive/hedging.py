@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import os
+import math
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import disruptive.errors as dterrors
+
+# Executors running hedged requests, keyed by process.
+_executors: dict[int, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+# Maximum number of hedged requests in flight per process.
+_MAX_WORKERS = 32
+
+
+class HedgePolicy():
+    """
+    Opt-in hedging of idempotent GET requests to cut tail latency.
+
+    When a request has not been answered within the `percentile` of
+    recent response times to the same endpoint, an identical request
+    is sent, and whichever answers first is used. As only requests
+    slower than the percentile are hedged, the extra load is about
+    100 - `percentile` percent, and never more than `max_rate`.
+
+    The package-wide policy is `disruptive.hedge_policy`. Single calls
+    can override it with the `hedge_policy` keyword argument.
+
+    Parameters
+    ----------
+    percentile : float, optional
+        Percentile of response times after which a request is hedged.
+    max_rate : float, optional
+        Highest share of requests that may be hedged.
+    window : int, optional
+        Number of most recent response times of each endpoint
+        the percentile is taken over.
+    min_samples : int, optional
+        Response times needed for an endpoint before hedging it.
+    min_delay : float, optional
+        Shortest delay before hedging, in seconds.
+
+    Attributes
+    ----------
+    requests : int
+        Number of requests sent through the policy.
+    hedged : int
+        Number of requests that were hedged.
+    hedge_wins : int
+        Number of hedged requests answered first by the hedge.
+
+    """
+
+    def __init__(self,
+                 percentile: float = 95.0,
+                 max_rate: float = 0.05,
+                 window: int = 200,
+                 min_samples: int = 20,
+                 min_delay: float = 0.01,
+                 ) -> None:
+        # Check that 0 < percentile < 100 and 0 <= max_rate <= 1.
+        if not 0 < percentile < 100 or not 0 <= max_rate <= 1:
+            raise dterrors.ConfigurationError(
+                'Hedge policy has percentile {} and max_rate {}, but must '
+                'have percentile in (0, 100) and max_rate in [0, 1].'.format(
+                    percentile, max_rate,
+                )
+            )
+
+        # Check that 0 < min_samples <= window.
+        if not 0 < min_samples <= window:
+            raise dterrors.ConfigurationError(
+                'Hedge policy has min_samples {} and window {}, but must '
+                'have min_samples greater than 0 and at most window.'.format(
+                    min_samples, window,
+                )
+            )
+
+        self.percentile = percentile
+        self.max_rate = max_rate
+        self.window = window
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+        self._lock = threading.Lock()
+        self._latencies: dict[str, deque[float]] = {}
+
+        # Hedges earned, where each request earns max_rate of one.
+        self._balance = 0.0
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """
+        Counts a request to an endpoint and returns how long to wait
+        for its response before hedging it.
+
+        Parameters
+        ----------
+        endpoint : str
+            Key of the endpoint, like its base URL and template.
+
+        Returns
+        -------
+        delay : float, None
+            Seconds to wait, or None if the endpoint does not yet
+            have enough response times to hedge it.
+
+        """
+
+        with self._lock:
+            self.requests += 1
+            self._balance = min(1.0, self._balance + self.max_rate)
+
+            latencies = self._latencies.get(endpoint)
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+            ordered = sorted(latencies)
+
+        # Nearest-rank percentile.
+        rank = math.ceil(self.percentile / 100 * len(ordered)) - 1
+        return max(self.min_delay, ordered[rank])
+
+    def allow(self) -> bool:
+        """
+        Claims a hedge, returning False if it would
+        exceed the maximum hedge rate.
+
+        """
+
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            self.hedged += 1
+            return True
+
+    def record_win(self) -> None:
+        """
+        Counts a hedged request answered first by the hedge.
+
+        """
+
+        with self._lock:
+            self.hedge_wins += 1
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """
+        Records the response time of a request to an endpoint.
+
+        """
+
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = deque(maxlen=self.window)
+                self._latencies[endpoint] = latencies
+            latencies.append(latency)
+
+
+def executor() -> ThreadPoolExecutor:
+    """
+    Returns the package-wide executor running hedged requests,
+    creating it on first use in each process.
+
+    """
+
+    pid = os.getpid()
+    with _executors_lock:
+        if pid not in _executors:
+            _executors[pid] = ThreadPoolExecutor(
+                max_workers=_MAX_WORKERS,
+                thread_name_prefix='disruptive-hedge',
+            )
+        return _executors[pid]
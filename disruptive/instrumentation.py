@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Optional, Any, Iterable
+
+import disruptive.logging as dtlog
+
+# Upper bounds of the default histogram buckets.
+DURATION_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+SIZE_BUCKETS = (
+    256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304,
+)
+
+
+class Hooks():
+    """
+    Receives callbacks as requests are sent and stream events arrive.
+
+    Subclass and override the methods of interest, then add an
+    instance to the package-wide `disruptive.hooks` list. Hooks are
+    called synchronously from the requesting thread or event loop, so
+    they should return quickly. Errors raised by a hook are logged and
+    otherwise ignored.
+
+    Endpoints are given as templates with resource IDs replaced by
+    "{}", like "/projects/{}/devices/{}", for use as metric labels.
+
+    """
+
+    def on_request_start(self,
+                         method: str,
+                         endpoint: str,
+                         attempt: int,
+                         ) -> None:
+        """
+        Called before each attempt at sending a request,
+        including stream connections.
+
+        Parameters
+        ----------
+        method : str
+            Request method.
+        endpoint : str
+            Templated endpoint URL.
+        attempt : int
+            Attempt number, where 0 is the first.
+
+        """
+
+    def on_response(self,
+                    method: str,
+                    endpoint: str,
+                    status_code: Optional[int],
+                    duration: float,
+                    attempt: int,
+                    size: int,
+                    error: Optional[Exception],
+                    ) -> None:
+        """
+        Called after each attempt at sending a request.
+
+        Parameters
+        ----------
+        method : str
+            Request method.
+        endpoint : str
+            Templated endpoint URL.
+        status_code : int, None
+            Response status code, or None if no response was received.
+        duration : float
+            Seconds from sending the request until the response was read.
+        attempt : int
+            Attempt number, where 0 is the first.
+        size : int
+            Response body size in bytes.
+        error : Exception, None
+            Error of the attempt, if any.
+
+        """
+
+    def on_retry(self,
+                 method: str,
+                 endpoint: str,
+                 attempt: int,
+                 sleeptime: float,
+                 error: Exception,
+                 ) -> None:
+        """
+        Called before sleeping ahead of a retry or stream reconnect.
+
+        Parameters
+        ----------
+        method : str
+            Request method.
+        endpoint : str
+            Templated endpoint URL.
+        attempt : int
+            Number of the attempt about to be made.
+        sleeptime : float
+            Seconds slept before the attempt.
+        error : Exception
+            Error that caused the retry.
+
+        """
+
+    def on_stream_event(self,
+                        endpoint: str,
+                        event_type: str,
+                        size: int,
+                        ) -> None:
+        """
+        Called for each event, including pings, received on a stream.
+
+        Parameters
+        ----------
+        endpoint : str
+            Templated endpoint URL.
+        event_type : str
+            Type of the received event.
+        size : int
+            Size of the received line in bytes.
+
+        """
+
+
+def emit(hooks: Iterable[Hooks], name: str, **kwargs: Any) -> None:
+    """
+    Calls the method `name` of every hook, logging
+    rather than raising any errors.
+
+    """
+
+    for hook in hooks:
+        try:
+            getattr(hook, name)(**kwargs)
+        except Exception as e:
+            dtlog.warning('Hook {}.{} raised {}: {}'.format(
+                hook.__class__.__name__, name, e.__class__.__name__, e,
+            ))
+
+
+class Histogram():
+    """
+    Cumulative histogram with fixed bucket upper bounds.
+
+    Attributes
+    ----------
+    buckets : tuple[float, ...]
+        Upper bound of each bucket, excluding the implicit +Inf bucket.
+    counts : list[int]
+        Number of observations in each bucket, where the last one
+        counts the observations above all bounds.
+    count : int
+        Total number of observations.
+    sum : float
+        Sum of all observations.
+
+    """
+
+    def __init__(self, buckets: Iterable[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Returns the upper bound of the bucket holding quantile `q`,
+        or None if there are no observations. Values above the last
+        bound give infinity.
+
+        """
+
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for bound, n in zip(self.buckets + (float('inf'),), self.counts):
+            cumulative += n
+            if cumulative >= rank:
+                return bound
+        return float('inf')
+
+    def __repr__(self) -> str:
+        return '{}(count={}, sum={})'.format(
+            self.__class__.__name__, self.count, self.sum,
+        )
+
+
+class MetricsCollector(Hooks):
+    """
+    Hooks that keep counters and histograms of all requests in memory,
+    ready to be exported to a monitoring system.
+
+    Metrics are keyed by a tuple of label values, as listed for each.
+    :meth:`to_prometheus` renders them in the Prometheus text format,
+    while other systems, like StatsD, can read the attributes directly.
+
+    Attributes
+    ----------
+    requests : dict[tuple[str, str, str], int]
+        Responses by method, endpoint, and status code, where
+        "error" is used when no response was received.
+    retries : dict[tuple[str, str], int]
+        Retries and stream reconnects by method and endpoint.
+    stream_events : dict[tuple[str, str], int]
+        Stream events by endpoint and event type.
+    bytes_received : dict[tuple[str, str], int]
+        Response and stream bytes by method and endpoint.
+    durations : dict[tuple[str, str], Histogram]
+        Seconds per attempt by method and endpoint.
+    sizes : dict[tuple[str, str], Histogram]
+        Response body bytes by method and endpoint.
+
+    Examples
+    --------
+    >>> metrics = dt.MetricsCollector()
+    >>> dt.hooks.append(metrics)
+    >>> print(metrics.to_prometheus())
+
+    """
+
+    def __init__(self,
+                 duration_buckets: Iterable[float] = DURATION_BUCKETS,
+                 size_buckets: Iterable[float] = SIZE_BUCKETS,
+                 ) -> None:
+        self.duration_buckets = tuple(duration_buckets)
+        self.size_buckets = tuple(size_buckets)
+
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Clears all metrics.
+
+        """
+
+        with self._lock:
+            self.requests: dict[tuple[str, str, str], int] = {}
+            self.retries: dict[tuple[str, str], int] = {}
+            self.stream_events: dict[tuple[str, str], int] = {}
+            self.bytes_received: dict[tuple[str, str], int] = {}
+            self.durations: dict[tuple[str, str], Histogram] = {}
+            self.sizes: dict[tuple[str, str], Histogram] = {}
+
+    def on_response(self,
+                    method: str,
+                    endpoint: str,
+                    status_code: Optional[int],
+                    duration: float,
+                    attempt: int,
+                    size: int,
+                    error: Optional[Exception],
+                    ) -> None:
+        key = (method, endpoint)
+        status = str(status_code) if status_code else 'error'
+        with self._lock:
+            _increment(self.requests, (method, endpoint, status))
+            _increment(self.bytes_received, key, size)
+            if key not in self.durations:
+                self.durations[key] = Histogram(self.duration_buckets)
+                self.sizes[key] = Histogram(self.size_buckets)
+            self.durations[key].observe(duration)
+            self.sizes[key].observe(size)
+
+    def on_retry(self,
+                 method: str,
+                 endpoint: str,
+                 attempt: int,
+                 sleeptime: float,
+                 error: Exception,
+                 ) -> None:
+        with self._lock:
+            _increment(self.retries, (method, endpoint))
+
+    def on_stream_event(self,
+                        endpoint: str,
+                        event_type: str,
+                        size: int,
+                        ) -> None:
+        with self._lock:
+            _increment(self.stream_events, (endpoint, event_type))
+            _increment(self.bytes_received, ('GET', endpoint), size)
+
+    def to_prometheus(self, prefix: str = 'disruptive_') -> str:
+        """
+        Renders all metrics in the Prometheus text exposition format.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            Prepended to the name of every metric.
+
+        Returns
+        -------
+        text : str
+            Metrics, one sample per line.
+
+        """
+
+        lines: list[str] = []
+        with self._lock:
+            _counter(lines, prefix + 'requests_total',
+                     ('method', 'endpoint', 'status'), self.requests)
+            _counter(lines, prefix + 'retries_total',
+                     ('method', 'endpoint'), self.retries)
+            _counter(lines, prefix + 'stream_events_total',
+                     ('endpoint', 'event_type'), self.stream_events)
+            _counter(lines, prefix + 'received_bytes_total',
+                     ('method', 'endpoint'), self.bytes_received)
+            _histogram(lines, prefix + 'request_duration_seconds',
+                       ('method', 'endpoint'), self.durations)
+            _histogram(lines, prefix + 'response_size_bytes',
+                       ('method', 'endpoint'), self.sizes)
+        return '\n'.join(lines) + '\n'
+
+
+def _increment(counter: dict, key: tuple, value: int = 1) -> None:
+    counter[key] = counter.get(key, 0) + value
+
+
+def _labels(names: Iterable[str], values: Iterable[Any]) -> str:
+    return ','.join('{}="{}"'.format(
+        name, str(value).replace('\\', '\\\\').replace('"', '\\"'),
+    ) for name, value in zip(names, values))
+
+
+def _counter(lines: list[str],
+             name: str,
+             label_names: tuple[str, ...],
+             counter: dict,
+             ) -> None:
+    lines.append('# TYPE {} counter'.format(name))
+    for key, value in sorted(counter.items()):
+        lines.append('{}{{{}}} {}'.format(
+            name, _labels(label_names, key), value,
+        ))
+
+
+def _histogram(lines: list[str],
+               name: str,
+               label_names: tuple[str, ...],
+               histograms: dict[Any, Histogram],
+               ) -> None:
+    lines.append('# TYPE {} histogram'.format(name))
+    for key, histogram in sorted(histograms.items()):
+        labels = _labels(label_names, key)
+        cumulative = 0
+        bounds = [repr(float(b)) for b in histogram.buckets] + ['+Inf']
+        for bound, n in zip(bounds, histogram.counts):
+            cumulative += n
+            lines.append('{}_bucket{{{},le="{}"}} {}'.format(
+                name, labels, bound, cumulative,
+            ))
+        lines.append('{}_sum{{{}}} {}'.format(name, labels, histogram.sum))
+        lines.append('{}_count{{{}}} {}'.format(
+            name, labels, histogram.count,
+        ))
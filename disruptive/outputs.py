@@ -7,6 +7,9 @@ class OutputBase(object):
     """
     Represents common features for all returnable objects.
 
+    Children that are created in large numbers, like events, define
+    `__slots__` to avoid the memory of a per-instance `__dict__`.
+
     Attributes
     ----------
     raw : dict[str, str]
@@ -14,6 +17,8 @@ class OutputBase(object):
 
     """
 
+    __slots__ = ('_raw',)
+
     def __init__(self, raw: dict) -> None:
         """
         Constructs the OutputBase object by setting raw attribute.
@@ -27,7 +32,14 @@ class OutputBase(object):
 
         # Set attribute from input argument.
         self._raw = raw
-        self.raw: dict = raw
+
+    @property
+    def raw(self) -> dict:
+        return self._raw
+
+    @raw.setter
+    def raw(self, raw: dict) -> None:
+        self._raw = raw
 
     def __repr__(self) -> str:
         return '{}.{}({})'.format(
@@ -52,7 +64,7 @@ class OutputBase(object):
             out.append(l0 + str(obj.__class__.__name__) + '(')
 
         # Append the various public attributes recursively.
-        for a in vars(obj):
+        for a in _attribute_names(obj):
             # Skip private attributes.
             if a.startswith('_'):
                 continue
@@ -65,7 +77,7 @@ class OutputBase(object):
 
             # Class objects should be dumped recursively, except for
             # those that are an instance of datetime, like pandas timestamps.
-            if hasattr(val, '__dict__') and not isinstance(val, datetime):
+            if _is_object(val) and not isinstance(val, datetime):
                 # Other classes should print name with content recursively.
                 out.append('{}{}: {} = {}'.format(
                     l1, a, type(val).__name__,
@@ -98,7 +110,7 @@ class OutputBase(object):
                     ) -> list:
         for val in lst:
             # Class objects should be dumped recursively.
-            if hasattr(val, '__dict__'):
+            if _is_object(val):
                 out.append('{}{}'.format(
                     l1, str(val.__class__.__name__) + '('
                 ))
@@ -112,6 +124,23 @@ class OutputBase(object):
         return out
 
 
+def _attribute_names(obj: object) -> list[str]:
+    # Slotted attributes first, from the child class and up, as this
+    # matches the order they are set in by constructors.
+    names = []
+    for cls in type(obj).__mro__:
+        for name in cls.__dict__.get('__slots__', ()):
+            if name not in names and hasattr(obj, name):
+                names.append(name)
+    names += [name for name in getattr(obj, '__dict__', {})
+              if name not in names]
+    return names
+
+
+def _is_object(val: object) -> bool:
+    return hasattr(val, '__dict__') or isinstance(val, OutputBase)
+
+
 class Member(OutputBase):
     """
     Represents a member.
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import time
+import threading
+from typing import Optional
+
+import disruptive as dt
+import disruptive.errors as dterrors
+
+# Endpoint classes rate limits can be set for.
+EVENTS = 'events'
+STREAM = 'stream'
+READ = 'read'
+WRITE = 'write'
+ANY = '*'
+
+# Limiters shared by all requests, keyed by base URL,
+# endpoint class and configured rate.
+_limiters: dict[tuple[str, str, float], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+class RateLimiter():
+    """
+    Token bucket limiting how many requests are sent per second,
+    adapting its rate to the responses of the API.
+
+    Each 429 response halves the rate, down to `min_rate`, and pauses
+    all requests for the duration of its Retry-After header, if given.
+    Each successful response then adds `increase` requests per second
+    back, up to the configured `rate`.
+
+    The limiter does not sleep itself. Instead, :meth:`acquire` returns
+    how long the caller must wait, so the same limiter can be shared by
+    threads and asyncio tasks alike.
+
+    Parameters
+    ----------
+    rate : float
+        Maximum number of requests per second.
+    burst : float, optional
+        Number of requests that may be sent at once after being idle.
+        Defaults to `rate`, but at least 1.
+    min_rate : float, optional
+        Lowest rate the limiter backs off to.
+        Defaults to 1% of `rate`.
+    increase : float, optional
+        Requests per second added back after each successful response.
+        Defaults to 1% of `rate`.
+
+    Attributes
+    ----------
+    current_rate : float
+        Rate currently allowed, in requests per second.
+
+    """
+
+    def __init__(self,
+                 rate: float,
+                 burst: Optional[float] = None,
+                 min_rate: Optional[float] = None,
+                 increase: Optional[float] = None,
+                 ) -> None:
+        # Check that rate > 0.
+        if rate <= 0:
+            raise dterrors.ConfigurationError(
+                'Rate limit has value {}, but must be float '
+                'greater than 0.'.format(rate)
+            )
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1)
+        self.min_rate = min_rate if min_rate is not None else rate / 100
+        self.increase = increase if increase is not None else rate / 100
+        self.current_rate = rate
+
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def acquire(self) -> float:
+        """
+        Reserves a single request.
+
+        Returns
+        -------
+        wait : float
+            Seconds the caller must wait before sending the request.
+
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            # Tokens below zero are requests already waiting their turn.
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self.current_rate)
+            return max(wait, self._paused_until - now)
+
+    def on_success(self) -> None:
+        """
+        Additively increases the rate after a successful response.
+
+        """
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self.current_rate = min(
+                self.rate, self.current_rate + self.increase,
+            )
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Multiplicatively decreases the rate after a 429 response,
+        and pauses all requests for `retry_after` seconds if given.
+
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.current_rate = max(self.min_rate, self.current_rate / 2)
+
+            # Drop any burst so requests are spread at the new rate.
+            self._tokens = min(self._tokens, 0)
+            if retry_after is not None:
+                self._paused_until = max(
+                    self._paused_until, now + retry_after,
+                )
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.burst,
+            self._tokens + (now - self._updated) * self.current_rate,
+        )
+        self._updated = now
+
+
+def adapt(limiter: RateLimiter,
+          error: Optional[Exception],
+          should_retry: bool,
+          ) -> bool:
+    """
+    Lowers the rate of a limiter on TooManyRequests, or raises it
+    on success, and returns the updated retry decision.
+
+    A rate limited request is always retried, as the limiter itself
+    paces the next attempt.
+
+    Parameters
+    ----------
+    limiter : RateLimiter
+        Limiter the request was sent through.
+    error : Exception, None
+        Error parsed from the response, if any.
+    should_retry : bool
+        If the request should be retried or not.
+
+    Returns
+    -------
+    should_retry : bool
+        If the request should be retried or not.
+
+    """
+
+    if isinstance(error, dterrors.TooManyRequests):
+        limiter.on_throttle(error.retry_after)
+        return True
+    elif error is None:
+        limiter.on_success()
+    return should_retry
+
+
+def endpoint_class(method: str, url: str) -> str:
+    """
+    Returns the class of an endpoint, used to look up its rate limit.
+
+    Parameters
+    ----------
+    method : str
+        Request method.
+    url : str
+        Endpoint URL, without the base URL.
+
+    Returns
+    -------
+    endpoint_class : str
+        One of "stream", "events", "read", or "write".
+
+    """
+
+    if url.endswith(':stream'):
+        return STREAM
+    elif url.endswith('/events'):
+        return EVENTS
+    elif method == 'GET':
+        return READ
+    else:
+        return WRITE
+
+
+def endpoint_template(url: str) -> str:
+    """
+    Returns an endpoint URL with its resource IDs replaced by "{}",
+    like "/projects/{}/devices/{}", grouping requests to the same
+    endpoint regardless of the resources requested.
+
+    Parameters
+    ----------
+    url : str
+        Endpoint URL, without the base URL.
+
+    Returns
+    -------
+    template : str
+        Endpoint URL without IDs or query string.
+
+    """
+
+    # Paths alternate between collections and IDs, where an ID may be
+    # followed by a custom method, like "/projects/{}/devices/{}:publish".
+    segments = url.split('?', 1)[0].split('/')
+    for i in range(2, len(segments), 2):
+        if len(segments[i]) > 0:
+            _, sep, method = segments[i].partition(':')
+            segments[i] = '{}' + sep + method
+    return '/'.join(segments)
+
+
+def get_limiter(base_url: str,
+                method: str,
+                url: str,
+                ) -> Optional[RateLimiter]:
+    """
+    Returns the limiter shared by all requests to the same base URL
+    and endpoint class, as configured by the package-wide `rate_limits`.
+
+    Parameters
+    ----------
+    base_url : str
+        Base URL of the request.
+    method : str
+        Request method.
+    url : str
+        Endpoint URL, without the base URL.
+
+    Returns
+    -------
+    limiter : RateLimiter, None
+        Limiter of the request, or None if it is not rate limited.
+
+    """
+
+    rate_limits = dt.rate_limits
+    if not rate_limits:
+        return None
+
+    # The most specific limit is used, with "*" matching any.
+    limits = rate_limits.get(base_url, rate_limits.get(ANY))
+    if limits is None:
+        return None
+    cls = endpoint_class(method, url)
+    rate = limits.get(cls, limits.get(ANY))
+    if rate is None:
+        return None
+
+    key = (base_url, cls, rate)
+    limiter = _limiters.get(key)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(key)
+            if limiter is None:
+                limiter = _limiters[key] = RateLimiter(rate)
+    return limiter
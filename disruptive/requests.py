@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+import os
 import sys
 import time
-import json
-from typing import Optional, Any, Generator
+import threading
+import concurrent.futures
+from typing import Optional, Any, Callable, Generator
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
 
 import requests
+import requests.adapters
 
 import disruptive as dt
 import disruptive.logging as dtlog
 import disruptive.errors as dterrors
+import disruptive.decoding as dtdecoding
+import disruptive.transforms as dttrans
+import disruptive.ratelimit as dtratelimit
+import disruptive.retry as dtretry
+import disruptive.circuitbreaker as dtcircuitbreaker
+import disruptive.hedging as dthedging
+import disruptive.instrumentation as dtinstrumentation
+import disruptive.tracing as dttracing
 
 
 USER_AGENT = 'DisruptivePythonAPI/{} Python/{}'.format(
@@ -17,6 +30,64 @@ USER_AGENT = 'DisruptivePythonAPI/{} Python/{}'.format(
     f'{sys.version_info.major}.{sys.version_info.minor}',
 )
 
+# Pooled sessions shared by all requests, keyed by process and pool size.
+_sessions: dict[tuple[int, int], Any] = {}
+_sessions_lock = threading.Lock()
+
+
+def _pooled_session(pool_size: int) -> Any:
+    """
+    Returns the package-wide session for the given pool size,
+    creating it on first use.
+
+    Connections are kept alive and reused between calls. As a session
+    inherited through a fork would share sockets with its parent, a new
+    session is created for each process, dropping those inherited.
+
+    Parameters
+    ----------
+    pool_size : int
+        Maximum number of connections kept open to each host.
+
+    Returns
+    -------
+    session : requests.Session
+        Session with a connection pool mounted for http and https.
+
+    """
+
+    key = (os.getpid(), pool_size)
+    with _sessions_lock:
+        if key not in _sessions:
+            # Sessions of other processes are left to their owners.
+            for other in [k for k in _sessions if k[0] != key[0]]:
+                del _sessions[other]
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _sessions[key] = session
+        return _sessions[key]
+
+
+def _advance_cursor(cursors: dict[str, tuple[str, str]], event: dict) -> None:
+    # Moves the cursor of the event's device to the event, unless
+    # it is older than the one already seen, like a late delivery.
+    if 'targetName' not in event or 'timestamp' not in event:
+        return
+    device_id = event['targetName'].split('/')[-1]
+    cursor = cursors.get(device_id)
+    if cursor is None or dttrans.to_epoch_ns(event['timestamp']) \
+            > dttrans.to_epoch_ns(cursor[0]):
+        cursors[device_id] = (event['timestamp'], event['eventId'])
+
+
+def _after(wait: float, function: Callable) -> Any:
+    # Calls function once the wait, in seconds, has passed.
+    if wait > 0:
+        time.sleep(wait)
+    return function()
+
 
 class DTRequest():
 
@@ -33,6 +104,13 @@ class DTRequest():
         self.data = None
         self.request_timeout = dt.request_timeout
         self.request_attempts = dt.request_attempts
+        self.request_pool_size = dt.request_pool_size
+        self.session: Any = None
+        self.retry_policy: dtretry.RetryPolicy = dt.retry_policy
+        self.circuit_breaker: Optional[dtcircuitbreaker.CircuitBreaker] = \
+            dt.circuit_breaker
+        self.hedge_policy: Optional[dthedging.HedgePolicy] = dt.hedge_policy
+        self.retry_rate_limited = True
 
         # Unpack kwargs and set attributes thereafter.
         self._unpack_kwargs(**kwargs)
@@ -61,6 +139,30 @@ class DTRequest():
         if 'request_attempts' in kwargs:
             self.request_attempts = kwargs['request_attempts']
 
+        # Check if request_pool_size is overriden.
+        if 'request_pool_size' in kwargs:
+            self.request_pool_size = kwargs['request_pool_size']
+
+        # Check if session is overriden.
+        if 'session' in kwargs:
+            self.session = kwargs['session']
+
+        # Check if retry_policy is overriden.
+        if 'retry_policy' in kwargs:
+            self.retry_policy = kwargs['retry_policy']
+
+        # Check if circuit_breaker is overriden.
+        if 'circuit_breaker' in kwargs:
+            self.circuit_breaker = kwargs['circuit_breaker']
+
+        # Check if hedge_policy is overriden.
+        if 'hedge_policy' in kwargs:
+            self.hedge_policy = kwargs['hedge_policy']
+
+        # Check if rate limited requests are left to the caller to retry.
+        if 'retry_rate_limited' in kwargs:
+            self.retry_rate_limited = kwargs['retry_rate_limited']
+
         # Check if base_url is overriden.
         if 'base_url' in kwargs:
             self.base_url = kwargs['base_url']
@@ -89,6 +191,15 @@ class DTRequest():
                 'must be integer greater than 0.'.format(self.request_attempts)
             )
 
+        # Check that request_pool_size > 0.
+        if self.request_pool_size <= 0:
+            raise dterrors.ConfigurationError(
+                'Configuration parameter request_pool_size has value {}, but '
+                'must be integer greater than 0.'.format(
+                    self.request_pool_size
+                )
+            )
+
     def _request_wrapper(self,
                          method: str,
                          url: str,
@@ -105,10 +216,15 @@ class DTRequest():
         # Define default response values.
         res = None
 
+        # Use the package-wide pooled session unless one is provided.
+        session = self.session
+        if session is None:
+            session = _pooled_session(self.request_pool_size)
+
         # Attempt to send the request.
         try:
-            # Use the requests package to send the request.
-            res = requests.request(
+            # Use the requests session to send the request.
+            res = session.request(
                 method=method,
                 url=url,
                 params=params,
@@ -119,41 +235,58 @@ class DTRequest():
                 stream=False,
             )
 
-            # Isolate the data of interest in the response.
-            return DTResponse(res.json(), res.status_code, res.headers), None
+            # Isolate the data of interest in the response, decoding
+            # the body directly from bytes.
+            content = res.content
+            return DTResponse(
+                dtdecoding.loads(content),
+                res.status_code,
+                res.headers,
+                len(content),
+            ), None
 
         except requests.exceptions.RequestException as e:
             return DTResponse({}, None, {}), e
         except ValueError as e:
-            # Requests' .json() fails when no json is returned (code 405).
+            # Decoding fails when no json is returned (code 405).
             if res is None:
                 return DTResponse({}, 0, {}), e
             else:
-                return DTResponse({}, res.status_code, res.headers), e
-
-    def _send_request(self, nth_attempt: int = 0) -> dict:
+                return DTResponse(
+                    {}, res.status_code, res.headers, len(res.content),
+                ), e
+
+    def _hedged_request(self,
+                        policy: dthedging.HedgePolicy,
+                        limiter: Optional[dtratelimit.RateLimiter],
+                        on_unused: Callable[[DTResponse, Any], Any],
+                        ) -> tuple[DTResponse, Any]:
         """
-        Combines all the information and sends a request.
+        Sends the request, and if it has not been answered within the
+        delay given by the hedge policy, sends it once more. The first
+        answer is returned, while the other is left to finish unused.
 
         Parameters
         ----------
-        nth_attempt : int
-            Request attempt count.
+        policy : HedgePolicy
+            Decides when, and if, the request is hedged.
+        limiter : RateLimiter, None
+            Rate limiter the hedge must also be sent through.
+        on_unused : Callable
+            Called with the response and error of the request
+            not used, once it has finished.
 
         Returns
         -------
-        data : dict
-            Data contained in the response.
+        response : tuple[DTResponse, Any]
+            Response and error, as returned by _request_wrapper().
 
         """
 
-        # Log the request.
-        dtlog.debug('Request [{}] to {}.'.format(
-            self.method,
-            self.base_url + self.url
-        ))
-
-        res, req_error = self._request_wrapper(
+        endpoint = self.base_url + dtratelimit.endpoint_template(self.url)
+        delay = policy.delay(endpoint)
+        send = partial(
+            self._request_wrapper,
             method=self.method,
             url=self.full_url,
             params=self.params,
@@ -163,6 +296,71 @@ class DTRequest():
             timeout=self.request_timeout,
         )
 
+        # Record response times of first attempts only, being the
+        # ones a hedge is measured against.
+        start = time.monotonic()
+        if delay is None:
+            result = send()
+            policy.record(endpoint, time.monotonic() - start)
+            return result
+
+        pool = dthedging.executor()
+        primary = pool.submit(send)
+        primary.add_done_callback(
+            lambda _: policy.record(endpoint, time.monotonic() - start)
+        )
+
+        done, _ = concurrent.futures.wait([primary], timeout=delay)
+        if len(done) > 0 or not policy.allow():
+            return primary.result()
+
+        dtlog.debug('Hedging request [{}] to {} after {:.3f}s.'.format(
+            self.method,
+            self.full_url,
+            delay,
+        ))
+
+        # The hedge waits its turn in the client-side rate limit, if any.
+        wait = limiter.acquire() if limiter is not None else 0.0
+        hedge = pool.submit(_after, wait, send)
+
+        # Use the first answer, unless the request itself failed.
+        used = primary
+        for future in as_completed([primary, hedge]):
+            if future.result()[1] is None:
+                used = future
+                break
+        if used is hedge:
+            policy.record_win()
+
+        # The other request was still sent, and its response counts.
+        unused = primary if used is hedge else hedge
+        unused.add_done_callback(lambda f: on_unused(*f.result()))
+        return used.result()
+
+    def _observe_response(self,
+                          res: DTResponse,
+                          req_error: Any,
+                          attempt: int,
+                          start: float,
+                          limiter: Optional[dtratelimit.RateLimiter],
+                          breaker: Optional[Any],
+                          hooks: list,
+                          endpoint: str,
+                          ) -> tuple[Optional[Exception], bool]:
+        """
+        Parses the response of a single request, and adapts
+        the rate limit, circuit, and hooks to it.
+
+        Returns
+        -------
+        error : Exception, None
+            Exception to be raised, if any.
+        should_retry : bool
+            If the request should be retried.
+
+        """
+
         # Log the response.
         dtlog.debug('Response [{}].'.format(
             res.status_code
@@ -170,40 +368,159 @@ class DTRequest():
 
         # If _request_wrapper raised an exception, the request failed.
         if req_error is not None:
-            error, should_retry, sleeptime = dterrors.parse_request_error(
-                req_error, res.data, nth_attempt
+            error, should_retry, _ = dterrors.parse_request_error(
+                req_error, res.data, attempt,
             )
         else:
             # Parse the status_code and select an appropriate error.
-            # If there is any hope at all that a retry might resolve the error,
-            # should_retry will be True. (eg. a 401).
-            error, should_retry, sleeptime = dterrors.parse_api_status_code(
-                res.status_code, res.data, res.headers, nth_attempt
+            # If there is any hope at all that a retry might resolve the
+            # error, should_retry will be True. (eg. a 401).
+            error, should_retry, _ = dterrors.parse_api_status_code(
+                res.status_code, res.data, res.headers, attempt
             )
 
-        # Check if retry is required.
-        if should_retry and nth_attempt < self.request_attempts:
-            dtlog.warning('Reconnecting in {}s.'.format(sleeptime))
+        # Adapt the rate limit and circuit to the response.
+        if limiter is not None:
+            should_retry = dtratelimit.adapt(limiter, error, should_retry)
+        if breaker is not None:
+            breaker.record(self.base_url, error)
+        if isinstance(error, dterrors.TooManyRequests) \
+                and not self.retry_rate_limited:
+            should_retry = False
+        if hooks:
+            dtinstrumentation.emit(
+                hooks, 'on_response',
+                method=self.method,
+                endpoint=endpoint,
+                status_code=res.status_code,
+                duration=time.monotonic() - start,
+                attempt=attempt,
+                size=res.size,
+                error=error,
+            )
+        return error, should_retry
+
+    def _send_request(self) -> dict:
+        """
+        Combines all the information and sends a request, retrying
+        as long as the retry policy allows and the error is
+        considered worth another attempt.
+
+        Returns
+        -------
+        data : dict
+            Data contained in the response.
+
+        """
 
-            # Sleep if necessary.
-            if sleeptime is not None:
-                time.sleep(sleeptime)
+        # All attempts share a single span, if tracing.
+        with dttracing.request_span(self.method, self.url) as span:
+            return self._send_attempts(span)
 
-            dtlog.info('Connection attempt {} of {}.'.format(
-                nth_attempt+1,
-                self.request_attempts,
+    def _send_attempts(self, span: Any) -> dict:
+        limiter = dtratelimit.get_limiter(
+            self.base_url, self.method, self.url,
+        )
+        breaker = self.circuit_breaker
+        backoff = self.retry_policy.begin(self.request_attempts)
+
+        # Hooks are given the endpoint without resource IDs.
+        hooks = dt.hooks
+        endpoint = dtratelimit.endpoint_template(self.url) if hooks else ''
+        while True:
+            # Fail fast while the API behind base_url is failing. Unlike
+            # for streams, the error is raised without being retried.
+            if breaker is not None:
+                breaker.allow(self.base_url)
+
+            # Wait for the client-side rate limit, if any.
+            if limiter is not None:
+                wait = limiter.acquire()
+                if wait > 0:
+                    dtlog.debug('Rate limited for {:.2f}s.'.format(wait))
+                    time.sleep(wait)
+
+            # Log the request.
+            dtlog.debug('Request [{}] to {}.'.format(
+                self.method,
+                self.base_url + self.url
             ))
+            if hooks:
+                dtinstrumentation.emit(
+                    hooks, 'on_request_start',
+                    method=self.method,
+                    endpoint=endpoint,
+                    attempt=backoff.attempt,
+                )
+            start = time.monotonic()
+
+            # Only first attempts of idempotent GET requests are hedged.
+            dttracing.inject(self.headers)
+            if self.hedge_policy is not None and self.method == 'GET' \
+                    and backoff.attempt == 0:
+                res, req_error = self._hedged_request(
+                    self.hedge_policy, limiter, partial(
+                        self._observe_response,
+                        attempt=backoff.attempt,
+                        start=start,
+                        limiter=limiter,
+                        breaker=breaker,
+                        hooks=hooks,
+                        endpoint=endpoint,
+                    ),
+                )
+            else:
+                res, req_error = self._request_wrapper(
+                    method=self.method,
+                    url=self.full_url,
+                    params=self.params,
+                    headers=self.headers,
+                    body=self.body,
+                    data=self.data,
+                    timeout=self.request_timeout,
+                )
 
-            # Attempt the request again recursively, iterating counter.
-            res.data = self._send_request(nth_attempt+1)
+            error, should_retry = self._observe_response(
+                res, req_error,
+                attempt=backoff.attempt,
+                start=start,
+                limiter=limiter,
+                breaker=breaker,
+                hooks=hooks,
+                endpoint=endpoint,
+            )
+            dttracing.set_response(span, res.status_code, backoff.attempt)
+
+            # Check if retry is required and allowed by the policy.
+            if should_retry:
+                sleeptime = backoff.next_sleep(dtretry.retry_after(error))
+                if sleeptime is not None:
+                    dtlog.warning('Reconnecting in {:.1f}s.'.format(
+                        sleeptime,
+                    ))
+                    if hooks:
+                        dtinstrumentation.emit(
+                            hooks, 'on_retry',
+                            method=self.method,
+                            endpoint=endpoint,
+                            attempt=backoff.attempt,
+                            sleeptime=sleeptime,
+                            error=error,
+                        )
+                    time.sleep(sleeptime)
+
+                    dtlog.info('Connection attempt {} of {}.'.format(
+                        backoff.attempt,
+                        self.request_attempts,
+                    ))
+                    continue
 
-        else:
             # If set, raise the error chosen by dterrors.parse_error().
             if error is not None:
                 raise error
 
-        data: dict = res.data
-        return data
+            data: dict = res.data
+            return data
 
     @classmethod
     def get(cls, url: str, **kwargs: Any) -> dict:
@@ -233,23 +550,105 @@ class DTRequest():
     def paginated_get(cls,
                       url: str,
                       pagination_key: str,
-                      params: dict[str, str] = {},
+                      params: Optional[dict] = None,
                       **kwargs: Any,
                       ) -> list:
-        # Initialize output list.
-        results = []
+        return list(cls.paginated_iter(url, pagination_key, params, **kwargs))
 
-        # Loop until paging has finished.
-        while True:
-            response = cls.get(url, params=params, **kwargs)
-            results += response[pagination_key]
+    @classmethod
+    def paginated_iter(cls,
+                       url: str,
+                       pagination_key: str,
+                       params: Optional[dict] = None,
+                       prefetch: bool = False,
+                       **kwargs: Any,
+                       ) -> Generator:
+        """
+        Yields the items of each page as it arrives, keeping only
+        a single page in memory at a time.
 
-            if len(response['nextPageToken']) > 0:
-                params['pageToken'] = response['nextPageToken']
-            else:
-                break
+        Parameters
+        ----------
+        url : str
+            API endpoint URL.
+        pagination_key : str
+            Response key under which the page items are found.
+        params : dict, optional
+            Request parameters.
+        prefetch : bool, optional
+            If True, the next page is fetched in the background
+            while the items of the current one are yielded.
+
+        """
+
+        for page in cls.paginated_pages(
+            url, pagination_key, params, prefetch, **kwargs,
+        ):
+            yield from page
+
+    @classmethod
+    def paginated_pages(cls,
+                        url: str,
+                        pagination_key: str,
+                        params: Optional[dict] = None,
+                        prefetch: bool = False,
+                        **kwargs: Any,
+                        ) -> Generator[list, None, None]:
+        """
+        Same as :meth:`paginated_iter`, but yields the
+        list of items of each page as a whole.
+
+        """
+
+        # Copy parameters as the page token is added to them.
+        params = dict(params) if params is not None else {}
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        future: Optional[Future] = None
+        try:
+            page_count = 1
+            response = cls._get_page(url, params, page_count, **kwargs)
+
+            # Loop until paging has finished.
+            while True:
+                page_token = response['nextPageToken']
+                if len(page_token) > 0:
+                    params['pageToken'] = page_token
+
+                    # Request the next page before yielding the current.
+                    # Prefetched pages keep the trace context, if any.
+                    if executor is not None:
+                        future = executor.submit(
+                            dttracing.bind(cls._get_page),
+                            url, dict(params), page_count + 1, **kwargs,
+                        )
 
-        return results
+                yield response[pagination_key]
+
+                if len(page_token) == 0:
+                    break
+                page_count += 1
+                if future is not None:
+                    response = future.result()
+                else:
+                    response = cls._get_page(
+                        url, params, page_count, **kwargs,
+                    )
+
+        finally:
+            # Drop any pending page if the caller stopped iterating early.
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _get_page(cls,
+                  url: str,
+                  params: dict,
+                  page_count: int,
+                  **kwargs: Any,
+                  ) -> dict:
+        with dttracing.page_span(url, page_count):
+            return cls.get(url, params=params, **kwargs)
 
     @staticmethod
     def stream(url: str, **kwargs: Any) -> Generator:
@@ -260,6 +659,13 @@ class DTRequest():
         ----------
         url : str
             API endpoint URL.
+        backfill : Callable[[dict], Iterable[dict]], optional
+            Called each time the stream has reconnected with the
+            timestamp and event ID of the last event received from each
+            device, keyed by device ID. The returned events are yielded
+            before resuming the stream.
+        yield_pings : bool, optional
+            If True, ping events are yielded as well.
 
         """
 
@@ -267,7 +673,16 @@ class DTRequest():
         PING_INTERVAL = 10
         PING_JITTER = 2
 
-        # Expand url with base_url.
+        # Reconnects share the rate limit of the stream endpoint, if any.
+        limiter = dtratelimit.get_limiter(dt.base_url, 'GET', url)
+        base_url = dt.base_url
+
+        # Hooks are given the endpoint without resource IDs.
+        hooks = dt.hooks
+        endpoint = dtratelimit.endpoint_template(url) if hooks else ''
+
+        # Expand url with base_url, keeping the endpoint for tracing.
+        path = url
         url = dt.base_url + url
 
         # Set error variable that if not None, raise it.
@@ -280,6 +695,17 @@ class DTRequest():
             request_attempts = kwargs['request_attempts']
         else:
             request_attempts = dt.request_attempts
+        if 'session' in kwargs:
+            session = kwargs['session']
+        elif 'request_pool_size' in kwargs:
+            session = _pooled_session(kwargs['request_pool_size'])
+        else:
+            session = _pooled_session(dt.request_pool_size)
+
+        retry_policy = kwargs.get('retry_policy', dt.retry_policy)
+        breaker = kwargs.get('circuit_breaker', dt.circuit_breaker)
+        backfill = kwargs.get('backfill')
+        yield_pings = kwargs.get('yield_pings', False)
 
         # Add ping parameter to dictionary.
         params['ping_interval'] = str(PING_INTERVAL) + 's'
@@ -287,9 +713,19 @@ class DTRequest():
         # Add custom user agent.
         headers['User-Agent'] = USER_AGENT
 
-        # Set up a simple catch-all retry policy.
-        nth_attempt = 0
+        # Timestamp and event ID of the newest event of each device,
+        # from which events missed while reconnecting can be backfilled.
+        cursors: dict[str, tuple[str, str]] = {}
+        has_connected = False
+
+        # Reconnect as allowed by the retry policy, which is
+        # restarted each time the stream has recovered.
+        backoff = retry_policy.begin(request_attempts)
         while True:
+            # Each connection records a single outcome to the circuit.
+            pending = False
+            span = None
+            stream = None
             try:
                 # Set the authorization header each retry in case we expire.
                 if 'auth' in kwargs:
@@ -297,11 +733,31 @@ class DTRequest():
                 else:
                     headers['Authorization'] = dt.default_auth.get_token()
 
+                # Fail fast while the API is failing. The error is
+                # retried as any other, waiting for the circuit to probe.
+                if breaker is not None:
+                    breaker.allow(base_url)
+                    pending = True
+
+                # Wait for the client-side rate limit, if any.
+                if limiter is not None:
+                    time.sleep(limiter.acquire())
+
                 # Set up a stream connection.
                 # Connection will timeout and reconnect if no single event
                 # is received in an interval of ping_interval + ping_jitter.
                 dtlog.info('Starting stream...')
-                stream = requests.request(
+                if hooks:
+                    dtinstrumentation.emit(
+                        hooks, 'on_request_start',
+                        method='GET',
+                        endpoint=endpoint,
+                        attempt=backoff.attempt,
+                    )
+                start = time.monotonic()
+                span = dttracing.start_stream_span(path, backoff.attempt)
+                dttracing.inject(headers, span)
+                stream = session.request(
                     method='GET',
                     url=url,
                     stream=True,
@@ -311,25 +767,63 @@ class DTRequest():
                     json=None,
                     data=None,
                 )
-
-                if stream.encoding is None:
-                    stream.encoding = 'utf-8'
+                dttracing.end_span(span, stream.status_code)
+                span = None
+                if hooks:
+                    dtinstrumentation.emit(
+                        hooks, 'on_response',
+                        method='GET',
+                        endpoint=endpoint,
+                        status_code=stream.status_code,
+                        duration=time.monotonic() - start,
+                        attempt=backoff.attempt,
+                        size=0,
+                        error=None,
+                    )
+
+                # Once reconnected, yield the events missed in between.
+                if has_connected and backfill is not None \
+                        and len(cursors) > 0:
+                    dtlog.info('Backfilling events of {} devices.'.format(
+                        len(cursors),
+                    ))
+                    for event in backfill(dict(cursors)):
+                        _advance_cursor(cursors, event)
+                        yield event
+                has_connected = True
 
                 # Iterate through the events as they come in (one per line).
-                for line in stream.iter_lines(decode_unicode=True):
+                # Lines are decoded from bytes without a unicode step.
+                for line in stream.iter_lines():
                     # Decode the response payload and break on error.
-                    payload = json.loads(line)
+                    payload = dtdecoding.loads(line)
                     if 'result' in payload:
-                        # Reset retry counter.
-                        nth_attempt = 0
+                        # Reset retry schedule.
+                        if backoff.attempt > 0:
+                            backoff = retry_policy.begin(request_attempts)
+
+                        # Record the connection as successful once.
+                        if breaker is not None and pending:
+                            breaker.record(base_url, None)
+                            pending = False
 
                         # Check for ping event.
                         event = payload['result']['event']
+                        if hooks:
+                            dtinstrumentation.emit(
+                                hooks, 'on_stream_event',
+                                endpoint=endpoint,
+                                event_type=event['eventType'],
+                                size=len(line),
+                            )
                         if event['eventType'] == 'ping':
                             dtlog.debug('Ping received.')
+                            if yield_pings:
+                                yield event
                             continue
 
                         # Yield event to generator.
+                        _advance_cursor(cursors, event)
                         yield event
 
                     elif 'error' in payload:
@@ -350,21 +844,31 @@ class DTRequest():
                 break
 
             except dterrors.DTApiError as e:
+                if breaker is not None and pending:
+                    breaker.record(base_url, e)
+
                 # Except for Unauthorized, retry all DTApiErrors.
                 if isinstance(e, dterrors.Unauthorized):
                     raise e
-                elif nth_attempt < request_attempts:
-                    sleeptime = nth_attempt**2
 
-                    dtlog.warning('Reconnecting in {}s.'.format(sleeptime))
-
-                    # Exponential backoff in sleep time.
+                sleeptime = backoff.next_sleep(dtretry.retry_after(e))
+                if sleeptime is not None:
+                    dtlog.warning('Reconnecting in {:.1f}s.'.format(
+                        sleeptime,
+                    ))
+                    if hooks:
+                        dtinstrumentation.emit(
+                            hooks, 'on_retry',
+                            method='GET',
+                            endpoint=endpoint,
+                            attempt=backoff.attempt,
+                            sleeptime=sleeptime,
+                            error=e,
+                        )
                     time.sleep(sleeptime)
 
-                    # Iterate attempt counter.
-                    nth_attempt += 1
                     dtlog.info('Connection attempt {} of {}.'.format(
-                        nth_attempt,
+                        backoff.attempt,
                         request_attempts,
                     ))
                 else:
@@ -375,20 +879,32 @@ class DTRequest():
 
             except requests.exceptions.RequestException as e:
                 # ConnectionErrors should always be retried.
-                result = dterrors.parse_request_error(e, {}, nth_attempt)
-                error, should_retry, sleeptime = result
-
-                # Print the error and try again up to max_request_attempts.
-                if nth_attempt < request_attempts and should_retry:
-                    dtlog.warning('Reconnecting in {}s.'.format(sleeptime))
-
-                    # Exponential backoff in sleep time.
+                error, should_retry, _ = dterrors.parse_request_error(
+                    e, {}, backoff.attempt,
+                )
+                if breaker is not None and pending:
+                    breaker.record(base_url, error)
+                dttracing.end_span(span, error=error)
+
+                # Print the error and try again as allowed by the policy.
+                sleeptime = backoff.next_sleep() if should_retry else None
+                if sleeptime is not None:
+                    dtlog.warning('Reconnecting in {:.1f}s.'.format(
+                        sleeptime,
+                    ))
+                    if hooks:
+                        dtinstrumentation.emit(
+                            hooks, 'on_retry',
+                            method='GET',
+                            endpoint=endpoint,
+                            attempt=backoff.attempt,
+                            sleeptime=sleeptime,
+                            error=error,
+                        )
                     time.sleep(sleeptime)
 
-                    # Iterate attempt counter.
-                    nth_attempt += 1
                     dtlog.info('Connection attempt {} of {}.'.format(
-                        nth_attempt,
+                        backoff.attempt,
                         request_attempts,
                     ))
 
@@ -398,6 +914,11 @@ class DTRequest():
                     sys.tracebacklimit = 0
                     raise error from e
 
+            finally:
+                # Release the connection back to the pool.
+                if stream is not None:
+                    stream.close()
+
 
 class DTResponse():
 
@@ -405,8 +926,10 @@ class DTResponse():
                  data: dict,
                  status_code: Optional[int],
                  headers: Any,
+                 size: int = 0,
                  ):
 
         self.data = data
         self.status_code = status_code
         self.headers = headers
+        self.size = size
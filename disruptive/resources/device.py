@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Any
+from typing import Optional, Any, Generator
 
 import disruptive.logging as dtlog
 import disruptive.requests as dtrequests
@@ -213,6 +213,50 @@ class Device(dtoutputs.OutputBase):
 
         """
 
+        return list(cls.iter_devices(
+            project_id=project_id,
+            query=query,
+            device_ids=device_ids,
+            device_types=device_types,
+            label_filters=label_filters,
+            order_by=order_by,
+            **kwargs,
+        ))
+
+    @classmethod
+    def iter_devices(cls,
+                     project_id: str,
+                     query: Optional[str] = None,
+                     device_ids: Optional[list[str]] = None,
+                     device_types: Optional[list[str]] = None,
+                     label_filters: Optional[dict[str, str]] = None,
+                     order_by: Optional[str] = None,
+                     prefetch: bool = False,
+                     **kwargs: Any,
+                     ) -> Generator[Device, None, None]:
+        """
+        Same as :meth:`list_devices`, but yields the devices page by page
+        as they are fetched instead of returning them all in a list.
+
+        Parameters
+        ----------
+        prefetch : bool, optional
+            If True, the next page is fetched in the background
+            while the devices of the current page are yielded.
+
+        Returns
+        -------
+        devices : Generator[Device]
+            Yields objects each representing a device.
+
+        Examples
+        --------
+        >>> # Print the name of every device in a project.
+        >>> for device in dt.Device.iter_devices('<PROJECT_ID>'):
+        ...     print(device.display_name)
+
+        """
+
         # Construct parameters dictionary.
         params: dict = dict()
         if query is not None:
@@ -231,14 +275,16 @@ class Device(dtoutputs.OutputBase):
                 labels_list.append(key + '=' + label_filters[key])
             params['label_filters'] = labels_list
 
-        # Return list of Device objects of paginated GET response.
-        devices = dtrequests.DTRequest.paginated_get(
+        # Yield Device objects of paginated GET response.
+        devices = dtrequests.DTRequest.paginated_iter(
             url='/projects/{}/devices'.format(project_id),
             pagination_key='devices',
             params=params,
+            prefetch=prefetch,
             **kwargs,
         )
-        return [cls(device) for device in devices]
+        for device in devices:
+            yield cls(device)
 
     @staticmethod
     def transfer_devices(device_ids: list[str],
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
-from typing import Optional, Any
-from datetime import datetime
+import time
+import threading
+from array import array
+from typing import Optional, Any, Generator
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import disruptive
+import disruptive.logging as dtlog
+import disruptive.errors as dterrors
 import disruptive.requests as dtrequests
 import disruptive.transforms as dttrans
 from disruptive.events.events import Event
+from disruptive.columnar import (
+    ColumnarEventHistory, _import_numpy, _import_pyarrow,
+)
+from disruptive.archive import EventHistoryWriter
+from disruptive.cache import EventCache
+from disruptive.resources.device import Device
 
 
 class EventHistory(list):
@@ -22,11 +34,22 @@ class EventHistory(list):
                     event_types: Optional[list[str]] = None,
                     start_time: Optional[str | datetime] = None,
                     end_time: Optional[str | datetime] = None,
+                    windows: int = 1,
+                    lazy: bool = False,
+                    cache: Optional[EventCache] = None,
                     **kwargs: Any,
                     ) -> EventHistory:
         """
         Get the event history for a single device.
 
+        Long histories can be fetched faster by setting `windows`, which
+        splits the time range into equally sized windows fetched in
+        parallel. The events are then returned in time order.
+
+        Repeated queries over overlapping time ranges can be served
+        locally by providing an :class:`EventCache`, in which case only
+        events outside the already synced range are fetched.
+
         Parameters
         ----------
         device_id : str
@@ -42,6 +65,16 @@ class EventHistory(list):
         end_time : str, datetime, optional
             Specified until when event history is fetched.
             Defaults to now.
+        windows : int, optional
+            Number of time windows fetched in parallel.
+            Defaults to 1, fetching all pages in sequence.
+        lazy : bool, optional
+            If True, the `data` attribute of each event is only decoded
+            on first access, which is much cheaper when only the event
+            type and source device are used.
+        cache : EventCache, optional
+            If provided, events are served from and stored in the cache.
+            Missing ranges are then fetched in sequence, ignoring `windows`.
         **kwargs
             Arbitrary keyword arguments.
             See the :ref:`Configuration <configuration>` page.
@@ -71,12 +104,462 @@ class EventHistory(list):
         ...     start_time=datetime.utcnow() - timedelta(7),
         ... )
 
+        >>> # Fetch 90 days of events in 12 parallel windows.
+        >>> events = dt.EventHistory.list_events(
+        ...     device_id=DEVICE_1,
+        ...     project_id=PROJECT_ID,
+        ...     start_time=datetime.utcnow() - timedelta(90),
+        ...     windows=12,
+        ... )
+
+        """
+
+        # Check that windows > 0.
+        if windows <= 0:
+            raise dterrors.ConfigurationError(
+                'Parameter windows has value {}, but must be '
+                'integer greater than 0.'.format(windows)
+            )
+
+        if cache is not None:
+            return EventHistory._list_events_cached(
+                url='/projects/{}/devices/{}/events'.format(
+                    project_id, device_id,
+                ),
+                device_id=device_id,
+                project_id=project_id,
+                event_types=event_types,
+                start_time=start_time,
+                end_time=end_time,
+                lazy=lazy,
+                cache=cache,
+                **kwargs,
+            )
+
+        if windows > 1:
+            return EventHistory._list_events_windowed(
+                url='/projects/{}/devices/{}/events'.format(
+                    project_id, device_id,
+                ),
+                event_types=event_types,
+                start_time=start_time,
+                end_time=end_time,
+                windows=windows,
+                lazy=lazy,
+                **kwargs,
+            )
+
+        return EventHistory(EventHistory.iter_events(
+            device_id=device_id,
+            project_id=project_id,
+            event_types=event_types,
+            start_time=start_time,
+            end_time=end_time,
+            lazy=lazy,
+            **kwargs,
+        ))
+
+    @staticmethod
+    def iter_events(device_id: str,
+                    project_id: str,
+                    event_types: Optional[list[str]] = None,
+                    start_time: Optional[str | datetime] = None,
+                    end_time: Optional[str | datetime] = None,
+                    prefetch: bool = False,
+                    lazy: bool = False,
+                    **kwargs: Any,
+                    ) -> Generator[Event, None, None]:
+        """
+        Same as :meth:`list_events`, but yields the events page by page
+        as they are fetched, keeping a single page in memory at a time.
+
+        Parameters
+        ----------
+        prefetch : bool, optional
+            If True, the next page is fetched in the background
+            while the events of the current page are yielded.
+        lazy : bool, optional
+            If True, the `data` attribute of each event is only
+            decoded on first access.
+
+        Returns
+        -------
+        events : Generator[Event]
+            Yields each event fetched by the call.
+
+        Examples
+        --------
+        >>> # Count the touch events of a device in the last 90 days.
+        >>> n_touches = 0
+        >>> for event in dt.EventHistory.iter_events(
+        ...     device_id='<DEVICE_ID>',
+        ...     project_id='<PROJECT_ID>',
+        ...     event_types=[dt.events.TOUCH],
+        ...     start_time=datetime.utcnow() - timedelta(90),
+        ...     prefetch=True,
+        ... ):
+        ...     n_touches += 1
+
+        """
+
+        # Construct URL.
+        url = '/projects/{}/devices/{}/events'.format(project_id, device_id)
+
+        # Construct parameters dictionary.
+        params = EventHistory._events_params(event_types, start_time, end_time)
+
+        # Yield Event objects of paginated GET response.
+        events = dtrequests.DTRequest.paginated_iter(
+            url=url,
+            pagination_key='events',
+            params=params,
+            prefetch=prefetch,
+            **kwargs,
+        )
+        for event in events:
+            yield Event(event, lazy)
+
+    @staticmethod
+    def list_events_columnar(device_id: str,
+                             project_id: str,
+                             event_types: Optional[list[str]] = None,
+                             start_time: Optional[str | datetime] = None,
+                             end_time: Optional[str | datetime] = None,
+                             prefetch: bool = False,
+                             **kwargs: Any,
+                             ) -> ColumnarEventHistory:
+        """
+        Same as :meth:`list_events`, but stores the events column by column
+        in compact arrays, built directly from each page of the response
+        without creating an Event object per event.
+
+        Parameters
+        ----------
+        prefetch : bool, optional
+            If True, the next page is fetched in the background
+            while the events of the current page are stored.
+
+        Returns
+        -------
+        history : ColumnarEventHistory
+            Columns of all events fetched by the call, per event type.
+
+        Examples
+        --------
+        >>> # Fetch 30 days of temperature events as NumPy arrays.
+        >>> history = dt.EventHistory.list_events_columnar(
+        ...     device_id='<DEVICE_ID>',
+        ...     project_id='<PROJECT_ID>',
+        ...     event_types=[dt.events.TEMPERATURE],
+        ...     start_time=datetime.utcnow() - timedelta(30),
+        ... )
+        >>> columns = history[dt.events.TEMPERATURE].to_numpy()
+
+        """
+
+        # Construct URL.
+        url = '/projects/{}/devices/{}/events'.format(project_id, device_id)
+
+        # Construct parameters dictionary.
+        params = EventHistory._events_params(event_types, start_time, end_time)
+
+        return ColumnarEventHistory(dtrequests.DTRequest.paginated_iter(
+            url=url,
+            pagination_key='events',
+            params=params,
+            prefetch=prefetch,
+            **kwargs,
+        ))
+
+    @staticmethod
+    def export_events(device_id: str,
+                      project_id: str,
+                      path: str,
+                      event_types: Optional[list[str]] = None,
+                      start_time: Optional[str | datetime] = None,
+                      end_time: Optional[str | datetime] = None,
+                      file_format: str = 'parquet',
+                      mode: str = 'append',
+                      prefetch: bool = False,
+                      **kwargs: Any,
+                      ) -> list[str]:
+        """
+        Writes the event history of a single device to Parquet or Arrow
+        IPC (Feather) files, partitioned by project, device, event type,
+        and day. Each page is written as it arrives, so memory use does
+        not grow with the length of the history.
+        See :class:`EventHistoryWriter` for the file layout.
+
+        Requires the installation of additional packages.
+        >> pip install pyarrow
+        or
+        >> pip install disruptive[extra]
+
+        Parameters
+        ----------
+        device_id : str
+            Unique ID of the target device.
+        project_id : str
+            Unique ID of the target project.
+        path : str
+            Root directory of the partitioned files.
+        event_types : list[str], optional
+            If provided, only the specified
+            :ref:`event types <event_types>` are fetched.
+        start_time : str, datetime, optional
+            Specifies from when event history is fetched.
+            Defaults to 24 hours ago.
+        end_time : str, datetime, optional
+            Specified until when event history is fetched.
+            Defaults to now.
+        file_format : str, optional
+            Either "parquet" or "feather". Defaults to "parquet".
+        mode : str, optional
+            If "append", new files are added to existing partitions.
+            If "overwrite", existing files in the written partitions
+            are removed first. Defaults to "append".
+        prefetch : bool, optional
+            If True, the next page is fetched in the background
+            while the current one is written.
+        **kwargs
+            Arbitrary keyword arguments.
+            See the :ref:`Configuration <configuration>` page.
+
+        Returns
+        -------
+        files : list[str]
+            Paths of the files written by the call.
+
+        Examples
+        --------
+        >>> # Append yesterday's events to a nightly archive.
+        >>> dt.EventHistory.export_events(
+        ...     device_id='<DEVICE_ID>',
+        ...     project_id='<PROJECT_ID>',
+        ...     path='archive/',
+        ...     start_time=datetime.utcnow() - timedelta(1),
+        ... )
+
         """
 
         # Construct URL.
         url = '/projects/{}/devices/{}/events'.format(project_id, device_id)
 
         # Construct parameters dictionary.
+        params = EventHistory._events_params(event_types, start_time, end_time)
+
+        with EventHistoryWriter(path, file_format, mode) as writer:
+            for page in dtrequests.DTRequest.paginated_pages(
+                url=url,
+                pagination_key='events',
+                params=params,
+                prefetch=prefetch,
+                **kwargs,
+            ):
+                writer.write(page)
+
+        return writer.files
+
+    @staticmethod
+    def iter_events_bulk(project_id: str,
+                         device_ids: Optional[list[str]] = None,
+                         device_types: Optional[list[str]] = None,
+                         label_filters: Optional[dict[str, str]] = None,
+                         event_types: Optional[list[str]] = None,
+                         start_time: Optional[str | datetime] = None,
+                         end_time: Optional[str | datetime] = None,
+                         max_workers: int = 8,
+                         **kwargs: Any,
+                         ) -> Generator[tuple[str, EventHistory], None, None]:
+        """
+        Get the event history for many devices concurrently, yielding
+        the history of each device as soon as it has been fetched.
+
+        If `device_ids` is not provided, the devices are found by
+        listing the project with the `device_types` and `label_filters`
+        filters, as in :meth:`Device.list_devices`.
+
+        When the API responds with :ref:`TooManyRequests <429_error>`, all
+        workers pause for the duration given in the Retry-After header,
+        or a backoff from the retry policy if not given, before continuing.
+
+        Parameters
+        ----------
+        project_id : str
+            Unique ID of the target project.
+        device_ids : list[str], optional
+            Unique IDs of the target devices.
+            If not provided, all devices matching the filters are used.
+        device_types : list[str], optional
+            Filter devices by :ref:`device types <device_type_constants>`.
+            Ignored if `device_ids` is provided.
+        label_filters : dict[str, str], optional
+            Filter devices by label keys and values.
+            Ignored if `device_ids` is provided.
+        event_types : list[str], optional
+            If provided, only the specified
+            :ref:`event types <event_types>` are fetched.
+        start_time : str, datetime, optional
+            Specifies from when event history is fetched.
+            Defaults to 24 hours ago.
+        end_time : str, datetime, optional
+            Specified until when event history is fetched.
+            Defaults to now.
+        max_workers : int, optional
+            Maximum number of devices fetched at the same time.
+        **kwargs
+            Arbitrary keyword arguments.
+            See the :ref:`Configuration <configuration>` page.
+
+        Returns
+        -------
+        histories : Generator[tuple[str, EventHistory]]
+            Yields a device ID and its event history in order of completion.
+
+        Examples
+        --------
+        >>> # Fetch the last 7 days of temperature events
+        >>> # for every temperature sensor in a project.
+        >>> for device_id, events in dt.EventHistory.iter_events_bulk(
+        ...     project_id='<PROJECT_ID>',
+        ...     device_types=[dt.Device.TEMPERATURE],
+        ...     event_types=[dt.events.TEMPERATURE],
+        ...     start_time=datetime.utcnow() - timedelta(7),
+        ... ):
+        ...     print(device_id, len(events))
+
+        """
+
+        # Check that max_workers > 0.
+        if max_workers <= 0:
+            raise dterrors.ConfigurationError(
+                'Parameter max_workers has value {}, but must be '
+                'integer greater than 0.'.format(max_workers)
+            )
+
+        # If not provided, find the devices by listing the project.
+        if device_ids is None:
+            devices = Device.list_devices(
+                project_id=project_id,
+                device_types=device_types,
+                label_filters=label_filters,
+                **kwargs,
+            )
+            device_ids = [d.device_id for d in devices]
+
+        yield from EventHistory._iter_histories(
+            project_id=project_id,
+            params={
+                device_id: EventHistory._events_params(
+                    event_types, start_time, end_time,
+                ) for device_id in device_ids
+            },
+            max_workers=max_workers,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _iter_histories(project_id: str,
+                        params: dict[str, dict],
+                        max_workers: int,
+                        **kwargs: Any,
+                        ) -> Generator[tuple[str, EventHistory], None, None]:
+        """
+        Fetches the event history of each device with its own request
+        parameters, yielding them in order of completion.
+
+        """
+
+        # Shared by all workers to pause together when rate limited.
+        backoff = _RateLimitBackoff()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    EventHistory._list_events_with_backoff,
+                    device_id=device_id,
+                    project_id=project_id,
+                    params=device_params,
+                    backoff=backoff,
+                    **kwargs,
+                ): device_id for device_id, device_params in params.items()
+            }
+
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                # Stop pending work if an error was raised or the caller
+                # stopped iterating early. Running workers cannot be
+                # cancelled, so they stop before their next page instead.
+                backoff.stop()
+                for future in futures:
+                    future.cancel()
+
+    @staticmethod
+    def list_events_bulk(project_id: str,
+                         device_ids: Optional[list[str]] = None,
+                         device_types: Optional[list[str]] = None,
+                         label_filters: Optional[dict[str, str]] = None,
+                         event_types: Optional[list[str]] = None,
+                         start_time: Optional[str | datetime] = None,
+                         end_time: Optional[str | datetime] = None,
+                         max_workers: int = 8,
+                         **kwargs: Any,
+                         ) -> EventHistory:
+        """
+        Get the event history for many devices concurrently,
+        merged into a single EventHistory.
+
+        Takes the same parameters as :meth:`iter_events_bulk`. Events are
+        ordered by device in the order of `device_ids`, if provided, and
+        by time within each device.
+
+        Returns
+        -------
+        events : EventHistory[Event]
+            A list of all events fetched for all the devices.
+
+        Examples
+        --------
+        >>> # Fetch the last 24h of events for a few devices.
+        >>> events = dt.EventHistory.list_events_bulk(
+        ...     project_id='<PROJECT_ID>',
+        ...     device_ids=['<DEVICE_ID_1>', '<DEVICE_ID_2>'],
+        ... )
+
+        """
+
+        histories = dict(EventHistory.iter_events_bulk(
+            project_id=project_id,
+            device_ids=device_ids,
+            device_types=device_types,
+            label_filters=label_filters,
+            event_types=event_types,
+            start_time=start_time,
+            end_time=end_time,
+            max_workers=max_workers,
+            **kwargs,
+        ))
+
+        # Merge in the given device order rather than order of completion.
+        order = device_ids if device_ids is not None else sorted(histories)
+        merged = EventHistory()
+        for device_id in order:
+            merged += histories[device_id]
+
+        return merged
+
+    @staticmethod
+    def _events_params(event_types: Optional[list[str]],
+                       start_time: Optional[str | datetime],
+                       end_time: Optional[str | datetime],
+                       ) -> dict:
+        """
+        Constructs the event history request parameters.
+
+        """
+
         params: dict = dict()
         if event_types is not None:
             params['eventTypes'] = event_types
@@ -89,65 +572,243 @@ class EventHistory(list):
         if end_time_iso8601 is not None:
             params['endTime'] = end_time_iso8601
 
-        # Send paginated GET request.
-        res = dtrequests.DTRequest.paginated_get(
-            url=url,
-            pagination_key='events',
-            params=params,
-            **kwargs,
+        return params
+
+    @staticmethod
+    def _list_events_windowed(url: str,
+                              event_types: Optional[list[str]],
+                              start_time: Optional[str | datetime],
+                              end_time: Optional[str | datetime],
+                              windows: int,
+                              lazy: bool,
+                              **kwargs: Any,
+                              ) -> EventHistory:
+        """
+        Splits the time range into windows fetched in parallel, then
+        merges them in time order. Events on the edge between two
+        windows may be returned by both, and are only kept once.
+
+        """
+
+        # Resolve the same defaults as the API, 24 hours until now.
+        end = _to_utc(end_time) or datetime.now(timezone.utc)
+        start = _to_utc(start_time) or end - timedelta(hours=24)
+
+        # Split the range into equally sized windows.
+        step = (end - start) / windows
+        edges = [start + step * i for i in range(windows)] + [end]
+
+        def fetch(window_start: datetime, window_end: datetime) -> list:
+            return dtrequests.DTRequest.paginated_get(
+                url=url,
+                pagination_key='events',
+                params=EventHistory._events_params(
+                    event_types, window_start, window_end,
+                ),
+                **kwargs,
+            )
+
+        with ThreadPoolExecutor(max_workers=windows) as executor:
+            pages = list(executor.map(fetch, edges[:-1], edges[1:]))
+
+        # Remove duplicates at window edges by their event ID.
+        unique: dict[str, dict] = {}
+        for page in pages:
+            for event in page:
+                unique.setdefault(event['eventId'], event)
+
+        events = Event.from_mixed_list(list(unique.values()), lazy)
+        events.sort(key=_event_sort_key)
+
+        return EventHistory(events)
+
+    @staticmethod
+    def _list_events_cached(url: str,
+                            device_id: str,
+                            project_id: str,
+                            event_types: Optional[list[str]],
+                            start_time: Optional[str | datetime],
+                            end_time: Optional[str | datetime],
+                            lazy: bool,
+                            cache: EventCache,
+                            **kwargs: Any,
+                            ) -> EventHistory:
+        """
+        Serves the events from the cache, which fetches
+        only the parts of the time range it is missing.
+
+        """
+
+        # Resolve the same defaults as the API, 24 hours until now.
+        end = _to_utc(end_time) or datetime.now(timezone.utc)
+        start = _to_utc(start_time) or end - timedelta(hours=24)
+
+        def fetch(window_start: datetime, window_end: datetime) -> list:
+            return dtrequests.DTRequest.paginated_get(
+                url=url,
+                pagination_key='events',
+                params=EventHistory._events_params(
+                    event_types, window_start, window_end,
+                ),
+                **kwargs,
+            )
+
+        events = cache.list_events(
+            project_id=project_id,
+            device_id=device_id,
+            event_types=event_types,
+            start_time=start,
+            end_time=end,
+            fetch=fetch,
         )
 
-        # Return list of Event objects of paginated GET response.
-        return EventHistory(Event.from_mixed_list(res))
+        return EventHistory(Event.from_mixed_list(events, lazy))
+
+    @staticmethod
+    def _list_events_with_backoff(device_id: str,
+                                  project_id: str,
+                                  params: dict,
+                                  backoff: _RateLimitBackoff,
+                                  **kwargs: Any,
+                                  ) -> EventHistory:
+        """
+        Pages through the event history of a single device. If a page
+        is rate limited, all workers sharing the backoff are paused
+        before the same page is requested again.
+
+        Requests are retried on their own as usual, except when rate
+        limited, which is instead retried after the shared pause.
 
-    def _to_dataframe_format(self) -> list[dict]:
         """
-        Experimental function to convert a list of events to a list
-        of dictionaries of a DataFrame friendly format.
 
-        The fields `device_id`, `event_id`, and `event_type` are static, then
-        one additional fields are added for every eventData field.
+        url = '/projects/{}/devices/{}/events'.format(project_id, device_id)
+        request_attempts = kwargs.get(
+            'request_attempts', disruptive.request_attempts,
+        )
+        retry_policy = kwargs.get('retry_policy', disruptive.retry_policy)
+        page_kwargs = dict(kwargs, retry_rate_limited=False)
+
+        results: list = []
+        retries = retry_policy.begin(request_attempts)
+        while backoff.wait():
+            try:
+                response = dtrequests.DTRequest.get(
+                    url, params=params, **page_kwargs,
+                )
+            except dterrors.TooManyRequests as e:
+                sleeptime = retries.next_sleep(e.retry_after)
+                if sleeptime is None:
+                    raise e
+                backoff.pause(sleeptime)
+                continue
+
+            retries = retry_policy.begin(request_attempts)
+            results += response['events']
+
+            if len(response['nextPageToken']) > 0:
+                params['pageToken'] = response['nextPageToken']
+            else:
+                break
+
+        return EventHistory(Event.from_mixed_list(results))
+
+    def to_columnar(self) -> ColumnarEventHistory:
+        """
+        Converts the events into a :class:`ColumnarEventHistory`.
 
         Returns
         -------
-        rows : list[dict]
-            List of event dictionaries.
+        history : ColumnarEventHistory
+            Columns of all events in the list, per event type.
 
         """
 
-        rows = []
-        for event in self:
-            base = {
-                'device_id': event.device_id,
-                'event_id': event.event_id,
-                'event_type': event.event_type,
-            }
+        return ColumnarEventHistory(event._raw for event in self)
 
-            if event.event_type == disruptive.events.TEMPERATURE:
-                rows += [{
-                        **base,
-                        **sample.raw,
-                    } for sample in event.data.samples
-                ]
-            else:
-                rows.append({**base, **event.data.raw})
+    def to_arrow(self) -> dict[str, Any]:
+        """
+        Converts events into one pyarrow RecordBatch per event type, each
+        with the fixed schema of its type. The batches are built directly
+        from the raw events, without converting row by row.
+        See :meth:`ColumnarEventHistory.to_arrow`.
+
+        Requires the installation of additional packages.
+        >> pip install pyarrow
+        or
+        >> pip install disruptive[extra]
 
-        return rows
+        Returns
+        -------
+        batches : dict[str, pyarrow.RecordBatch]
+            RecordBatch of each event type, keyed by event type.
+            Unlike :meth:`to_pandas`, temperature samples are not
+            expanded into rows of their own.
+
+        Raises
+        ------
+        ModuleNotFoundError
+            If the pyarrow package is not installed.
+
+        """
+
+        return self.to_columnar().to_arrow()
+
+    def _to_dataframe_format(self) -> Any:
+        """
+        Converts the events into a pyarrow Table of a DataFrame friendly
+        format, built column by column from :meth:`to_columnar`.
+
+        The columns `device_id`, `event_id`, and `event_type` are static,
+        then one column, in snake_case, is added for every eventData field
+        of the included event types. Temperature events have one row per
+        sample, with its `value` and `sample_time`. Rows are in the order
+        of the events.
+
+        Returns
+        -------
+        table : pyarrow.Table
+            Table of all events.
+
+        """
+
+        pa = _import_pyarrow()
+        np = _import_numpy()
+        import pyarrow.compute as pc  # type: ignore
+
+        # Position of each event in the list, per event type.
+        positions: dict[str, array] = {}
+        for i, event in enumerate(self):
+            positions.setdefault(event.event_type, array('q')).append(i)
+
+        columnar = self.to_columnar()
+        tables = [
+            table._to_frame(np.frombuffer(positions[t], dtype=np.int64))
+            for t, table in columnar.tables.items()
+        ]
+        table = pa.concat_tables(tables, promote_options='default')
+
+        # Rows of each event type are in order, but not between types.
+        if len(tables) > 1:
+            table = table.take(pc.sort_indices(table.column('_index')))
+        return table.drop_columns(['_index'])
 
     def to_pandas(self) -> Any:
         """
         Experimental function to convert events into a pandas DataFrame.
         See `_to_dataframe_format()` for column information.
 
+        The columns are handed over from Arrow, with timestamps as
+        datetimes in UTC and repeated strings as categoricals.
+
         Requires the installation of additional packages.
-        >> pip install pandas
+        >> pip install pandas pyarrow
         or
         >> pip install disruptive[extra]
 
         Raises
         ------
         ModueNotFoundError
-            If the pandas package is not installed.
+            If the pandas or pyarrow package is not installed.
 
         """
 
@@ -160,18 +821,10 @@ class EventHistory(list):
                 '>> pip install disruptive[extra]'
             )
 
-        rows = self._to_dataframe_format()
-
-        df = pandas.json_normalize(
-            rows, None, ['device_id', 'event_id', 'event_type'],
-            errors='ignore',
-        )
-
-        # Convert columns headers from camelCase to snake_case for consistency.
-        map = {name: dttrans.camel_to_snake_case(name) for name in df.columns}
-        df = df.rename(columns=map)
+        if len(self) == 0:
+            return pandas.DataFrame()
 
-        return df
+        return self._to_dataframe_format().to_pandas()
 
     def to_polars(self) -> Any:
         """
@@ -179,14 +832,14 @@ class EventHistory(list):
         See `_to_dataframe_format()` for column information.
 
         Requires the installation of additional packages.
-        >> pip install polars
+        >> pip install polars pyarrow
         or
         >> pip install disruptive[extra]
 
         Raises
         ------
         ModueNotFoundError
-            If the polars package is not installed.
+            If the polars or pyarrow package is not installed.
 
         """
 
@@ -194,24 +847,68 @@ class EventHistory(list):
             import polars as pl  # type: ignore
         except ModuleNotFoundError:
             raise ModuleNotFoundError(
-                'Missing package `pandas`.\n\n'
+                'Missing package `polars`.\n\n'
                 'to_dataframe() requires additional third-party packages.\n'
                 '>> pip install disruptive[extra]'
             )
 
-        rows = self._to_dataframe_format()
+        if len(self) == 0:
+            return pl.DataFrame()
+
+        return pl.from_arrow(self._to_dataframe_format())
 
-        df = pl.DataFrame(rows)
 
-        # Convert columns headers from camelCase to snake_case for consistency.
-        map = {name: dttrans.camel_to_snake_case(name) for name in df.columns}
-        df = df.rename(mapping=map)
+def _to_utc(ts: Optional[str | datetime]) -> Optional[datetime]:
+    # Naive datetimes are treated as UTC, like in to_iso8601().
+    ts_datetime = dttrans.to_datetime(ts)
+    if ts_datetime is not None and ts_datetime.tzinfo is None:
+        ts_datetime = ts_datetime.replace(tzinfo=timezone.utc)
+    return ts_datetime
 
-        # Convert timestamp columns to datetime type.
-        if 'update_time' in df.columns \
-                and df['update_time'].dtype == pl.String:
-            df = df.with_columns([
-                pl.col('update_time').str.to_datetime(),
-            ])
 
-        return df
+def _event_sort_key(event: Event) -> datetime:
+    # Sorts on the same timestamp as event.data, but read from the raw
+    # event so that lazily constructed events are not decoded.
+    raw = event._raw
+    data = raw.get('data', {}).get(raw.get('eventType'))
+    if isinstance(data, dict):
+        timestamp = data.get('updateTime')
+    else:
+        # Only labelsChanged has no data field of its own type.
+        timestamp = raw.get('timestamp')
+
+    # Events without a timestamp are placed first.
+    if isinstance(timestamp, (str, datetime)):
+        return _to_utc(timestamp) or datetime.min.replace(tzinfo=timezone.utc)
+    return datetime.min.replace(tzinfo=timezone.utc)
+
+
+class _RateLimitBackoff():
+    """
+    Shared between workers so that when one is rate limited,
+    all of them wait before sending their next request.
+
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+        self._stopped = threading.Event()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def pause(self, seconds: float) -> None:
+        dtlog.warning('Rate limited. Pausing requests for {}s.'.format(
+            seconds
+        ))
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.time() + seconds)
+
+    def wait(self) -> bool:
+        # Returns False once the workers have been stopped.
+        with self._lock:
+            remaining = self._resume_at - time.time()
+        if remaining > 0:
+            time.sleep(remaining)
+        return not self._stopped.is_set()
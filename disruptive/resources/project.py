@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Any
+from typing import Optional, Any, Generator
 
 import disruptive.requests as dtrequests
 from disruptive.outputs import OutputBase, Member
@@ -129,6 +129,42 @@ class Project(OutputBase):
 
         """
 
+        return list(cls.iter_projects(
+            organization_id=organization_id,
+            query=query,
+            **kwargs,
+        ))
+
+    @classmethod
+    def iter_projects(cls,
+                      organization_id: Optional[str] = None,
+                      query: Optional[str] = None,
+                      prefetch: bool = False,
+                      **kwargs: Any,
+                      ) -> Generator[Project, None, None]:
+        """
+        Same as :meth:`list_projects`, but yields the projects page by page
+        as they are fetched instead of returning them all in a list.
+
+        Parameters
+        ----------
+        prefetch : bool, optional
+            If True, the next page is fetched in the background
+            while the projects of the current page are yielded.
+
+        Returns
+        -------
+        projects : Generator[Project]
+            Yields objects each representing a project.
+
+        Examples
+        --------
+        >>> # Print the name of every available project.
+        >>> for project in dt.Project.iter_projects():
+        ...     print(project.display_name)
+
+        """
+
         # Construct URL.
         url = '/projects'
 
@@ -139,14 +175,16 @@ class Project(OutputBase):
         if query is not None:
             params['query'] = query
 
-        # Return list of Project objects of paginated GET response.
-        responses = dtrequests.DTRequest.paginated_get(
+        # Yield Project objects of paginated GET response.
+        responses = dtrequests.DTRequest.paginated_iter(
             url=url,
             pagination_key='projects',
             params=params,
+            prefetch=prefetch,
             **kwargs,
         )
-        return [cls(r) for r in responses]
+        for r in responses:
+            yield cls(r)
 
     @classmethod
     def create_project(cls,
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import time
+from collections import deque
 from typing import Generator, Optional, Any
 
 import disruptive.requests as dtrequests
+import disruptive.errors as dterrors
 from disruptive.events.events import Event
+from disruptive.resources.eventhistory import EventHistory, _event_sort_key
+
+# Number of recent event IDs remembered to drop backfilled duplicates.
+_BACKFILL_MEMORY = 10000
+
+# Maximum number of devices backfilled at the same time.
+_BACKFILL_WORKERS = 8
 
 
 class Stream():
@@ -19,6 +29,7 @@ class Stream():
                      label_filters: Optional[dict] = None,
                      device_types: Optional[list[str]] = None,
                      event_types: Optional[list[str]] = None,
+                     backfill: bool = False,
                      **kwargs: Any,
                      ) -> Generator:
         """
@@ -26,7 +37,12 @@ class Stream():
 
         Implements a basic retry-routine. If connection is lost, the stream
         will attempt to reconnect with an exponential backoff. Events that
-        are published during reconnection are not accounted for.
+        are published during reconnection are not accounted for, unless
+        `backfill` is set. The events missed from each device are then
+        fetched from the event history once reconnected, starting at the
+        last event received from it, and events already yielded are
+        skipped by their event ID. Devices that have sent no event since
+        the stream started are not backfilled.
 
         If you want to forward your data in a server-to-server
         integration, consider using Data Connectors for a simpler
@@ -47,6 +63,9 @@ class Stream():
             :ref:`type(s) <device_type_constants>`.
         event_types : list[str], optional
             Only includes events of the specified :ref:`type(s) <event_types>`.
+        backfill : bool, optional
+            If True, events published while reconnecting are fetched
+            from the event history and yielded before resuming.
         **kwargs
             Arbitrary keyword arguments.
             See the :ref:`Configuration <configuration>` page.
@@ -85,7 +104,161 @@ class Stream():
 
         """
 
+        for event in Stream._stream_events(
+            project_id=project_id,
+            device_ids=device_ids,
+            label_filters=label_filters,
+            device_types=device_types,
+            event_types=event_types,
+            backfill=backfill,
+            **kwargs,
+        ):
+            if event is not None:
+                yield event
+
+    @staticmethod
+    def batched_event_stream(project_id: str,
+                             device_ids: Optional[list[str]] = None,
+                             label_filters: Optional[dict] = None,
+                             device_types: Optional[list[str]] = None,
+                             event_types: Optional[list[str]] = None,
+                             backfill: bool = False,
+                             max_batch_size: int = 100,
+                             max_latency: float = 1.0,
+                             **kwargs: Any,
+                             ) -> Generator:
+        """
+        Same as :meth:`event_stream`, but yields lists of events.
+
+        A batch is yielded once it holds `max_batch_size` events, or its
+        first event has waited `max_latency` seconds, whichever comes first.
+        The stream receives a ping every 10 seconds, so a quiet stream
+        flushes at most this long after `max_latency` has passed.
+
+        Parameters
+        ----------
+        max_batch_size : int, optional
+            Maximum number of events in a batch.
+        max_latency : float, optional
+            Seconds an event may wait before its batch is yielded.
+
+        Returns
+        -------
+        stream : Generator
+            A python Generator type that yields lists of new events.
+
+        Examples
+        --------
+        >>> # Stream events from all devices in a project,
+        >>> # at most 500 at a time and no older than 5 seconds.
+        >>> for events in dt.Stream.batched_event_stream(
+        ...     project_id='<PROJECT_ID>',
+        ...     max_batch_size=500,
+        ...     max_latency=5,
+        ... ):
+        ...     print(len(events))
+
+        """
+
+        # Check that batch limits are valid.
+        if max_batch_size <= 0:
+            raise dterrors.ConfigurationError(
+                'Parameter max_batch_size has value {}, but must be '
+                'integer greater than 0.'.format(max_batch_size)
+            )
+        if max_latency < 0:
+            raise dterrors.ConfigurationError(
+                'Parameter max_latency has value {}, but must be '
+                'non-negative.'.format(max_latency)
+            )
+
+        batch: list[Event] = []
+        batch_started = 0.0
+        events = Stream._stream_events(
+            project_id=project_id,
+            device_ids=device_ids,
+            label_filters=label_filters,
+            device_types=device_types,
+            event_types=event_types,
+            backfill=backfill,
+            **kwargs,
+        )
+        try:
+            for event in events:
+                # Pings are None, and only give a chance to flush on time.
+                if event is not None:
+                    if len(batch) == 0:
+                        batch_started = time.monotonic()
+                    batch.append(event)
+
+                if len(batch) > 0 and (
+                    len(batch) >= max_batch_size
+                    or time.monotonic() - batch_started >= max_latency
+                ):
+                    yield batch
+                    batch = []
+        except Exception:
+            # Events already received are not lost if the stream fails.
+            if len(batch) > 0:
+                yield batch
+            raise
+
+        # Flush what is left if the stream is stopped.
+        if len(batch) > 0:
+            yield batch
+
+    @staticmethod
+    def _stream_events(project_id: str,
+                       device_ids: Optional[list[str]],
+                       label_filters: Optional[dict],
+                       device_types: Optional[list[str]],
+                       event_types: Optional[list[str]],
+                       backfill: bool,
+                       **kwargs: Any,
+                       ) -> Generator[Optional[Event], None, None]:
+        """
+        Yields each event in the stream, or None for each ping.
+
+        """
+
         # Construct parameters dictionary.
+        params = Stream._stream_params(
+            device_ids, label_filters, device_types, event_types,
+        )
+
+        if backfill:
+            kwargs['backfill'] = Stream._backfill_routine(
+                project_id=project_id,
+                event_types=event_types,
+                **kwargs,
+            )
+        recent_ids = _RecentEventIds(_BACKFILL_MEMORY)
+
+        # Relay generator output.
+        url = '/projects/{}/devices:stream'.format(project_id)
+        for event in dtrequests.DTRequest.stream(
+            url, params=params, yield_pings=True, **kwargs,
+        ):
+            if event['eventType'] == 'ping':
+                yield None
+                continue
+
+            # Skip events both backfilled and received in the stream.
+            if backfill and not recent_ids.add(event['eventId']):
+                continue
+            yield Event(event)
+
+    @staticmethod
+    def _stream_params(device_ids: Optional[list[str]],
+                       label_filters: Optional[dict],
+                       device_types: Optional[list[str]],
+                       event_types: Optional[list[str]],
+                       ) -> dict:
+        """
+        Constructs the stream request parameters.
+
+        """
+
         params: dict = dict()
         if device_ids is not None:
             params['device_ids'] = device_ids
@@ -102,7 +275,63 @@ class Stream():
         if event_types is not None:
             params['event_types'] = event_types
 
-        # Relay generator output.
-        url = '/projects/{}/devices:stream'.format(project_id)
-        for event in dtrequests.DTRequest.stream(url, params=params, **kwargs):
-            yield Event(event)
+        return params
+
+    @staticmethod
+    def _backfill_routine(project_id: str,
+                          event_types: Optional[list[str]],
+                          **kwargs: Any,
+                          ) -> Any:
+        """
+        Returns a function fetching the events of each device since its
+        last received event, in time order, as raw event dictionaries.
+
+        """
+
+        def backfill(cursors: dict[str, tuple[str, str]]) -> list[dict]:
+            # Each device is fetched from the timestamp of its last
+            # received event, which is itself left out.
+            received = {event_id for _, event_id in cursors.values()}
+            histories = EventHistory._iter_histories(
+                project_id=project_id,
+                params={
+                    device_id: EventHistory._events_params(
+                        event_types, timestamp, None,
+                    ) for device_id, (timestamp, _) in cursors.items()
+                },
+                max_workers=_BACKFILL_WORKERS,
+                **kwargs,
+            )
+
+            events = EventHistory([
+                event for _, history in histories for event in history
+                if event.event_id not in received
+            ])
+            events.sort(key=_event_sort_key)
+            return [event._raw for event in events]
+
+        return backfill
+
+
+class _RecentEventIds():
+    """
+    Remembers a bounded number of the most recently seen event IDs.
+
+    """
+
+    def __init__(self, maxlen: int) -> None:
+        self._order: deque[str] = deque()
+        self._ids: set[str] = set()
+        self._maxlen = maxlen
+
+    def add(self, event_id: str) -> bool:
+        # Returns False if the ID has already been seen.
+        if event_id in self._ids:
+            return False
+
+        self._order.append(event_id)
+        self._ids.add(event_id)
+        if len(self._order) > self._maxlen:
+            self._ids.discard(self._order.popleft())
+
+        return True
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import time
+import random
+import threading
+from typing import Optional
+
+import disruptive.logging as dtlog
+import disruptive.errors as dterrors
+
+
+class RetryBudget():
+    """
+    Limits retries across all requests in a process, so that an outage
+    does not multiply the load on the API with retries.
+
+    Every call deposits `ratio` of a retry into the budget, and every
+    retry withdraws one. Once the budget is spent, failing calls raise
+    their error at once, until enough new calls have refilled it. This
+    applies even to calls with a larger `request_attempts` of their
+    own. Pass a `retry_policy` without a budget to such calls to have
+    every attempt made.
+
+    Parameters
+    ----------
+    ratio : float, optional
+        Retries earned per call.
+    capacity : float, optional
+        Retries available up front, and the most that can be saved up.
+
+    """
+
+    def __init__(self, ratio: float = 0.2, capacity: float = 10) -> None:
+        # Check that ratio >= 0 and capacity >= 1.
+        if ratio < 0 or capacity < 1:
+            raise dterrors.ConfigurationError(
+                'Retry budget has ratio {} and capacity {}, but must have '
+                'ratio at least 0 and capacity at least 1.'.format(
+                    ratio, capacity,
+                )
+            )
+
+        self.ratio = ratio
+        self.capacity = capacity
+
+        self._lock = threading.Lock()
+        self._balance = float(capacity)
+
+    @property
+    def balance(self) -> float:
+        """Retries currently available."""
+        return self._balance
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy():
+    """
+    Decides if, and how long after, a failed request is retried.
+
+    Sleeps follow decorrelated jitter, each drawn uniformly between
+    `base` and three times the previous sleep, capped at `cap`. This
+    spreads out retries from concurrent callers instead of having them
+    hit the API in lockstep. A Retry-After given by the API is always
+    waited out in full.
+
+    The package-wide policy is `disruptive.retry_policy`. Single calls
+    can override it with the `retry_policy` keyword argument.
+
+    Parameters
+    ----------
+    base : float, optional
+        Shortest sleep between attempts, in seconds.
+    cap : float, optional
+        Longest sleep between attempts, in seconds.
+    deadline : float, optional
+        If given, seconds from the first attempt after which a call
+        is no longer retried, including the time spent sleeping.
+    budget : RetryBudget, optional
+        If given, retries are withdrawn from this budget, which can
+        be shared between policies.
+
+    """
+
+    def __init__(self,
+                 base: float = 0.5,
+                 cap: float = 30.0,
+                 deadline: Optional[float] = None,
+                 budget: Optional[RetryBudget] = None,
+                 ) -> None:
+        # Check that 0 < base <= cap.
+        if not 0 < base <= cap:
+            raise dterrors.ConfigurationError(
+                'Retry policy has base {} and cap {}, but must have '
+                'base greater than 0 and at most cap.'.format(base, cap)
+            )
+
+        # Check that deadline > 0.
+        if deadline is not None and deadline <= 0:
+            raise dterrors.ConfigurationError(
+                'Retry policy has deadline {}, but must be float '
+                'greater than 0.'.format(deadline)
+            )
+
+        self.base = base
+        self.cap = cap
+        self.deadline = deadline
+        self.budget = budget
+
+    def begin(self, request_attempts: int) -> Backoff:
+        """
+        Starts the retry schedule of a single call.
+
+        Parameters
+        ----------
+        request_attempts : int
+            Maximum number of retries, which may be cut
+            short by the budget of the policy.
+
+        Returns
+        -------
+        backoff : Backoff
+            Tracks the attempts and sleeps of the call.
+
+        """
+
+        if self.budget is not None:
+            self.budget.deposit()
+        return Backoff(self, request_attempts)
+
+
+class Backoff():
+    """
+    Retry schedule of a single call, started by :meth:`RetryPolicy.begin`.
+
+    Attributes
+    ----------
+    attempt : int
+        Number of retries made so far.
+
+    """
+
+    def __init__(self, policy: RetryPolicy, request_attempts: int) -> None:
+        self.policy = policy
+        self.request_attempts = request_attempts
+        self.attempt = 0
+
+        self._start = time.monotonic()
+        self._previous = policy.base
+
+    def next_sleep(self,
+                   retry_after: Optional[float] = None,
+                   ) -> Optional[float]:
+        """
+        Claims another retry.
+
+        Parameters
+        ----------
+        retry_after : float, optional
+            Seconds the API asked to wait before retrying.
+
+        Returns
+        -------
+        sleeptime : float, None
+            Seconds to sleep before retrying, or None if the call
+            has run out of attempts, time, or retry budget.
+
+        """
+
+        policy = self.policy
+        if self.attempt >= self.request_attempts:
+            return None
+
+        sleeptime = min(
+            policy.cap, random.uniform(policy.base, self._previous * 3),
+        )
+        self._previous = sleeptime
+        if retry_after is not None:
+            sleeptime = max(sleeptime, retry_after)
+
+        # Give up rather than sleep past the deadline.
+        if policy.deadline is not None:
+            elapsed = time.monotonic() - self._start
+            if elapsed + sleeptime > policy.deadline:
+                dtlog.warning('Retry deadline of {}s reached.'.format(
+                    policy.deadline,
+                ))
+                return None
+
+        if policy.budget is not None and not policy.budget.withdraw():
+            dtlog.warning('Retry budget exhausted.')
+            return None
+
+        self.attempt += 1
+        return sleeptime
+
+
+def retry_after(error: Optional[Exception]) -> Optional[float]:
+    """
+    Returns the seconds the API asked to wait before
+    retrying the request that raised `error`, if any.
+    Only streams retry a CircuitBreakerOpen, as other
+    requests raise it at once.
+
+    """
+
+    if isinstance(error, (dterrors.TooManyRequests,
+                          dterrors.CircuitBreakerOpen)):
+        return error.retry_after
+    return None
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import re
+import contextlib
+from typing import Optional, Any, Callable, ContextManager
+
+import disruptive as dt
+import disruptive.ratelimit as dtratelimit
+
+# OpenTelemetry is optional. When not installed, all functions
+# return immediately without creating spans.
+try:
+    import opentelemetry.trace as _trace  # type: ignore
+    import opentelemetry.context as _context  # type: ignore
+    import opentelemetry.propagate as _propagate  # type: ignore
+    _installed = True
+except ModuleNotFoundError:
+    _installed = False
+
+# Name and version of the tracer creating all spans.
+TRACER_NAME = 'disruptive'
+
+# Span attribute keys.
+METHOD = 'http.request.method'
+STATUS_CODE = 'http.response.status_code'
+URL_TEMPLATE = 'url.template'
+PROJECT_ID = 'disruptive.project_id'
+RETRY_COUNT = 'disruptive.retry_count'
+PAGE_COUNT = 'disruptive.page_count'
+TOKEN_ENDPOINT = 'disruptive.token_endpoint'
+
+# Reusable context manager for when tracing is disabled.
+_NO_SPAN: ContextManager[Any] = contextlib.nullcontext()
+
+_PROJECT_ID_PATTERN = re.compile(r'/projects/([^/:?]+)')
+
+
+def enabled() -> bool:
+    """
+    Returns True if OpenTelemetry is installed and
+    `disruptive.trace_requests` has not been set to False.
+
+    """
+
+    return _installed and dt.trace_requests
+
+
+def request_span(method: str, url: str) -> ContextManager[Any]:
+    """
+    Returns a context manager with the span of a single API call,
+    including all its retries, set as the current span.
+
+    Parameters
+    ----------
+    method : str
+        Request method.
+    url : str
+        Endpoint URL relative to the base URL.
+
+    """
+
+    if not enabled():
+        return _NO_SPAN
+
+    template = dtratelimit.endpoint_template(url)
+    span: ContextManager[Any] = _tracer().start_as_current_span(
+        '{} {}'.format(method, template),
+        kind=_trace.SpanKind.CLIENT,
+        attributes=_attributes({
+            METHOD: method,
+            URL_TEMPLATE: template,
+            PROJECT_ID: project_id(url),
+        }),
+    )
+    return span
+
+
+def page_span(url: str, page_count: int) -> ContextManager[Any]:
+    """
+    Returns a context manager with the span of fetching
+    a single page of a paginated list.
+
+    Parameters
+    ----------
+    url : str
+        Endpoint URL relative to the base URL.
+    page_count : int
+        Number of pages fetched so far, including this one.
+
+    """
+
+    if not enabled():
+        return _NO_SPAN
+
+    template = dtratelimit.endpoint_template(url)
+    span: ContextManager[Any] = _tracer().start_as_current_span(
+        'paginated_get {}'.format(template),
+        attributes=_attributes({
+            URL_TEMPLATE: template,
+            PROJECT_ID: project_id(url),
+            PAGE_COUNT: page_count,
+        }),
+    )
+    return span
+
+
+def refresh_span(token_endpoint: str) -> ContextManager[Any]:
+    """
+    Returns a context manager with the span of an access token refresh.
+
+    Parameters
+    ----------
+    token_endpoint : str
+        URL the access token is refreshed from.
+
+    """
+
+    if not enabled():
+        return _NO_SPAN
+
+    span: ContextManager[Any] = _tracer().start_as_current_span(
+        'token refresh',
+        attributes={TOKEN_ENDPOINT: token_endpoint},
+    )
+    return span
+
+
+def start_stream_span(url: str, retry_count: int) -> Any:
+    """
+    Starts the span of a stream connection attempt, which is not set as
+    the current span as the stream outlives it. End it with
+    :func:`end_span` once connected or failed.
+
+    Parameters
+    ----------
+    url : str
+        Stream endpoint URL relative to the base URL.
+    retry_count : int
+        Connection attempts since the stream was last connected.
+
+    Returns
+    -------
+    span : Span, None
+        The started span, or None if tracing is disabled.
+
+    """
+
+    if not enabled():
+        return None
+
+    template = dtratelimit.endpoint_template(url)
+    return _tracer().start_span(
+        'stream connect {}'.format(template),
+        kind=_trace.SpanKind.CLIENT,
+        attributes=_attributes({
+            METHOD: 'GET',
+            URL_TEMPLATE: template,
+            PROJECT_ID: project_id(url),
+            RETRY_COUNT: retry_count,
+        }),
+    )
+
+
+def end_span(span: Any,
+             status_code: Optional[int] = None,
+             error: Optional[BaseException] = None,
+             ) -> None:
+    """
+    Ends a span started by :func:`start_stream_span`,
+    recording the response status code or error.
+
+    """
+
+    if span is None:
+        return
+
+    if status_code:
+        span.set_attribute(STATUS_CODE, status_code)
+    if error is not None:
+        span.record_exception(error)
+        span.set_status(_trace.Status(_trace.StatusCode.ERROR, str(error)))
+    span.end()
+
+
+def set_response(span: Any,
+                 status_code: Optional[int],
+                 retry_count: int,
+                 ) -> None:
+    """
+    Records the status code and number of retries of an API call
+    on its span, as given by the context manager of :func:`request_span`.
+
+    """
+
+    if span is None:
+        return
+
+    if status_code:
+        span.set_attribute(STATUS_CODE, status_code)
+    span.set_attribute(RETRY_COUNT, retry_count)
+
+
+def inject(headers: dict, span: Any = None) -> None:
+    """
+    Adds the trace context of `span`, or of the current span if not
+    given, to the headers of an outgoing request.
+
+    """
+
+    if not enabled():
+        return
+
+    ctx = _trace.set_span_in_context(span) if span is not None else None
+    _propagate.inject(headers, context=ctx)
+
+
+def bind(function: Callable) -> Callable:
+    """
+    Wraps a function to run in the current trace context,
+    for when it is called from another thread.
+
+    """
+
+    if not enabled():
+        return function
+
+    ctx = _context.get_current()
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _context.attach(ctx)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _context.detach(token)
+
+    return wrapper
+
+
+def project_id(url: str) -> Optional[str]:
+    """
+    Returns the project ID of an endpoint URL,
+    or None if it does not contain one.
+
+    """
+
+    match = _PROJECT_ID_PATTERN.search(url)
+    return match.group(1) if match is not None else None
+
+
+def _tracer() -> Any:
+    return _trace.get_tracer(TRACER_NAME, dt.__version__)
+
+
+def _attributes(attributes: dict) -> dict:
+    # OpenTelemetry does not accept None valued attributes.
+    return {k: v for k, v in attributes.items() if v is not None}
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import re
 import base64
-from datetime import datetime
-from typing import Optional
+import functools
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Any, Callable, Iterable
 
 import disruptive.errors as dterrors
 
@@ -58,15 +59,7 @@ def to_datetime(ts: Optional[str | datetime]) -> Optional[datetime]:
 
     # If input is string, we might be able to convert it.
     elif isinstance(ts, str):
-        # First, verify if string is valid iso8601 format.
-        if validate_iso8601_format(ts):
-            # Use built-in functions for converting to datetime.
-            return datetime.fromisoformat(ts.replace('Z', '+00:00'))
-        else:
-            # Invalid iso8601 format, raise error.
-            msg = f'Timestamp format [{ts}] is invalid iso8601 format.\n' \
-                'Example: 2020-01-01T00:00:00Z'
-            raise dterrors.FormatError(msg)
+        return _parse(ts)
 
     # If ts is None, return None.
     elif ts is None:
@@ -81,22 +74,180 @@ def to_datetime(ts: Optional[str | datetime]) -> Optional[datetime]:
         raise dterrors._raise_builtin(TypeError, msg)
 
 
+# Set up regex for matching iso8601 string.
+# This should probably be changed in the future as it is
+# a little forced. However, the reason for using this approach is
+# that the datetime built-in method for checking iso8601 format
+# allows missing timezone infromation (i.e. Z or +-00:00 suffix).
+# This must be included in our API, and is why this regex exists.
+_ISO8601 = re.compile(
+    r'^(-?(?:[1-9][0-9]*)?[0-9]{4})-(1[0-2]|0[1-9])-'
+    r'(3[01]|0[1-9]|[12][0-9])T(2[0-3]|[01][0-9]):([0-5][0-9]):'
+    r'([0-5][0-9])?(.[0-9]+)?(Z|[+-](?:2[0-3]|[01][0-9]):[0-5][0-9])$'
+)
+
+
 def validate_iso8601_format(dt_str: str) -> bool:
-    # Set up regex for matching iso8601 string.
-    # This should probably be changed in the future as it is
-    # a little forced. However, the reason for using this approach is
-    # that the datetime built-in method for checking iso8601 format
-    # allows missing timezone infromation (i.e. Z or +-00:00 suffix).
-    # This must be included in our API, and is why this regex exists.
-    iso8601_regex = r'^(-?(?:[1-9][0-9]*)?[0-9]{4})-(1[0-2]|0[1-9])-' \
-        '(3[01]|0[1-9]|[12][0-9])T(2[0-3]|[01][0-9]):([0-5][0-9]):' \
-        '([0-5][0-9])?(.[0-9]+)?(Z|[+-](?:2[0-3]|[01][0-9]):[0-5][0-9])$'
-    match_iso8601 = re.compile(iso8601_regex).match
-
-    if match_iso8601(dt_str) is not None:
-        return True
+    return _ISO8601.match(dt_str) is not None
+
+
+def _is_digits(s: str) -> bool:
+    # Unlike str.isdigit() alone, only ASCII digits are accepted.
+    return s.isascii() and s.isdigit()
+
+
+def _parse_iso8601(ts: str) -> datetime:
+    # Fast path for the shape emitted by the API, YYYY-MM-DDTHH:MM:SSZ
+    # with 0, 3 or 6 fraction digits, which skips the regex entirely.
+    # The shape is checked in full, as fromisoformat() accepts others.
+    n = len(ts)
+    if (n == 20 or ((n == 24 or n == 27) and ts[19] == '.')) \
+            and ts[-1] == 'Z' and ts[10] == 'T' \
+            and ts[4] == ts[7] == '-' and ts[13] == ts[16] == ':' \
+            and _is_digits(
+                ts[:4] + ts[5:7] + ts[8:10] + ts[11:13] + ts[14:16]
+                + ts[17:19] + ts[20:-1]
+            ):
+        try:
+            return datetime.fromisoformat(ts[:-1]).replace(
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+
+    # First, verify if string is valid iso8601 format.
+    if validate_iso8601_format(ts):
+        # Use built-in functions for converting to datetime.
+        return datetime.fromisoformat(ts.replace('Z', '+00:00'))
+    else:
+        # Invalid iso8601 format, raise error.
+        msg = f'Timestamp format [{ts}] is invalid iso8601 format.\n' \
+            'Example: 2020-01-01T00:00:00Z'
+        raise dterrors.FormatError(msg)
+
+
+# Parses a single string, optionally through an LRU cache.
+_parse: Callable[[str], datetime] = _parse_iso8601
+
+
+def set_timestamp_cache_size(maxsize: int) -> None:
+    """
+    Sets the size of the LRU cache of parsed timestamp strings.
+    Useful when the same timestamps are parsed repeatedly, like the
+    update time shared by an event and its samples. Disabled by default.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached timestamps. 0 disables the cache.
+
+    """
+
+    global _parse
+    if maxsize < 0:
+        raise dterrors.ConfigurationError(
+            'Parameter maxsize has value {}, but must be '
+            'integer greater than or equal to 0.'.format(maxsize)
+        )
+    elif maxsize == 0:
+        _parse = _parse_iso8601
     else:
-        return False
+        _parse = functools.lru_cache(maxsize=maxsize)(_parse_iso8601)
+
+
+def to_datetime_batch(timestamps: Iterable[Optional[str]]) -> Any:
+    """
+    Parses many iso8601 timestamps at once.
+
+    If NumPy is installed, an array of type datetime64[ns] in UTC is
+    returned, with NaT for missing timestamps. When all timestamps
+    are in UTC, as emitted by the API, they are only validated one by
+    one and then parsed by NumPy at once. Without NumPy, a list of
+    datetime is returned, with None for missing timestamps.
+
+    Parameters
+    ----------
+    timestamps : Iterable[str]
+        iso8601 timestamps, or None where missing.
+
+    Returns
+    -------
+    timestamps : numpy.ndarray | list[datetime]
+        Parsed timestamps, in the same order.
+
+    """
+
+    timestamps = list(timestamps)
+
+    try:
+        import numpy as np  # type: ignore
+    except ModuleNotFoundError:
+        return [to_datetime(ts) for ts in timestamps]
+
+    # NumPy parses more than iso8601, so the format is validated first.
+    if all(
+        ts is None or (ts[-1:] == 'Z' and _ISO8601.match(ts) is not None)
+        for ts in timestamps
+    ):
+        try:
+            return np.array(
+                ['NaT' if ts is None else ts[:-1] for ts in timestamps],
+                dtype='datetime64[ns]',
+            )
+        except ValueError:
+            # Fall through to report the invalid timestamp.
+            pass
+
+    return np.array([
+        -2**63 if ts is None else to_epoch_ns(ts) for ts in timestamps
+    ], dtype=np.int64).view('datetime64[ns]')
+
+
+# Splits an iso8601 string into whole seconds, fraction and timezone.
+_ISO8601_PARTS = re.compile(
+    r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d+))?'
+    r'(Z|[+-]\d{2}:\d{2})$'
+)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_epoch_ns(ts: str | datetime) -> int:
+    """
+    Converts an iso8601 string or datetime to integer nanoseconds
+    since epoch. Unlike datetime, fractions with more than six
+    digits are kept at full precision.
+
+    Naive datetimes are treated as UTC, like in to_iso8601().
+
+    """
+
+    if isinstance(ts, datetime):
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        return (ts - _EPOCH) // timedelta(microseconds=1) * 1000
+
+    elif isinstance(ts, str):
+        match = _ISO8601_PARTS.match(ts)
+        if match is None:
+            msg = f'Timestamp format [{ts}] is invalid iso8601 format.\n' \
+                'Example: 2020-01-01T00:00:00Z'
+            raise dterrors.FormatError(msg)
+
+        seconds, fraction, tz = match.groups()
+        dt = datetime.fromisoformat(
+            seconds + ('+00:00' if tz == 'Z' else tz)
+        )
+        ns = (dt - _EPOCH) // timedelta(seconds=1) * 1_000_000_000
+        if fraction is not None:
+            ns += int(fraction[:9].ljust(9, '0'))
+        return ns
+
+    else:
+        msg = 'Got timestamp of type <{}>, expected ' \
+            'iso8601 <str> or <datetime>.'.format(
+                type(ts).__name__
+            )
+        raise dterrors._raise_builtin(TypeError, msg)
 
 
 def _celsius_to_fahrenheit(celsius: float) -> float:
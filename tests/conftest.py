@@ -1,8 +1,13 @@
 import pytest
 
-from tests.framework import RequestMock
+from tests.framework import RequestMock, AsyncRequestMock
 
 
 @pytest.fixture()
 def request_mock(mocker):
     return RequestMock(mocker)
+
+
+@pytest.fixture()
+def aio_request_mock(mocker):
+    return AsyncRequestMock(mocker)
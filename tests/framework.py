@@ -1,4 +1,5 @@
 import sys
+import json
 
 import disruptive as dt
 from disruptive.authentication import Unauthenticated
@@ -16,10 +17,18 @@ class RequestsReponseMock():
         self.headers = headers
         self.iter_data = iter_data
         self.encoding = None
+        self.closed = False
 
     def json(self):
         return self._json
 
+    def close(self):
+        self.closed = True
+
+    @property
+    def content(self):
+        return json.dumps(self._json).encode('utf-8')
+
     def iter_lines(self, decode_unicode=False):
         for d in self.iter_data:
             if decode_unicode:
@@ -42,6 +51,10 @@ class RequestMock():
         # We are not interested in these affecting the tests.
         dt.default_auth = dt.Auth.unauthenticated()
 
+        # Start each test with the default retry policy, as
+        # previous tests may have replaced it.
+        dt.retry_policy = dt.RetryPolicy()
+
         self.json = {}
         self.status_code = 200
         self.headers = {}
@@ -49,7 +62,7 @@ class RequestMock():
         self.iter_data = []
 
         self.request_patcher = self._mocker.patch(
-            'requests.request',
+            'requests.Session.request',
             side_effect=self._patched_requests_request,
         )
 
@@ -102,3 +115,100 @@ class RequestMock():
             timeout=timeout,
             stream=stream,
         )
+
+
+class AiohttpResponseMock():
+    """
+    A simple class used to imitate an aiohttp.ClientResponse object.
+
+    """
+
+    def __init__(self, json, status_code, headers, iter_data=[]):
+        self._json = json
+        self.status = status_code
+        self.headers = headers
+        self.content = self._iter_content(iter_data)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def read(self):
+        return json.dumps(self._json).encode('utf-8')
+
+    async def _iter_content(self, iter_data):
+        for d in iter_data:
+            yield d
+
+
+class AiohttpSessionMock():
+    """
+    A simple class used to imitate an aiohttp.ClientSession object.
+
+    """
+
+    def __init__(self, request_mock):
+        self._request_mock = request_mock
+
+    def request(self, **kwargs):
+        return self._request_mock.request_patcher(**kwargs)
+
+
+class AsyncRequestMock():
+
+    def __init__(self, mocker):
+        self._mocker = mocker
+
+        # Reset default authentication to unauthenticated.
+        dt.default_auth = dt.Auth.unauthenticated()
+
+        # Start each test with the default retry policy.
+        dt.retry_policy = dt.RetryPolicy()
+
+        self.json = {}
+        self.status_code = 200
+        self.headers = {}
+        self.iter_data = []
+
+        self.request_patcher = self._mocker.MagicMock(
+            side_effect=self._patched_session_request,
+        )
+
+        self.session_patcher = self._mocker.patch(
+            'disruptive.aio.requests._pooled_session',
+            return_value=AiohttpSessionMock(self),
+        )
+
+        self.auth_expiration_patcher = self._mocker.patch.object(
+            Unauthenticated,
+            '_has_expired',
+            return_value=False,
+        )
+
+        self.sleep_patcher = self._mocker.patch(
+            'asyncio.sleep',
+            side_effect=self._patched_sleep,
+        )
+
+    async def _patched_sleep(self, *args, **kwargs):
+        return None
+
+    def _patched_session_request(self, **kwargs):
+        return AiohttpResponseMock(
+            json=self.json,
+            status_code=self.status_code,
+            headers=self.headers,
+            iter_data=self.iter_data,
+        )
+
+    def assert_request_count(self, n):
+        if self.request_patcher.call_count != n:
+            raise AssertionError
+
+    def assert_requested(self, method, url, params=[]):
+        kwargs = self.request_patcher.call_args.kwargs
+        assert kwargs['method'] == method
+        assert kwargs['url'] == url
+        assert kwargs['params'] == params
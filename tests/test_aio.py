@@ -0,0 +1,277 @@
+import json
+import asyncio
+import threading
+
+import pytest
+
+import disruptive
+import disruptive.errors as dterrors
+import tests.api_responses as dtapiresponses
+from disruptive.aio.requests import AsyncDTRequest
+from disruptive.events import Event
+from tests.framework import AiohttpResponseMock
+
+
+class TestAio():
+
+    def test_get_device(self, aio_request_mock):
+        # Update the response data with device data.
+        aio_request_mock.json = dtapiresponses.touch_sensor
+
+        # Call the awaitable Device.get_device() method.
+        d = asyncio.run(disruptive.aio.Device.get_device('device_id'))
+
+        # Verify expected outgoing request.
+        aio_request_mock.assert_requested(
+            method='GET',
+            url=disruptive.base_url+'/projects/-/devices/device_id',
+        )
+
+        # Assert output is the same type as the blocking counterpart.
+        assert isinstance(d, disruptive.Device)
+        assert d._raw == dtapiresponses.touch_sensor
+
+    def test_list_projects_params(self, aio_request_mock):
+        # Update the response data with project data.
+        aio_request_mock.json = dtapiresponses.projects
+
+        # Call the awaitable Project.list_projects() method.
+        projects = asyncio.run(disruptive.aio.Project.list_projects(
+            organization_id='org_id',
+        ))
+
+        # Verify list parameters are flattened for aiohttp.
+        aio_request_mock.assert_requested(
+            method='GET',
+            url=disruptive.base_url+'/projects',
+            params=[('organization', 'organizations/org_id')],
+        )
+
+        # Assert output types.
+        assert len(projects) == 2
+        for p in projects:
+            assert isinstance(p, disruptive.Project)
+
+    def test_list_events(self, aio_request_mock):
+        # Update the response data with event history data.
+        aio_request_mock.json = dtapiresponses.event_history_each_type
+
+        # Call the awaitable EventHistory.list_events() method.
+        h = asyncio.run(disruptive.aio.EventHistory.list_events(
+            device_id='device_id',
+            project_id='project_id',
+            event_types=['temperature', 'touch'],
+        ))
+
+        # Verify list parameters are flattened for aiohttp.
+        aio_request_mock.assert_requested(
+            method='GET',
+            url=disruptive.base_url
+            + '/projects/project_id/devices/device_id/events',
+            params=[('eventTypes', 'temperature'), ('eventTypes', 'touch')],
+        )
+
+        # Assert output types.
+        assert isinstance(h, disruptive.EventHistory)
+        for e in h:
+            assert isinstance(e, Event)
+
+    def test_pagination(self, aio_request_mock):
+        pages = [
+            {'nextPageToken': '2', 'roles': [{'name': 'roles/a'}]},
+            {'nextPageToken': '1', 'roles': [{'name': 'roles/b'}]},
+            {'nextPageToken': '', 'roles': [{'name': 'roles/c'}]},
+        ]
+
+        def side_effect(**kwargs):
+            aio_request_mock.json = pages.pop(0)
+            return aio_request_mock._patched_session_request(**kwargs)
+        aio_request_mock.request_patcher.side_effect = side_effect
+
+        res = asyncio.run(AsyncDTRequest.paginated_get(
+            '/roles', pagination_key='roles',
+        ))
+
+        # Verify all pages were fetched and concatenated in order.
+        aio_request_mock.assert_request_count(3)
+        assert [r['name'] for r in res] == ['roles/a', 'roles/b', 'roles/c']
+        aio_request_mock.assert_requested(
+            method='GET',
+            url=disruptive.base_url+'/roles',
+            params=[('pageToken', '1')],
+        )
+
+    def test_request_attempts_override(self, aio_request_mock):
+        # Set response status code to force error with retry attemps.
+        aio_request_mock.status_code = 500
+
+        # Catch expected error as retries are exhausted.
+        with pytest.raises(dterrors.InternalServerError):
+            asyncio.run(disruptive.aio.Device.get_device(
+                device_id='device_id',
+                request_attempts=9,
+            ))
+
+        # Verify it did in fact retry that many times.
+        aio_request_mock.assert_request_count(10)
+
+    def test_token_exchange_off_event_loop(self, aio_request_mock, mocker):
+        aio_request_mock.json = dtapiresponses.touch_sensor
+        auth = disruptive.Auth.service_account('key_id', 'secret', 'email')
+
+        # Record the thread in which the blocking exchange is made.
+        threads = []
+
+        def __patched_exchange():
+            threads.append(threading.get_ident())
+            return {'access_token': 'token', 'expires_in': 3600}
+
+        mocker.patch.object(
+            auth, '_get_access_token', side_effect=__patched_exchange,
+        )
+
+        asyncio.run(disruptive.aio.Device.get_device('device_id', auth=auth))
+
+        assert len(threads) == 1
+        assert threads[0] != threading.get_ident()
+        kwargs = aio_request_mock.request_patcher.call_args.kwargs
+        assert kwargs['headers']['Authorization'] == 'Bearer token'
+
+    def test_request_unauthorized(self, aio_request_mock):
+        # Unauthorized should be retried the same as blocking requests.
+        aio_request_mock.status_code = 401
+
+        with pytest.raises(dterrors.Unauthorized):
+            asyncio.run(disruptive.aio.Device.get_device('device_id'))
+
+        aio_request_mock.assert_request_count(3)
+
+    def test_event_stream(self, aio_request_mock):
+        # Set stream responses.
+        ping = dtapiresponses.stream_ping
+        temp = dtapiresponses.stream_temperature_event
+        nstat = dtapiresponses.stream_networkstatus_event
+        aio_request_mock.iter_data = [ping, temp, ping, nstat]
+
+        async def consume():
+            out = []
+            async for e in disruptive.aio.Stream.event_stream(
+                project_id='project_id',
+                event_types=['temperature', 'networkStatus'],
+            ):
+                out.append(e)
+                if len(out) == 2:
+                    break
+            return out
+
+        events = asyncio.run(consume())
+
+        # Pings should be skipped and events converted.
+        assert events[0]._raw == Event(
+            json.loads(temp)['result']['event'])._raw
+        assert events[1]._raw == Event(
+            json.loads(nstat)['result']['event'])._raw
+
+        # Verify list parameters are flattened for aiohttp.
+        kwargs = aio_request_mock.request_patcher.call_args.kwargs
+        assert kwargs['params'] == [
+            ('event_types', 'temperature'),
+            ('event_types', 'networkStatus'),
+            ('ping_interval', '10s'),
+        ]
+
+    def test_event_stream_retry(self, aio_request_mock):
+        # An empty stream ends without error and should be retried.
+        aio_request_mock.iter_data = []
+
+        async def consume():
+            async for _ in disruptive.aio.Stream.event_stream(
+                project_id='project_id',
+                request_attempts=4,
+            ):
+                pass
+
+        with pytest.raises(dterrors.ConnectionError):
+            asyncio.run(consume())
+
+        # Verify request is attempted the set number of times (+1).
+        aio_request_mock.assert_request_count(5)
+
+    def test_stream_multiplexer(self, aio_request_mock):
+        ping = dtapiresponses.stream_ping
+        temp = dtapiresponses.stream_temperature_event
+        unauthorized = json.dumps(
+            {'error': {'code': 401, 'message': 'unauthorized'}}
+        ).encode('utf-8')
+
+        # Each stream yields an event, then fails for good.
+        aio_request_mock.iter_data = [ping, temp, unauthorized]
+
+        mux = disruptive.aio.StreamMultiplexer(
+            project_ids=['p1', 'p2', 'p3'],
+            event_types=['temperature'],
+            buffer_size=1,
+        )
+
+        async def consume():
+            return [e async for e in mux]
+
+        events = asyncio.run(consume())
+
+        # One event from each project should be merged into the iterator.
+        assert len(events) == 3
+        for e in events:
+            assert isinstance(e, Event)
+        aio_request_mock.assert_request_count(3)
+
+        # Verify health statistics of each stream.
+        for project_id, health in mux.health.items():
+            assert health.events_received == 1
+            assert health.last_message_time is not None
+            assert health.failed
+            assert isinstance(health.last_error, dterrors.Unauthorized)
+
+    def test_stream_multiplexer_restart(self, aio_request_mock):
+        temp = dtapiresponses.stream_temperature_event
+        unauthorized = json.dumps(
+            {'error': {'code': 401, 'message': 'unauthorized'}}
+        ).encode('utf-8')
+
+        # Exhaust the request attempts once before succeeding.
+        aio_request_mock.request_patcher.side_effect = [
+            AiohttpResponseMock({}, 200, {}, []),
+            AiohttpResponseMock({}, 200, {}, []),
+            AiohttpResponseMock({}, 200, {}, [temp, unauthorized]),
+        ]
+
+        # Iterate from synchronous code.
+        mux = disruptive.aio.StreamMultiplexer(
+            project_ids=['p1'],
+            request_attempts=1,
+            retry_policy=disruptive.RetryPolicy(base=5, cap=5),
+        )
+        events = list(mux)
+
+        assert len(events) == 1
+        aio_request_mock.assert_request_count(3)
+        assert mux.health['p1'].reconnects == 1
+        assert mux.health['p1'].events_received == 1
+
+        # Restarts back off as given by the retry policy.
+        for c in aio_request_mock.sleep_patcher.call_args_list:
+            assert c.args[0] == 5
+
+    def test_stream_multiplexer_unexpected_error(self, aio_request_mock):
+        aio_request_mock.request_patcher.side_effect = ValueError('bad')
+
+        mux = disruptive.aio.StreamMultiplexer(project_ids=['p1'])
+        events = list(mux)
+
+        # The error should fail the stream rather than end it silently.
+        assert len(events) == 0
+        assert mux.health['p1'].failed
+        assert isinstance(mux.health['p1'].last_error, ValueError)
+
+    def test_stream_multiplexer_buffer_size_invalid(self, aio_request_mock):
+        with pytest.raises(dterrors.ConfigurationError):
+            disruptive.aio.StreamMultiplexer(['p1'], buffer_size=0)
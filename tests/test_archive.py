@@ -0,0 +1,97 @@
+import os
+import copy
+
+import pyarrow.dataset as ds
+import pytest
+
+import disruptive
+import disruptive.errors as dterrors
+import tests.api_responses as dtapiresponses
+
+
+def _temperature_event(event_id, project_id, device_id, update_time):
+    event = copy.deepcopy(dtapiresponses.temperature_event)
+    event['eventId'] = event_id
+    event['targetName'] = 'projects/{}/devices/{}'.format(
+        project_id, device_id,
+    )
+    event['data']['temperature']['updateTime'] = update_time
+    return event
+
+
+EVENTS = [
+    _temperature_event('1', 'p1', 'a', '2024-01-01T10:00:00Z'),
+    _temperature_event('2', 'p1', 'a', '2024-01-02T10:00:00Z'),
+    _temperature_event('3', 'p1', 'b', '2024-01-01T11:00:00Z'),
+    _temperature_event('4', 'p2', 'c', '2024-01-01T12:00:00Z'),
+]
+
+
+def _partitions(path):
+    return sorted(
+        os.path.relpath(root, path) for root, _, files in os.walk(path)
+        if len(files) > 0
+    )
+
+
+class TestArchive():
+
+    def test_partitions(self, tmp_path):
+        for file_format in ['parquet', 'feather']:
+            path = str(tmp_path / file_format)
+            with disruptive.EventHistoryWriter(path, file_format) as writer:
+                writer.write(EVENTS[:2])
+                writer.write(EVENTS[2:])
+
+            prefix = os.path.join('{}', 'device_id={}', 'event_type={}', '{}')
+            assert _partitions(path) == [
+                prefix.format('project_id=p1', 'a', 'temperature',
+                              'date=2024-01-01'),
+                prefix.format('project_id=p1', 'a', 'temperature',
+                              'date=2024-01-02'),
+                prefix.format('project_id=p1', 'b', 'temperature',
+                              'date=2024-01-01'),
+                prefix.format('project_id=p2', 'c', 'temperature',
+                              'date=2024-01-01'),
+            ]
+            assert len(writer.files) == 4
+
+            table = ds.dataset(
+                path, format=file_format, partitioning='hive',
+            ).to_table()
+            assert sorted(table.column('event_id').to_pylist()) == [
+                '1', '2', '3', '4',
+            ]
+
+    def test_append_and_overwrite(self, tmp_path):
+        path = str(tmp_path)
+
+        with disruptive.EventHistoryWriter(path) as writer:
+            writer.write(EVENTS[:1])
+        with disruptive.EventHistoryWriter(path, mode='append') as writer:
+            writer.write(EVENTS[:1])
+        assert len(ds.dataset(path, partitioning='hive').to_table()) == 2
+
+        with disruptive.EventHistoryWriter(path, mode='overwrite') as writer:
+            writer.write(EVENTS[:1])
+        assert len(ds.dataset(path, partitioning='hive').to_table()) == 1
+
+    def test_max_open_files(self, tmp_path):
+        path = str(tmp_path)
+
+        # Closed partitions get a new file when written to again.
+        with disruptive.EventHistoryWriter(path, max_open_files=1) as writer:
+            writer.write(EVENTS[:2])
+            writer.write(EVENTS[:1])
+        assert len(writer.files) == 3
+        assert len(ds.dataset(path, partitioning='hive').to_table()) == 3
+
+    def test_invalid_arguments(self, tmp_path):
+        for kwargs in [
+            {'file_format': 'csv'},
+            {'mode': 'error'},
+            {'row_group_size': 0},
+            {'max_open_files': 0},
+        ]:
+            with pytest.raises(dterrors.ConfigurationError):
+                disruptive.EventHistoryWriter(str(tmp_path), **kwargs)
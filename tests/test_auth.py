@@ -1,9 +1,16 @@
+import os
+import sys
+import time
+import threading
+
 import pytest
 
 import disruptive
 import disruptive.errors as dterrors
 import tests.api_responses as dtapiresponses
-from disruptive.authentication import ServiceAccountAuth
+from disruptive.authentication import (
+    ServiceAccountAuth, TokenStore, FileTokenStore,
+)
 
 
 class TestAuth():
@@ -54,6 +61,197 @@ class TestAuth():
         # Verify non-expired token.
         assert not auth._has_expired()
 
+    def test_token_refresh_single_flight(self, request_mock):
+        res = dtapiresponses.auth_token_fresh
+        request_mock.json = res
+
+        auth = disruptive.Auth.service_account('key_id', 'secret', 'email')
+
+        # Many threads seeing the expired token should refresh it once.
+        barrier = threading.Barrier(8)
+
+        def get_token():
+            barrier.wait()
+            auth.get_token()
+
+        threads = [threading.Thread(target=get_token) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        request_mock.assert_request_count(1)
+        assert auth.refresh_count == 1
+
+    def test_token_refresh_in_background(self, request_mock):
+        res = dtapiresponses.auth_token_fresh
+        request_mock.json = res
+
+        auth = disruptive.Auth.service_account('key_id', 'secret', 'email')
+        auth.refresh_margin = 120
+        auth._expiration = time.time() + 60
+        auth._token = 'Bearer old'
+
+        # The current token is returned while renewed in the background.
+        assert auth.get_token() == 'Bearer old'
+        auth._background.join()
+
+        request_mock.assert_request_count(1)
+        assert auth.refresh_count == 1
+        assert auth._expiration > time.time() + 3000
+
+        # A fresh token is not refreshed again.
+        auth.get_token()
+        request_mock.assert_request_count(1)
+
+    def test_token_refresh_in_background_not_blocking(self, mocker):
+        auth = disruptive.Auth.service_account('key_id', 'secret', 'email')
+        auth._expiration = time.time() + 30
+        auth._token = 'Bearer old'
+
+        # Hold the exchange until released.
+        exchanging = threading.Event()
+        release = threading.Event()
+
+        def __patched_exchange():
+            exchanging.set()
+            release.wait()
+            return {'access_token': 'new', 'expires_in': 3600}
+
+        mocker.patch.object(
+            auth, '_get_access_token', side_effect=__patched_exchange,
+        )
+
+        assert auth.get_token() == 'Bearer old'
+        assert exchanging.wait(5)
+
+        # Requests do not wait while the valid token is being renewed.
+        tokens = []
+        t = threading.Thread(target=lambda: tokens.append(auth.get_token()))
+        try:
+            t.start()
+            t.join(1)
+            assert tokens == ['Bearer old']
+        finally:
+            release.set()
+        auth._background.join()
+        assert auth.get_token() == 'Bearer new'
+        assert auth.refresh_count == 1
+
+    def test_refresh(self, request_mock):
+        request_mock.json = dtapiresponses.auth_token_fresh
+
+        auth = disruptive.Auth.service_account('key_id', 'secret', 'email')
+        auth.refresh()
+
+        request_mock.assert_request_count(1)
+        assert auth.refresh_count == 1
+
+    def test_token_refresh_in_background_failure(self, request_mock):
+        request_mock.status_code = 400
+
+        auth = disruptive.Auth.service_account('key_id', 'secret', 'email')
+        auth._expiration = time.time() + 30
+        auth._token = 'Bearer old'
+
+        # Failing in the background keeps the current token.
+        assert auth.get_token() == 'Bearer old'
+        auth._background.join()
+        assert auth.refresh_count == 0
+
+        # Retries wait for the retry interval.
+        background = auth._background
+        auth.get_token()
+        assert auth._background is background
+
+    def test_file_token_store(self, tmp_path):
+        store = FileTokenStore(str(tmp_path))
+
+        assert store.get('key') is None
+        store.set('key', 'Bearer token', 123.0)
+        assert store.get('key') == ('Bearer token', 123.0)
+        with store.lock('key'):
+            store.set('key', 'Bearer other', 456.0)
+        assert store.get('key') == ('Bearer other', 456.0)
+
+    def test_token_store_abstract(self):
+        with pytest.raises(TypeError):
+            TokenStore()
+
+    def test_file_token_store_default_path(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+        monkeypatch.setenv('LOCALAPPDATA', str(tmp_path))
+
+        # Tokens are kept in a directory of the user's own.
+        store = FileTokenStore()
+        assert store.path == str(tmp_path / 'disruptive' / 'tokens')
+
+    @pytest.mark.skipif(sys.platform == 'win32', reason='POSIX permissions')
+    def test_file_token_store_shared_dir(self, tmp_path):
+        # A directory others can write to could have planted tokens.
+        path = tmp_path / 'tokens'
+        path.mkdir()
+        os.chmod(str(path), 0o777)
+
+        with pytest.raises(dterrors.ConfigurationError):
+            FileTokenStore(str(path))
+
+    def test_token_store_shared(self, request_mock, tmp_path):
+        res = dtapiresponses.auth_token_fresh
+        request_mock.json = res
+
+        # Auth objects sharing a store, as if in different
+        # processes, should exchange a single token.
+        store = FileTokenStore(str(tmp_path))
+        auths = []
+        for _ in range(4):
+            auth = disruptive.Auth.service_account(
+                'key_id', 'secret', 'email',
+            )
+            auth.token_store = store
+            auths.append(auth)
+
+        threads = [threading.Thread(target=a.get_token) for a in auths]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        request_mock.assert_request_count(1)
+        assert len(set(a._expiration for a in auths)) == 1
+
+        # Tokens read from the store are not counted as refreshed.
+        assert sum(a.refresh_count for a in auths) == 1
+
+        # Another key does not share the token.
+        other = disruptive.Auth.service_account('other', 'secret', 'email')
+        other.token_store = store
+        other.get_token()
+        request_mock.assert_request_count(2)
+
+    def test_token_store_expiring_token(self, request_mock, tmp_path):
+        res = dtapiresponses.auth_token_fresh
+        request_mock.json = res
+
+        auth = disruptive.Auth.service_account('key_id', 'secret', 'email')
+        store = FileTokenStore(str(tmp_path))
+        store.set(
+            '{}@{}'.format(auth.key_id, auth.token_endpoint),
+            'Bearer old',
+            time.time() + 10,
+        )
+
+        # A stored token about to expire is exchanged for a new one.
+        try:
+            disruptive.token_store = store
+            auth.get_token()
+        finally:
+            disruptive.token_store = None
+
+        request_mock.assert_request_count(1)
+        key = '{}@{}'.format(auth.key_id, auth.token_endpoint)
+        assert store.get(key)[1] > time.time() + 3000
+
     def test_raise_none_credential(self):
         # Verify InvalidTypeError raised at None input credential.
         with pytest.raises(TypeError):
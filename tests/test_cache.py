@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import disruptive
+import disruptive.errors as dterrors
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _event(i, event_type='touch'):
+    update_time = START + timedelta(hours=i)
+    return {
+        'eventId': str(i),
+        'targetName': 'projects/project_id/devices/device_id',
+        'eventType': event_type,
+        'data': {event_type: {
+            'updateTime': update_time.isoformat().replace('+00:00', 'Z'),
+        }},
+        'timestamp': None,
+    }
+
+
+class _Fetcher():
+
+    def __init__(self, events):
+        self.events = events
+        self.calls = []
+
+    def __call__(self, start, end):
+        self.calls.append((start, end))
+        return [
+            e for e in self.events
+            if start <= START + timedelta(hours=int(e['eventId'])) < end
+        ]
+
+
+def _list(cache, fetch, start_hour, end_hour, event_types=None):
+    return cache.list_events(
+        project_id='project_id',
+        device_id='device_id',
+        event_types=event_types,
+        start_time=START + timedelta(hours=start_hour),
+        end_time=START + timedelta(hours=end_hour),
+        fetch=fetch,
+    )
+
+
+class TestEventCache():
+
+    def test_fetches_only_missing_tail(self):
+        fetch = _Fetcher([_event(i) for i in range(48)])
+        cache = disruptive.EventCache(overlap=0)
+
+        assert len(_list(cache, fetch, 0, 24)) == 24
+        events = _list(cache, fetch, 12, 36)
+
+        assert [e['eventId'] for e in events] == [
+            str(i) for i in range(12, 36)
+        ]
+        assert fetch.calls[1] == (
+            START + timedelta(hours=24), START + timedelta(hours=36),
+        )
+        assert cache.fetched == 36
+        assert cache.served == 12
+
+        # A fully cached range is not fetched again.
+        _list(cache, fetch, 0, 36)
+        assert len(fetch.calls) == 2
+
+    def test_overlap_refetches_end_of_range(self):
+        fetch = _Fetcher([_event(i) for i in range(48)])
+        cache = disruptive.EventCache(overlap=timedelta(hours=2))
+
+        _list(cache, fetch, 0, 24)
+        _list(cache, fetch, 0, 24)
+        assert fetch.calls[1][0] == START + timedelta(hours=22)
+        assert len(cache) == 24
+
+    def test_event_types(self):
+        fetch = _Fetcher([_event(0, 'touch'), _event(1, 'temperature')])
+        cache = disruptive.EventCache(overlap=0)
+
+        events = _list(cache, fetch, 0, 24, ['touch'])
+        assert [e['eventType'] for e in events] == ['touch']
+
+        # Another event type is not covered by the synced touch range.
+        _list(cache, fetch, 0, 24, ['temperature'])
+        assert len(fetch.calls) == 2
+
+    def test_eviction(self):
+        fetch = _Fetcher([_event(i) for i in range(24)])
+        cache = disruptive.EventCache(max_events=10, overlap=0)
+
+        _list(cache, fetch, 0, 24)
+        cache.evict()
+        assert len(cache) == 10
+
+        # The evicted head of the range is fetched again.
+        _list(cache, fetch, 0, 24)
+        assert fetch.calls[-1] == (START, START + timedelta(hours=14))
+
+        cache = disruptive.EventCache(max_age=1, overlap=0)
+        _list(cache, fetch, 0, 24)
+        cache.evict()
+        assert len(cache) == 0
+
+    def test_invalidate(self, tmp_path):
+        fetch = _Fetcher([_event(i) for i in range(24)])
+        path = str(tmp_path / 'events.sqlite')
+
+        with disruptive.EventCache(path, overlap=0) as cache:
+            _list(cache, fetch, 0, 24)
+
+        # The cache is kept on disk between instances.
+        with disruptive.EventCache(path, overlap=0) as cache:
+            assert len(cache) == 24
+            cache.invalidate(device_id='other_device')
+            assert len(cache) == 24
+            cache.invalidate(device_id='device_id', event_types=['touch'])
+            assert len(cache) == 0
+
+            _list(cache, fetch, 0, 24)
+            assert len(fetch.calls) == 2
+
+    def test_invalid_max_events(self):
+        with pytest.raises(dterrors.ConfigurationError):
+            disruptive.EventCache(max_events=0)
@@ -0,0 +1,151 @@
+from unittest import mock
+
+import pytest
+
+import disruptive
+import disruptive.errors as dterrors
+import disruptive.circuitbreaker as dtcircuitbreaker
+import tests.api_responses as dtapiresponses
+
+URL = 'https://api.disruptive-technologies.com/v2'
+
+
+class TestCircuitBreaker():
+
+    def test_opens_on_consecutive_failures(self):
+        breaker = dtcircuitbreaker.CircuitBreaker(failure_threshold=3)
+        error = dterrors.InternalServerError({})
+
+        for _ in range(2):
+            breaker.allow(URL)
+            breaker.record(URL, error)
+        assert breaker.state(URL) == 'closed'
+
+        breaker.allow(URL)
+        breaker.record(URL, error)
+        assert breaker.state(URL) == 'open'
+        assert breaker.circuits[URL].opened_count == 1
+
+        with pytest.raises(dterrors.CircuitBreakerOpen):
+            breaker.allow(URL)
+        assert breaker.circuits[URL].rejected_count == 1
+
+    def test_opens_on_error_rate(self):
+        breaker = dtcircuitbreaker.CircuitBreaker(
+            failure_threshold=100, error_rate=0.5, window=4,
+        )
+        for error in [None, dterrors.ConnectionError(''), None]:
+            breaker.record(URL, error)
+        assert breaker.state(URL) == 'closed'
+
+        breaker.record(URL, dterrors.ReadTimeout(''))
+        assert breaker.state(URL) == 'open'
+
+    def test_usage_errors_are_not_failures(self):
+        breaker = dtcircuitbreaker.CircuitBreaker(failure_threshold=1)
+        for error in [dterrors.NotFound({}), dterrors.TooManyRequests({})]:
+            breaker.record(URL, error)
+        assert breaker.state(URL) == 'closed'
+
+    def test_circuits_keyed_by_base_url(self):
+        breaker = dtcircuitbreaker.CircuitBreaker(failure_threshold=1)
+        breaker.record(URL, dterrors.ConnectionError(''))
+
+        breaker.allow(disruptive.emulator_base_url)
+        assert breaker.state(disruptive.emulator_base_url) == 'closed'
+
+    def test_half_open_probe(self):
+        breaker = dtcircuitbreaker.CircuitBreaker(
+            failure_threshold=1, reset_timeout=10,
+        )
+
+        with mock.patch('time.monotonic', return_value=100.0):
+            breaker.record(URL, dterrors.ConnectionError(''))
+        with mock.patch('time.monotonic', return_value=105.0):
+            with pytest.raises(dterrors.CircuitBreakerOpen) as e:
+                breaker.allow(URL)
+            assert e.value.retry_after == 5
+
+        # A single probe is let through once reset_timeout has passed.
+        with mock.patch('time.monotonic', return_value=110.0):
+            breaker.allow(URL)
+            assert breaker.state(URL) == 'half_open'
+            with pytest.raises(dterrors.CircuitBreakerOpen):
+                breaker.allow(URL)
+
+            # A failed probe opens the circuit again.
+            breaker.record(URL, dterrors.InternalServerError({}))
+            assert breaker.state(URL) == 'open'
+
+        # A successful probe closes it.
+        with mock.patch('time.monotonic', return_value=120.0):
+            breaker.allow(URL)
+            breaker.record(URL, None)
+            assert breaker.state(URL) == 'closed'
+            breaker.allow(URL)
+
+    def test_reset(self):
+        breaker = dtcircuitbreaker.CircuitBreaker(failure_threshold=1)
+        breaker.record(URL, dterrors.ConnectionError(''))
+        breaker.reset(URL)
+        assert breaker.state(URL) == 'closed'
+
+    def test_invalid_arguments(self):
+        with pytest.raises(dterrors.ConfigurationError):
+            dtcircuitbreaker.CircuitBreaker(failure_threshold=0)
+        with pytest.raises(dterrors.ConfigurationError):
+            dtcircuitbreaker.CircuitBreaker(error_rate=1.5)
+        with pytest.raises(dterrors.ConfigurationError):
+            dtcircuitbreaker.CircuitBreaker(reset_timeout=0)
+
+    def test_request_fails_fast(self, request_mock):
+        request_mock.status_code = 500
+        breaker = dtcircuitbreaker.CircuitBreaker(failure_threshold=2)
+
+        # Retrying opens the circuit, which stops further attempts.
+        with pytest.raises(dterrors.CircuitBreakerOpen):
+            disruptive.Device.get_device(
+                device_id='device_id',
+                circuit_breaker=breaker,
+            )
+        request_mock.assert_request_count(2)
+
+        # While open, requests are not sent at all.
+        with pytest.raises(dterrors.CircuitBreakerOpen):
+            disruptive.Device.get_device(
+                device_id='device_id',
+                circuit_breaker=breaker,
+            )
+        request_mock.assert_request_count(2)
+
+    def test_stream_waits_for_probe(self, request_mock):
+        breaker = dtcircuitbreaker.CircuitBreaker(
+            failure_threshold=1, reset_timeout=10,
+        )
+        breaker.record(disruptive.base_url, dterrors.ConnectionError(''))
+
+        # Unlike other requests, streams wait for the circuit to probe.
+        with pytest.raises(dterrors.CircuitBreakerOpen):
+            for _ in disruptive.Stream.event_stream(
+                project_id='project_id',
+                request_attempts=1,
+                circuit_breaker=breaker,
+            ):
+                pass
+
+        request_mock.assert_request_count(0)
+        sleeptime = request_mock.sleep_patcher.call_args.args[0]
+        assert 9 < sleeptime <= 10
+
+    def test_package_wide_breaker(self, request_mock):
+        request_mock.json = dtapiresponses.touch_sensor
+        breaker = dtcircuitbreaker.CircuitBreaker()
+
+        try:
+            disruptive.circuit_breaker = breaker
+            disruptive.Device.get_device('device_id')
+        finally:
+            disruptive.circuit_breaker = None
+
+        assert breaker.state(disruptive.base_url) == 'closed'
+        assert breaker.circuits[disruptive.base_url].error_rate == 0
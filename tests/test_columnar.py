@@ -0,0 +1,151 @@
+import copy
+
+import numpy as np
+
+import disruptive
+import tests.api_responses as dtapiresponses
+
+
+def _history(events=None):
+    if events is None:
+        events = dtapiresponses.event_history_each_type['events']
+    return disruptive.ColumnarEventHistory(copy.deepcopy(events))
+
+
+def _temperature_event(event_id, device_id, update_time, value):
+    event = copy.deepcopy(dtapiresponses.temperature_event)
+    event['eventId'] = event_id
+    event['targetName'] = 'projects/project_id/devices/' + device_id
+    event['data']['temperature']['value'] = value
+    event['data']['temperature']['updateTime'] = update_time
+    return event
+
+
+class TestColumnar():
+
+    def test_tables_per_event_type(self):
+        history = _history()
+
+        events = dtapiresponses.event_history_each_type['events']
+        assert len(history) == len(events)
+        assert history.event_types == [e['eventType'] for e in events]
+
+        table = history[disruptive.events.NETWORK_STATUS]
+        assert table.columns == [
+            'device_id', 'event_id', 'update_time',
+            'signal_strength', 'rssi', 'transmission_mode',
+            'cloud_connectors',
+        ]
+
+    def test_column_values(self):
+        table = _history()[disruptive.events.TEMPERATURE]
+
+        assert table.column('device_id').tolist() == ['device_id']
+        assert table.column('celsius').tolist() == [24.9]
+        assert table.column('is_backfilled').tolist() == [False]
+        assert table.column('update_time')[0] == np.datetime64(
+            '2019-05-16T08:15:18.318751', 'ns',
+        )
+
+    def test_labels_changed_uses_event_timestamp(self):
+        table = _history()[disruptive.events.LABELS_CHANGED]
+        assert table.column('update_time')[0] == np.datetime64(0, 'ns')
+
+    def test_numeric_columns_zero_copy(self):
+        table = _history()[disruptive.events.TEMPERATURE]
+
+        celsius = table.column('celsius')
+        table._columns['celsius'][0] = 30.0
+        assert celsius[0] == 30.0
+
+    def test_append_after_export(self):
+        history = _history()
+        table = history[disruptive.events.TEMPERATURE]
+        celsius = table.column('celsius')
+        update_time = table.column('update_time')
+
+        # The table keeps growing while exported arrays are unchanged.
+        history.append(_temperature_event(
+            'e2', 'd2', '2020-01-01T00:00:00Z', 20.0,
+        ))
+        assert celsius.tolist() == [24.9]
+        assert len(update_time) == 1
+        assert table.column('celsius').tolist() == [24.9, 20.0]
+
+    def test_append_without_data(self):
+        event = copy.deepcopy(dtapiresponses.temperature_event)
+        event['data'] = None
+        table = _history([event])[disruptive.events.TEMPERATURE]
+
+        # Missing data falls back to the event timestamp and NaN values.
+        assert np.isnan(table.column('celsius')[0])
+        assert table.column('update_time')[0] == np.datetime64(0, 'ns')
+
+    def test_filter_and_slice(self):
+        history = _history([
+            _temperature_event('1', 'a', '2024-01-01T00:00:00Z', 20),
+            _temperature_event('2', 'b', '2024-01-01T12:00:00Z', 21),
+            _temperature_event('3', 'a', '2024-01-02T00:00:00Z', 22),
+            _temperature_event('4', 'c', '2024-01-03T00:00:00Z', 23),
+        ])
+        table = history[disruptive.events.TEMPERATURE]
+
+        by_device = table.filter(device_ids=['a', 'unknown'])
+        assert by_device.column('event_id').tolist() == ['1', '3']
+
+        by_time = table.between('2024-01-01T06:00:00Z', '2024-01-03T00:00:00Z')
+        assert by_time.column('celsius').tolist() == [21, 22]
+
+        assert table[1:3].column('device_id').tolist() == ['b', 'a']
+        assert table[[3, 0]].column('event_id').tolist() == ['4', '1']
+
+        filtered = history.filter(event_types=[disruptive.events.TOUCH])
+        assert len(filtered) == 0
+
+    def test_to_pandas_polars(self):
+        table = _history()[disruptive.events.HUMIDITY]
+
+        df = table.to_pandas()
+        assert list(df.columns) == table.columns
+        assert str(df['update_time'].dt.tz) == 'UTC'
+        assert df['relative_humidity'].tolist() == [17]
+
+        pl_df = table.to_polars()
+        assert pl_df.columns == table.columns
+        assert pl_df['celsius'].to_list() == [22.45]
+
+    def test_to_arrow(self):
+        history = _history()
+        batches = history.to_arrow()
+        assert list(batches) == history.event_types
+
+        batch = batches[disruptive.events.NETWORK_STATUS]
+        assert batch.schema == disruptive.columnar.arrow_schema(
+            disruptive.events.NETWORK_STATUS,
+        )
+        assert batch.column('rssi').to_pylist() == [-83]
+        assert batch.column('transmission_mode').to_pylist() == [
+            'LOW_POWER_STANDARD_MODE',
+        ]
+
+        empty = disruptive.ColumnarEventHistory([])
+        assert len(empty.to_arrow_table()) == 0
+
+    def test_to_arrow_missing_values(self):
+        event = _temperature_event('1', 'a', '2024-01-01T00:00:00Z', None)
+        del event['data']['temperature']['updateTime']
+        event['timestamp'] = None
+        batch = _history([event])[disruptive.events.TEMPERATURE].to_arrow()
+
+        assert batch.column('update_time').null_count == 1
+        assert batch.column('device_id').to_pylist() == ['a']
+
+    def test_to_arrow_table(self):
+        table = _history().to_arrow_table()
+
+        assert len(table) == len(dtapiresponses.event_history_each_type[
+            'events'
+        ])
+        assert table.column_names[:4] == [
+            'device_id', 'event_id', 'event_type', 'update_time',
+        ]
@@ -0,0 +1,54 @@
+import json
+from unittest import mock
+
+import pytest
+
+import disruptive
+import disruptive.decoding as dtdecoding
+import disruptive.errors as dterrors
+
+
+class TestDecoding():
+
+    def test_backends(self):
+        for name in ['auto', 'json']:
+            loads = dtdecoding.get_decoder(name)
+            assert loads(b'{"a": [1, 2]}') == {'a': [1, 2]}
+            assert loads('{"a": null}') == {'a': None}
+
+        assert dtdecoding.get_decoder('json') is json.loads
+
+    def test_invalid_documents_raise_value_error(self):
+        for name in ['auto', 'json']:
+            loads = dtdecoding.get_decoder(name)
+            for doc in [b'', b'<html>', b'{"a":']:
+                with pytest.raises(ValueError):
+                    loads(doc)
+
+    def test_package_setting(self):
+        try:
+            disruptive.json_decoder = 'json'
+            with mock.patch('json.loads', wraps=json.loads) as loads:
+                dtdecoding._decoders.clear()
+                assert dtdecoding.loads(b'[1]') == [1]
+                loads.assert_called_once_with(b'[1]')
+        finally:
+            disruptive.json_decoder = 'auto'
+            dtdecoding._decoders.clear()
+
+    def test_unknown_backend(self):
+        with pytest.raises(dterrors.ConfigurationError):
+            dtdecoding.get_decoder('simplejson')
+
+    def test_auto_falls_back_to_json(self):
+        def import_module(name):
+            raise ModuleNotFoundError(name)
+
+        dtdecoding._decoders.clear()
+        try:
+            with mock.patch('importlib.import_module', import_module):
+                assert dtdecoding.get_decoder('auto') is json.loads
+                with pytest.raises(ModuleNotFoundError):
+                    dtdecoding.get_decoder('orjson')
+        finally:
+            dtdecoding._decoders.clear()
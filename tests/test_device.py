@@ -94,6 +94,24 @@ class TestDevice():
         for d in devices:
             assert isinstance(d, disruptive.Device)
 
+    def test_iter_devices(self, request_mock):
+        # Update the response data with a list of device data.
+        res = dtapiresponses.paginated_device_response
+        request_mock.json = res
+
+        # Call Device.iter_devices() method.
+        devices = disruptive.Device.iter_devices('project_id')
+
+        # Assert no request sent before iterating.
+        request_mock.assert_request_count(0)
+
+        # Assert output is generator of Device.
+        devices = list(devices)
+        request_mock.assert_request_count(1)
+        assert len(devices) == len(res['devices'])
+        for d in devices:
+            assert isinstance(d, disruptive.Device)
+
     def test_list_devices_optionals(self, request_mock):
         # Update the response data with a list of device data.
         request_mock.json = dtapiresponses.paginated_device_response
@@ -1,4 +1,5 @@
 import pytest
+import requests
 
 import disruptive as dt
 import disruptive.errors as errors
@@ -69,6 +70,18 @@ class TestResponseStatusCodes():
         with pytest.raises(errors.TooManyRequests):
             dt.Device.get_device('', '')
 
+    def test_error_code_429_retry_after(self, request_mock):
+        # Set response status code and header to represent test.
+        request_mock.status_code = 429
+        request_mock.headers = {'Retry-After': '7'}
+
+        # Call the service, which will send a request to the server.
+        with pytest.raises(errors.TooManyRequests) as e:
+            dt.Device.get_device('', '')
+
+        # Assert the advised wait is exposed on the error.
+        assert e.value.retry_after == 7
+
     def test_error_code_500(self, request_mock):
         # Set response status code to represent test.
         request_mock.status_code = 500
@@ -129,3 +142,20 @@ class TestResponseStatusCodes():
 
         with pytest.raises(errors.UsageError):
             dt.Auth.service_account('', '', '')
+
+    def test_parse_return_shapes(self):
+        # Both keep returning (error, should_retry, sleeptime).
+        error, should_retry, sleeptime = errors.parse_api_status_code(
+            429, {}, {'Retry-After': '7'}, 1,
+        )
+        assert isinstance(error, errors.TooManyRequests)
+        assert should_retry and sleeptime == 7
+
+        error, should_retry, _ = errors.parse_api_status_code(401, {}, {}, 2)
+        assert isinstance(error, errors.Unauthorized) and not should_retry
+
+        error, should_retry, sleeptime = errors.parse_request_error(
+            requests.exceptions.ReadTimeout(), {}, 2,
+        )
+        assert isinstance(error, errors.ReadTimeout)
+        assert should_retry and sleeptime == 4
@@ -1,10 +1,14 @@
+import copy
 from unittest import mock
 from dataclasses import dataclass
 
 import pytest
 
 import disruptive
-from disruptive.events.events import Event
+import disruptive.errors as dterrors
+import disruptive.resources.eventhistory as eventhistory
+from disruptive.requests import DTRequest, DTResponse
+from disruptive.events.events import Event, _EventData
 import tests.api_responses as dtapiresponses
 
 
@@ -45,6 +49,354 @@ class TestEventHistory():
         for e in h:
             assert isinstance(e, Event)
 
+    def test_export_events(self, request_mock, tmp_path):
+        # Update the response data with event history data.
+        res = dtapiresponses.event_history_each_type
+        request_mock.json = res
+
+        # Call EventHistory.export_events() method.
+        files = disruptive.EventHistory.export_events(
+            device_id='device_id',
+            project_id='project_id',
+            path=str(tmp_path),
+        )
+
+        # Assert single request sent.
+        request_mock.assert_request_count(1)
+
+        # Assert one file per event type, as all are from the same device.
+        assert len(files) == len(res['events'])
+        for f in files:
+            assert f.startswith(str(tmp_path))
+            assert f.endswith('.parquet')
+
+    def test_list_events_cached(self, request_mock):
+        # Update the response data with event history data.
+        res = dtapiresponses.event_history_each_type
+        request_mock.json = res
+
+        cache = disruptive.EventCache(overlap=0)
+        for _ in range(2):
+            h = disruptive.EventHistory.list_events(
+                device_id='device_id',
+                project_id='project_id',
+                start_time='1970-01-01T00:00:00Z',
+                end_time='2030-01-01T00:00:00Z',
+                cache=cache,
+            )
+            assert len(h) == len(res['events'])
+            for e in h:
+                assert isinstance(e, Event)
+
+        # Assert the second call was served from the cache.
+        request_mock.assert_request_count(1)
+
+    def test_list_events_columnar(self, request_mock):
+        # Update the response data with event history data.
+        res = dtapiresponses.event_history_each_type
+        request_mock.json = res
+
+        # Call EventHistory.list_events_columnar() method.
+        h = disruptive.EventHistory.list_events_columnar(
+            device_id='device_id',
+            project_id='project_id',
+        )
+
+        # Assert a table per event type, without any Event objects.
+        assert isinstance(h, disruptive.ColumnarEventHistory)
+        assert len(h) == len(res['events'])
+        assert h.event_types == [e['eventType'] for e in res['events']]
+
+    def test_iter_events(self, request_mock):
+        # Update the response data with event history data.
+        res = dtapiresponses.event_history_each_type
+        request_mock.json = res
+
+        # Call EventHistory.iter_events() method.
+        events = disruptive.EventHistory.iter_events(
+            device_id='device_id',
+            project_id='project_id',
+        )
+
+        # Assert the first event is yielded after a single request.
+        assert isinstance(next(events), Event)
+        request_mock.assert_request_count(1)
+
+        # Assert the remaining events are yielded from the same page.
+        assert len(list(events)) == len(res['events']) - 1
+        request_mock.assert_request_count(1)
+
+    def test_list_events_lazy(self, request_mock):
+        # Update the response data with event history data.
+        res = dtapiresponses.event_history_each_type
+        request_mock.json = res
+
+        with mock.patch.object(
+            _EventData,
+            'from_event_type',
+            wraps=_EventData.from_event_type,
+        ) as decode_mock:
+            h = disruptive.EventHistory.list_events(
+                device_id='device_id',
+                project_id='project_id',
+                lazy=True,
+            )
+
+            # Assert event data is only decoded once accessed.
+            assert len(h) == len(res['events'])
+            assert decode_mock.call_count == 0
+            for e in h:
+                assert e.data is not None
+            assert decode_mock.call_count == len(h)
+
+    def test_list_events_windows(self, request_mock):
+        # Every window returns the same events, as if all on the edges.
+        res = dtapiresponses.event_history_each_type
+        request_mock.json = res
+
+        # Call EventHistory.list_events() in 4 parallel windows.
+        h = disruptive.EventHistory.list_events(
+            device_id='device_id',
+            project_id='project_id',
+            start_time='1970-01-01T00:00:00Z',
+            end_time='1970-01-05T00:00:00Z',
+            windows=4,
+        )
+
+        # Assert one request sent per window.
+        request_mock.assert_request_count(4)
+        windows = sorted(
+            (c.kwargs['params']['startTime'], c.kwargs['params']['endTime'])
+            for c in request_mock.request_patcher.call_args_list
+        )
+        assert windows[0] == ('1970-01-01T00:00:00Z', '1970-01-02T00:00:00Z')
+        assert windows[-1] == ('1970-01-04T00:00:00Z', '1970-01-05T00:00:00Z')
+
+        # Assert duplicates removed and events in time order.
+        assert isinstance(h, disruptive.EventHistory)
+        assert len(h) == len({e['eventId'] for e in res['events']})
+        timestamps = [e.data.timestamp for e in h
+                      if getattr(e.data, 'timestamp', None) is not None]
+        assert timestamps == sorted(timestamps)
+
+    def test_list_events_windows_lazy(self, request_mock):
+        request_mock.json = dtapiresponses.event_history_each_type
+
+        with mock.patch.object(
+            _EventData,
+            'from_event_type',
+            wraps=_EventData.from_event_type,
+        ) as decode_mock:
+            h = disruptive.EventHistory.list_events(
+                device_id='device_id',
+                project_id='project_id',
+                start_time='1970-01-01T00:00:00Z',
+                end_time='1970-01-05T00:00:00Z',
+                windows=4,
+                lazy=True,
+            )
+
+            # Assert events are sorted without decoding their data.
+            assert decode_mock.call_count == 0
+
+        timestamps = [e.data.timestamp for e in h
+                      if getattr(e.data, 'timestamp', None) is not None]
+        assert timestamps == sorted(timestamps)
+
+    def test_list_events_windows_invalid(self, request_mock):
+        with pytest.raises(dterrors.ConfigurationError):
+            disruptive.EventHistory.list_events(
+                device_id='device_id',
+                project_id='project_id',
+                windows=0,
+            )
+
+        # Assert no requests sent.
+        request_mock.assert_request_count(0)
+
+    def test_list_events_bulk(self, request_mock):
+        # Update the response data with event history data.
+        res = dtapiresponses.event_history_each_type
+        request_mock.json = res
+
+        # Call EventHistory.list_events_bulk() method.
+        h = disruptive.EventHistory.list_events_bulk(
+            project_id='project_id',
+            device_ids=['device_1', 'device_2', 'device_3'],
+            max_workers=2,
+        )
+
+        # Assert one request sent per device.
+        request_mock.assert_request_count(3)
+
+        # Assert events of every device merged into one history.
+        assert isinstance(h, disruptive.EventHistory)
+        assert len(h) == 3 * len(res['events'])
+
+    def test_iter_events_bulk_list_devices(self, request_mock):
+        def __patched_request(json, status_code, headers):
+            return DTResponse(json, status_code, headers), None
+
+        devices = dtapiresponses.paginated_device_response
+        history = dtapiresponses.event_history_each_type
+
+        # First list the project devices, then fetch history for each.
+        n = len(devices['devices'])
+        request_mock.request_patcher = request_mock._mocker.patch.object(
+            DTRequest,
+            '_request_wrapper',
+            side_effect=[__patched_request(devices, 200, {})] + [
+                __patched_request(history, 200, {}) for _ in range(n)
+            ],
+        )
+
+        # Call EventHistory.iter_events_bulk() without device IDs.
+        out = dict(disruptive.EventHistory.iter_events_bulk(
+            project_id='project_id',
+            max_workers=1,
+        ))
+
+        # Assert history yielded for each device in the project.
+        request_mock.assert_request_count(n + 1)
+        assert sorted(out) == sorted(d['name'].split('/')[-1]
+                                     for d in devices['devices'])
+        for h in out.values():
+            assert isinstance(h, disruptive.EventHistory)
+
+    def test_list_events_bulk_rate_limited(self, request_mock):
+        def __patched_request(json, status_code, headers):
+            return DTResponse(json, status_code, headers), None
+
+        history = dtapiresponses.event_history_each_type
+
+        # Rate limit the first request without a Retry-After header.
+        request_mock.request_patcher = request_mock._mocker.patch.object(
+            DTRequest,
+            '_request_wrapper',
+            side_effect=[
+                __patched_request({}, 429, {}),
+                __patched_request(history, 200, {}),
+            ],
+        )
+
+        h = disruptive.EventHistory.list_events_bulk(
+            project_id='project_id',
+            device_ids=['device_id'],
+        )
+
+        # Assert the page was requested again after pausing.
+        request_mock.assert_request_count(2)
+        assert request_mock.sleep_patcher.call_count == 1
+        assert len(h) == len(history['events'])
+
+    def test_list_events_bulk_rate_limited_retry_after(self, request_mock):
+        def __patched_request(json, status_code, headers):
+            return DTResponse(json, status_code, headers), None
+
+        history = dtapiresponses.event_history_each_type
+        throttled = __patched_request({}, 429, {'Retry-After': '1'})
+
+        # Requests leave a 429 to the shared pause instead of retrying.
+        request_mock.request_patcher = request_mock._mocker.patch.object(
+            DTRequest,
+            '_request_wrapper',
+            side_effect=[
+                throttled,
+                throttled,
+                throttled,
+                __patched_request(history, 200, {}),
+            ],
+        )
+
+        with mock.patch.object(DTRequest, 'get', wraps=DTRequest.get) as get:
+            h = disruptive.EventHistory.list_events_bulk(
+                project_id='project_id',
+                device_ids=['device_id'],
+            )
+
+        # Assert the page was requested again after each shared pause.
+        request_mock.assert_request_count(4)
+        assert get.call_count == 4
+        assert get.call_args.kwargs['retry_rate_limited'] is False
+        assert request_mock.sleep_patcher.call_count == 3
+        assert len(h) == len(history['events'])
+
+    def test_list_events_bulk_server_error(self, request_mock):
+        def __patched_request(json, status_code, headers):
+            return DTResponse(json, status_code, headers), None
+
+        history = dtapiresponses.event_history_each_type
+
+        # Other errors are retried by the request itself.
+        request_mock.request_patcher = request_mock._mocker.patch.object(
+            DTRequest,
+            '_request_wrapper',
+            side_effect=[
+                __patched_request({}, 500, {}),
+                __patched_request({}, 500, {}),
+                __patched_request(history, 200, {}),
+            ],
+        )
+
+        with mock.patch.object(DTRequest, 'get', wraps=DTRequest.get) as get:
+            h = disruptive.EventHistory.list_events_bulk(
+                project_id='project_id',
+                device_ids=['device_id'],
+                request_attempts=2,
+            )
+
+        request_mock.assert_request_count(3)
+        assert get.call_count == 1
+        assert len(h) == len(history['events'])
+
+    def test_list_events_bulk_stopped(self, request_mock):
+        backoff = eventhistory._RateLimitBackoff()
+        backoff.stop()
+
+        # Stopped workers send no further requests.
+        disruptive.EventHistory._list_events_with_backoff(
+            device_id='device_id',
+            project_id='project_id',
+            params={},
+            backoff=backoff,
+        )
+        request_mock.assert_request_count(0)
+
+    def test_list_events_bulk_max_workers_invalid(self, request_mock):
+        with pytest.raises(dterrors.ConfigurationError):
+            disruptive.EventHistory.list_events_bulk(
+                project_id='project_id',
+                device_ids=['device_id'],
+                max_workers=0,
+            )
+
+        # Assert no requests sent.
+        request_mock.assert_request_count(0)
+
+    def test_to_pandas_rows(self, request_mock):
+        temperature = copy.deepcopy(dtapiresponses.temperature_event)
+        temperature['data']['temperature']['samples'].append({
+            'value': 25.0, 'sampleTime': '2019-05-16T08:16:18Z',
+        })
+        events = disruptive.EventHistory([
+            disruptive.events.Event(dtapiresponses.touch_event),
+            disruptive.events.Event(temperature),
+            disruptive.events.Event(dtapiresponses.labels_changed_event),
+            disruptive.events.Event(dtapiresponses.touch_event),
+        ])
+
+        # Rows are in event order, with one row per temperature sample.
+        df = events.to_pandas()
+        assert df['event_type'].tolist() == [
+            'touch', 'temperature', 'temperature', 'labelsChanged', 'touch',
+        ]
+        assert df['value'].tolist()[1:3] == [24.9, 25.0]
+        assert str(df['sample_time'][2]) == '2019-05-16 08:16:18+00:00'
+        assert df['removed'][3].tolist() == ['remove-key1', 'remove-key2']
+
+        pl_df = events.to_polars()
+        assert pl_df['event_type'].to_list() == df['event_type'].tolist()
+
     def test_to_pandas_polars(self, request_mock):
         cols = ['device_id', 'event_id', 'event_type']
 
@@ -1,7 +1,14 @@
+import copy
 from datetime import datetime
 from dataclasses import dataclass
+from unittest.mock import patch
+
+import pytest
 
 import disruptive
+import disruptive.transforms as dttrans
+from disruptive.events.events import _EventData
+import tests.api_responses as dtapiresponses
 
 
 class TestEvents():
@@ -243,3 +250,70 @@ class TestEvents():
 
             y = eval(repr(x))
             assert x._raw == y._raw
+
+    def test_from_raw_matches_constructor(self):
+        for raw in dtapiresponses.event_history_each_type['events']:
+            event = disruptive.events.Event(copy.deepcopy(raw))
+
+            # Rebuilding from repr uses the constructor, which should
+            # give the same attributes as parsing the response data.
+            x = event.data
+            y = eval(repr(x))
+            assert repr(x) == repr(y)
+            assert str(x) == str(y)
+
+    def test_from_raw_validates_timestamp_once(self):
+        raw = copy.deepcopy(dtapiresponses.temperature_event)
+
+        # Once for the event timestamp, and once for its single sample.
+        with patch(
+            'disruptive.transforms._parse',
+            wraps=dttrans._parse,
+        ) as parse_mock:
+            disruptive.events.Event(raw)
+
+        assert parse_mock.call_count == 2
+
+    def test_lazy_event(self):
+        for raw in dtapiresponses.event_history_each_type['events']:
+            eager = disruptive.events.Event(copy.deepcopy(raw))
+
+            with patch.object(
+                _EventData,
+                'from_event_type',
+                wraps=_EventData.from_event_type,
+            ) as decode_mock:
+                lazy = disruptive.events.Event(copy.deepcopy(raw), lazy=True)
+
+                # Routing attributes are set, but data is not yet decoded.
+                assert lazy.event_type == eager.event_type
+                assert lazy.device_id == eager.device_id
+                assert decode_mock.call_count == 0
+
+                # Data is decoded once, on first access.
+                assert repr(lazy.data) == repr(eager.data)
+                assert repr(lazy.data) == repr(eager.data)
+                assert decode_mock.call_count == 1
+
+            assert str(lazy) == str(eager)
+
+        # Other missing attributes should still raise.
+        with pytest.raises(AttributeError):
+            lazy.does_not_exist
+
+    def test_compact_events(self):
+        for raw in dtapiresponses.event_history_each_type['events']:
+            event = disruptive.events.Event(copy.deepcopy(raw))
+
+            # Events and their data should not carry an instance dict,
+            # while raw is still available.
+            for obj in [event, event.data]:
+                assert not hasattr(obj, '__dict__')
+                assert obj.raw is obj._raw
+
+            for sample in getattr(event.data, 'samples', None) or []:
+                assert not hasattr(sample, '__dict__')
+
+            # Raw can still be replaced.
+            event.raw = {}
+            assert event._raw == {}
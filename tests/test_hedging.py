@@ -0,0 +1,197 @@
+import threading
+
+import pytest
+
+import disruptive
+import disruptive.errors as dterrors
+import disruptive.hedging as dthedging
+import disruptive.ratelimit as dtratelimit
+import tests.api_responses as dtapiresponses
+from disruptive.requests import DTRequest, DTResponse
+
+ENDPOINT = disruptive.base_url + '/projects/{}/devices/{}'
+
+
+def warmed_policy(**kwargs):
+    # Policy that has seen 20 fast responses from ENDPOINT.
+    policy = dthedging.HedgePolicy(min_samples=20, **kwargs)
+    for _ in range(20):
+        policy.record(ENDPOINT, 0.01)
+    return policy
+
+
+@pytest.fixture()
+def hooks():
+    yield disruptive.hooks
+    disruptive.hooks = []
+
+
+class TestHedging():
+
+    def test_delay_percentile(self):
+        policy = dthedging.HedgePolicy(percentile=90, min_samples=10)
+        for i in range(9):
+            policy.record('a', i + 1)
+        assert policy.delay('a') is None
+
+        policy.record('a', 10)
+        assert policy.delay('a') == 9
+        assert policy.delay('b') is None
+        assert policy.requests == 3
+
+    def test_min_delay(self):
+        policy = warmed_policy(min_delay=0.5)
+        assert policy.delay(ENDPOINT) == 0.5
+
+    def test_max_rate(self):
+        policy = dthedging.HedgePolicy(max_rate=0.25)
+        hedges = 0
+        for _ in range(100):
+            policy.delay('a')
+            hedges += policy.allow()
+        assert hedges == 25
+        assert policy.hedged == 25
+
+    def test_invalid_arguments(self):
+        with pytest.raises(dterrors.ConfigurationError):
+            dthedging.HedgePolicy(percentile=100)
+        with pytest.raises(dterrors.ConfigurationError):
+            dthedging.HedgePolicy(max_rate=2)
+        with pytest.raises(dterrors.ConfigurationError):
+            dthedging.HedgePolicy(min_samples=10, window=5)
+
+    def test_hedge_wins(self, request_mock):
+        api_res = dtapiresponses.touch_sensor
+        answered = threading.Event()
+        calls = []
+
+        # The first request hangs until the hedge has been answered.
+        def __patched_request(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                answered.wait(timeout=5)
+                return DTResponse({}, 500, {}), None
+            answered.set()
+            return DTResponse(api_res, 200, {}), None
+
+        request_mock.request_patcher = request_mock._mocker.patch.object(
+            DTRequest,
+            '_request_wrapper',
+            side_effect=__patched_request,
+        )
+        policy = warmed_policy(max_rate=1)
+
+        device = disruptive.Device.get_device(
+            'device_id', 'project_id', hedge_policy=policy,
+        )
+
+        assert device._raw == api_res
+        assert calls[0] == calls[1]
+        assert policy.hedged == 1
+        assert policy.hedge_wins == 1
+
+    def test_fast_response_not_hedged(self, request_mock):
+        request_mock.json = dtapiresponses.touch_sensor
+        policy = dthedging.HedgePolicy(max_rate=1, min_delay=5)
+        for _ in range(20):
+            policy.record(ENDPOINT, 0.01)
+
+        disruptive.Device.get_device(
+            'device_id', 'project_id', hedge_policy=policy,
+        )
+
+        request_mock.assert_request_count(1)
+        assert policy.hedged == 0
+        assert policy.requests == 1
+
+    def test_only_get_hedged(self, request_mock):
+        policy = warmed_policy(max_rate=1)
+
+        DTRequest.post('/projects/p/devices/d', hedge_policy=policy)
+
+        request_mock.assert_request_count(1)
+        assert policy.requests == 0
+
+    def test_hedge_rate_limited(self, request_mock, mocker):
+        api_res = dtapiresponses.touch_sensor
+        answered = threading.Event()
+        calls = []
+
+        # The first request fails once the hedge has been answered.
+        def __patched_request(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                answered.wait(timeout=5)
+                return DTResponse({}, 500, {}), None
+            answered.set()
+            return DTResponse(api_res, 200, {}), None
+
+        request_mock.request_patcher = request_mock._mocker.patch.object(
+            DTRequest,
+            '_request_wrapper',
+            side_effect=__patched_request,
+        )
+        limiter = mocker.Mock(acquire=mocker.Mock(return_value=0.0))
+        mocker.patch.object(
+            dtratelimit, 'get_limiter', return_value=limiter,
+        )
+
+        disruptive.Device.get_device(
+            'device_id', 'project_id', hedge_policy=warmed_policy(max_rate=1),
+        )
+
+        # Both the request and its hedge take a token.
+        assert limiter.acquire.call_count == 2
+
+    def test_unused_response_observed(self, request_mock, hooks):
+        api_res = dtapiresponses.touch_sensor
+        answered = threading.Event()
+        observed = threading.Event()
+        calls = []
+        responses = []
+
+        class Recorder(disruptive.Hooks):
+            def on_response(self, **kwargs):
+                responses.append(kwargs)
+                if len(responses) == 2:
+                    observed.set()
+
+        hooks.append(Recorder())
+
+        # The first request fails once the hedge has been answered.
+        def __patched_request(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                answered.wait(timeout=5)
+                return DTResponse({}, 500, {}), None
+            answered.set()
+            return DTResponse(api_res, 200, {}), None
+
+        request_mock.request_patcher = request_mock._mocker.patch.object(
+            DTRequest,
+            '_request_wrapper',
+            side_effect=__patched_request,
+        )
+        policy = warmed_policy(max_rate=1)
+
+        disruptive.Device.get_device(
+            'device_id', 'project_id', hedge_policy=policy,
+        )
+
+        # The unused 500 is still seen by the hooks.
+        assert observed.wait(timeout=5)
+        assert sorted(r['status_code'] for r in responses) == [200, 500]
+
+    def test_retries_not_hedged(self, request_mock):
+        request_mock.status_code = 500
+        policy = warmed_policy(max_rate=1, min_delay=5)
+
+        with pytest.raises(dterrors.InternalServerError):
+            disruptive.Device.get_device(
+                device_id='device_id',
+                request_attempts=1,
+                hedge_policy=policy,
+            )
+
+        request_mock.assert_request_count(2)
+        assert policy.requests == 1
@@ -0,0 +1,163 @@
+from unittest import mock
+
+import pytest
+
+import disruptive
+import disruptive.errors as dterrors
+import disruptive.instrumentation as dtinstrumentation
+import tests.api_responses as dtapiresponses
+
+
+class RecordingHooks(disruptive.Hooks):
+
+    def __init__(self):
+        self.calls = []
+
+    def on_request_start(self, **kwargs):
+        self.calls.append(('on_request_start', kwargs))
+
+    def on_response(self, **kwargs):
+        self.calls.append(('on_response', kwargs))
+
+    def on_retry(self, **kwargs):
+        self.calls.append(('on_retry', kwargs))
+
+    def on_stream_event(self, **kwargs):
+        self.calls.append(('on_stream_event', kwargs))
+
+
+@pytest.fixture()
+def hooks():
+    yield disruptive.hooks
+    disruptive.hooks = []
+
+
+class TestInstrumentation():
+
+    def test_hooks_called(self, request_mock, hooks):
+        recorder = RecordingHooks()
+        hooks.append(recorder)
+        request_mock.json = dtapiresponses.touch_sensor
+
+        disruptive.Device.get_device('device_id', 'project_id')
+
+        names = [name for name, _ in recorder.calls]
+        assert names == ['on_request_start', 'on_response']
+        response = recorder.calls[1][1]
+        assert response['method'] == 'GET'
+        assert response['endpoint'] == '/projects/{}/devices/{}'
+        assert response['status_code'] == 200
+        assert response['attempt'] == 0
+        assert response['size'] > 0
+        assert response['error'] is None
+
+    def test_hooks_called_on_retry(self, request_mock, hooks):
+        recorder = RecordingHooks()
+        hooks.append(recorder)
+        request_mock.status_code = 500
+
+        with pytest.raises(dterrors.InternalServerError):
+            disruptive.Device.get_device(
+                device_id='device_id',
+                request_attempts=1,
+            )
+
+        names = [name for name, _ in recorder.calls]
+        assert names == [
+            'on_request_start', 'on_response', 'on_retry',
+            'on_request_start', 'on_response',
+        ]
+        retry = recorder.calls[2][1]
+        assert retry['attempt'] == 1
+        assert isinstance(retry['error'], dterrors.InternalServerError)
+
+    def test_hook_errors_ignored(self, request_mock, hooks):
+        class FailingHooks(disruptive.Hooks):
+            def on_response(self, **kwargs):
+                raise ValueError('hook failed')
+
+        hooks.append(FailingHooks())
+        request_mock.json = dtapiresponses.touch_sensor
+
+        device = disruptive.Device.get_device('device_id', 'project_id')
+        assert device._raw == dtapiresponses.touch_sensor
+
+    def test_no_hooks(self, request_mock):
+        request_mock.json = dtapiresponses.touch_sensor
+
+        with mock.patch.object(dtinstrumentation, 'emit') as emit:
+            disruptive.Device.get_device('device_id', 'project_id')
+        emit.assert_not_called()
+
+    def test_stream_events(self, request_mock, hooks):
+        recorder = RecordingHooks()
+        hooks.append(recorder)
+        ping = dtapiresponses.stream_ping
+        temp = dtapiresponses.stream_temperature_event
+        request_mock.iter_data = [ping, temp]
+
+        for _ in disruptive.Stream.event_stream('project_id'):
+            pass
+
+        events = [c for name, c in recorder.calls if name == 'on_stream_event']
+        assert [e['event_type'] for e in events] == ['ping', 'temperature']
+        assert events[0]['endpoint'] == '/projects/{}/devices:stream'
+        assert events[1]['size'] == len(temp)
+
+    def test_metrics_collector(self, request_mock, hooks):
+        metrics = disruptive.MetricsCollector()
+        hooks.append(metrics)
+        request_mock.status_code = 500
+
+        with pytest.raises(dterrors.InternalServerError):
+            disruptive.Device.get_device(
+                device_id='device_id',
+                request_attempts=2,
+            )
+
+        key = ('GET', '/projects/{}/devices/{}')
+        assert metrics.requests[key + ('500',)] == 3
+        assert metrics.retries[key] == 2
+        assert metrics.durations[key].count == 3
+        assert metrics.sizes[key].count == 3
+
+        metrics.reset()
+        assert metrics.requests == {}
+
+    def test_to_prometheus(self):
+        metrics = disruptive.MetricsCollector(
+            duration_buckets=[0.1, 1.0],
+            size_buckets=[100],
+        )
+        endpoint = '/projects/{}/devices'
+        metrics.on_response('GET', endpoint, 200, 0.5, 0, 50, None)
+        metrics.on_response('GET', endpoint, None, 2.0, 1, 0, None)
+        metrics.on_stream_event(endpoint + ':stream', 'ping', 10)
+
+        text = metrics.to_prometheus()
+        labels = 'method="GET",endpoint="/projects/{}/devices"'
+        assert '# TYPE disruptive_requests_total counter' in text
+        assert 'disruptive_requests_total{' + labels + ',status="200"} 1' \
+            in text
+        assert 'disruptive_requests_total{' + labels + ',status="error"} 1' \
+            in text
+        assert 'disruptive_request_duration_seconds_bucket{' + labels \
+            + ',le="1.0"} 1' in text
+        assert 'disruptive_request_duration_seconds_bucket{' + labels \
+            + ',le="+Inf"} 2' in text
+        assert 'disruptive_request_duration_seconds_count{' + labels \
+            + '} 2' in text
+        assert 'disruptive_stream_events_total{endpoint=' \
+            '"/projects/{}/devices:stream",event_type="ping"} 1' in text
+
+    def test_histogram_quantile(self):
+        histogram = dtinstrumentation.Histogram([1, 2, 4])
+        assert histogram.quantile(0.5) is None
+
+        for value in [0.5, 1.5, 1.5, 3, 10]:
+            histogram.observe(value)
+        assert histogram.counts == [1, 2, 1, 1]
+        assert histogram.sum == 16.5
+        assert histogram.quantile(0.5) == 2
+        assert histogram.quantile(0.8) == 4
+        assert histogram.quantile(1.0) == float('inf')
@@ -73,6 +73,27 @@ class TestProject():
         for p in projects:
             assert isinstance(p, disruptive.Project)
 
+    def test_iter_projects(self, request_mock):
+        # Update the response data with list of project data.
+        request_mock.json = dtapiresponses.projects
+
+        # Call the appropriate endpoint with background prefetching.
+        projects = list(disruptive.Project.iter_projects(prefetch=True))
+
+        # Verify request parameters.
+        request_mock.assert_requested(
+            method='GET',
+            url=disruptive.base_url+'/projects',
+        )
+
+        # Assert single request sent.
+        request_mock.assert_request_count(1)
+
+        # Assert instances of Project in output.
+        assert len(projects) == len(dtapiresponses.projects['projects'])
+        for p in projects:
+            assert isinstance(p, disruptive.Project)
+
     def test_create_project(self, request_mock):
         # Update the response data with project data.
         request_mock.json = dtapiresponses.empty_project
@@ -0,0 +1,130 @@
+from unittest import mock
+
+import pytest
+
+import disruptive
+import disruptive.errors as dterrors
+import disruptive.ratelimit as dtratelimit
+import tests.api_responses as dtapiresponses
+from disruptive.requests import DTRequest, DTResponse
+
+
+@pytest.fixture()
+def rate_limits():
+    dtratelimit._limiters.clear()
+    yield
+    disruptive.rate_limits = None
+    dtratelimit._limiters.clear()
+
+
+class TestRateLimit():
+
+    def test_burst_then_paced(self):
+        with mock.patch('time.monotonic', return_value=100.0):
+            limiter = dtratelimit.RateLimiter(rate=2, burst=2)
+            assert limiter.acquire() == 0
+            assert limiter.acquire() == 0
+            assert limiter.acquire() == pytest.approx(0.5)
+            assert limiter.acquire() == pytest.approx(1.0)
+
+    def test_throttle_halves_rate_and_recovers(self):
+        with mock.patch('time.monotonic', return_value=100.0):
+            limiter = dtratelimit.RateLimiter(rate=10, increase=1)
+            limiter.on_throttle()
+            assert limiter.current_rate == 5
+            limiter.on_success()
+            assert limiter.current_rate == 6
+            for _ in range(10):
+                limiter.on_success()
+            assert limiter.current_rate == 10
+
+    def test_throttle_min_rate(self):
+        limiter = dtratelimit.RateLimiter(rate=10, min_rate=4)
+        limiter.on_throttle()
+        limiter.on_throttle()
+        assert limiter.current_rate == 4
+
+    def test_retry_after_pauses(self):
+        with mock.patch('time.monotonic', return_value=100.0):
+            limiter = dtratelimit.RateLimiter(rate=100)
+            limiter.on_throttle(retry_after=7)
+            assert limiter.acquire() == pytest.approx(7)
+
+    def test_invalid_rate(self):
+        with pytest.raises(dterrors.ConfigurationError):
+            dtratelimit.RateLimiter(rate=0)
+
+    def test_endpoint_class(self):
+        cls = dtratelimit.endpoint_class
+        assert cls('GET', '/projects/p/devices:stream') == 'stream'
+        assert cls('GET', '/projects/p/devices/d/events') == 'events'
+        assert cls('GET', '/projects/p/devices') == 'read'
+        assert cls('POST', '/projects/p/devices:batchUpdate') == 'write'
+
+    def test_endpoint_template(self):
+        template = dtratelimit.endpoint_template
+        assert template('/projects') == '/projects'
+        assert template('/projects/p/devices/d') == '/projects/{}/devices/{}'
+        assert template('/projects/-/devices:batchUpdate') == \
+            '/projects/{}/devices:batchUpdate'
+        assert template('/projects/p/devices/d:publish') == \
+            '/projects/{}/devices/{}:publish'
+        assert template('/claimInfo?identifier=x') == '/claimInfo'
+
+    def test_get_limiter(self, rate_limits):
+        assert dtratelimit.get_limiter('url', 'GET', '/projects') is None
+
+        disruptive.rate_limits = {
+            '*': {'*': 20, 'events': 5},
+            'emulator': {'write': 1},
+        }
+        read = dtratelimit.get_limiter('url', 'GET', '/projects')
+        events = dtratelimit.get_limiter('url', 'GET', '/p/d/events')
+        assert read.rate == 20
+        assert events.rate == 5
+        assert dtratelimit.get_limiter('url', 'GET', '/devices') is read
+        assert dtratelimit.get_limiter('emulator', 'POST', '/x').rate == 1
+        assert dtratelimit.get_limiter('emulator', 'GET', '/x') is None
+
+    def test_request_paced(self, request_mock, rate_limits):
+        disruptive.rate_limits = {'*': {'*': 1}}
+        request_mock.json = dtapiresponses.touch_sensor
+
+        with mock.patch('time.monotonic', return_value=100.0):
+            disruptive.Device.get_device('device_id', 'project_id')
+            disruptive.Device.get_device('device_id', 'project_id')
+
+        request_mock.assert_request_count(2)
+        request_mock.sleep_patcher.assert_called_once_with(1.0)
+
+    def test_too_many_requests_retried(self, request_mock, rate_limits):
+        def __patched_request(json, status_code, headers):
+            return DTResponse(json, status_code, headers), None
+
+        disruptive.rate_limits = {'*': {'*': 10}}
+        api_res = dtapiresponses.touch_sensor
+        request_mock.request_patcher = request_mock._mocker.patch.object(
+            DTRequest,
+            '_request_wrapper',
+            side_effect=[
+                __patched_request({}, 429, {}),
+                __patched_request(api_res, 200, {}),
+            ],
+        )
+
+        device = disruptive.Device.get_device('device_id', 'project_id')
+
+        request_mock.assert_request_count(2)
+        assert device._raw == api_res
+        limiter = dtratelimit.get_limiter(
+            disruptive.base_url, 'GET', '/projects/p/devices/d',
+        )
+        assert limiter.current_rate == pytest.approx(5.1)
+
+    def test_too_many_requests_without_limit(self, request_mock):
+        request_mock.status_code = 429
+
+        with pytest.raises(dterrors.TooManyRequests):
+            disruptive.Device.get_device('device_id', 'project_id')
+
+        request_mock.assert_request_count(1)
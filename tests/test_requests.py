@@ -163,7 +163,7 @@ class TestRequests():
         # The default one is constant, which we fix by
         # using an iterable side_effect which advances each call.
         request_mock.request_patcher = request_mock._mocker.patch(
-            'requests.request',
+            'requests.Session.request',
             side_effect=[
                 RequestsReponseMock(__res('4'), 200, {}),
                 RequestsReponseMock(__res('3'), 200, {}),
@@ -210,7 +210,7 @@ class TestRequests():
         # The default one is constant, which we fix by
         # using an iterable side_effect which advances each call.
         request_mock.request_patcher = request_mock._mocker.patch(
-            'requests.request',
+            'requests.Session.request',
             side_effect=[
                 RequestsReponseMock(__res('4'), 200, {}),
                 RequestsReponseMock(__res('3'), 200, {}),
@@ -290,9 +290,9 @@ class TestRequests():
             )
 
     def test_request_caught_requests_connection_error(self, request_mock):
-        # Re-mock requests.request with a new side_effect.
+        # Re-mock requests.Session.request with a new side_effect.
         request_mock.request_patcher = request_mock._mocker.patch(
-            'requests.request',
+            'requests.Session.request',
             side_effect=requests.exceptions.ConnectionError,
         )
 
@@ -305,9 +305,9 @@ class TestRequests():
             )
 
     def test_request_caught_generic_requests_error(self, request_mock):
-        # Re-mock requests.request with a new side_effect.
+        # Re-mock requests.Session.request with a new side_effect.
         request_mock.request_patcher = request_mock._mocker.patch(
-            'requests.request',
+            'requests.Session.request',
             side_effect=requests.exceptions.RequestException,
         )
 
@@ -320,9 +320,9 @@ class TestRequests():
             )
 
     def test_request_caught_value_error(self, request_mock):
-        # Re-mock requests.request with a new side_effect.
+        # Re-mock requests.Session.request with a new side_effect.
         request_mock.request_patcher = request_mock._mocker.patch(
-            'requests.request',
+            'requests.Session.request',
             side_effect=requests.exceptions.RequestException,
         )
 
@@ -333,3 +333,129 @@ class TestRequests():
                 device_id='device_id',
                 request_timeout=99,
             )
+
+    def test_pooled_session_reused(self, request_mock):
+        # Send a few requests through the package-wide session.
+        DTRequest.get('/url')
+        DTRequest.post('/url')
+
+        # Both calls should resolve to the same pooled session.
+        s1 = disruptive.requests._pooled_session(disruptive.request_pool_size)
+        s2 = disruptive.requests._pooled_session(disruptive.request_pool_size)
+        assert s1 is s2
+
+        # A different pool size should result in a separate session.
+        s3 = disruptive.requests._pooled_session(1)
+        assert s3 is not s1
+        adapter = s3.get_adapter('https://')
+        assert adapter._pool_maxsize == 1
+
+    def test_pooled_session_other_process(self, request_mock):
+        # A session inherited from another process is dropped.
+        key = (-1, disruptive.request_pool_size)
+        disruptive.requests._sessions[key] = object()
+        disruptive.requests._pooled_session(2)
+        assert key not in disruptive.requests._sessions
+
+    def test_stream_closed(self, request_mock):
+        response = RequestsReponseMock({}, 200, {}, [
+            dtapiresponses.stream_ping,
+        ])
+        request_mock.request_patcher.side_effect = None
+        request_mock.request_patcher.return_value = response
+
+        for _ in DTRequest.stream('/url'):
+            pass
+
+        # The stream response should be released to the pool.
+        assert response.closed
+
+    def test_session_override(self, request_mock):
+        # Provide a custom session through kwargs.
+        session = request_mock._mocker.MagicMock()
+        session.request.return_value = RequestsReponseMock(
+            dtapiresponses.touch_sensor, 200, {},
+        )
+
+        _ = disruptive.Device.get_device(
+            device_id='device_id',
+            session=session,
+        )
+
+        # The custom session should have been used over the pooled one.
+        assert session.request.call_count == 1
+        request_mock.assert_request_count(0)
+
+    def test_request_pool_size_invalid(self, request_mock):
+        # Catch expected error as the pool size is invalid.
+        with pytest.raises(disruptive.errors.ConfigurationError):
+            disruptive.Device.get_device(
+                device_id='device_id',
+                request_pool_size=0,
+            )
+
+    def test_paginated_iter(self, request_mock):
+        def __patched_request(json, status_code, headers):
+            return DTResponse(json, status_code, headers), None
+
+        pages = [
+            {'nextPageToken': 'a', 'items': [1, 2]},
+            {'nextPageToken': 'b', 'items': [3]},
+            {'nextPageToken': '', 'items': [4, 5]},
+        ]
+
+        for prefetch in [False, True]:
+            request_mock.request_patcher = request_mock._mocker.patch.object(
+                DTRequest,
+                '_request_wrapper',
+                side_effect=[__patched_request(p, 200, {}) for p in pages],
+            )
+
+            # Items of every page should be yielded in order.
+            items = DTRequest.paginated_iter(
+                url='',
+                pagination_key='items',
+                params={'key': 'value'},
+                prefetch=prefetch,
+            )
+            assert list(items) == [1, 2, 3, 4, 5]
+            request_mock.assert_request_count(3)
+
+    def test_paginated_pages(self, request_mock):
+        def __patched_request(json, status_code, headers):
+            return DTResponse(json, status_code, headers), None
+
+        pages = [
+            {'nextPageToken': 'a', 'items': [1, 2]},
+            {'nextPageToken': '', 'items': [3]},
+        ]
+        request_mock.request_patcher = request_mock._mocker.patch.object(
+            DTRequest,
+            '_request_wrapper',
+            side_effect=[__patched_request(p, 200, {}) for p in pages],
+        )
+
+        # Items should be yielded as a list per page.
+        items = DTRequest.paginated_pages(url='', pagination_key='items')
+        assert list(items) == [[1, 2], [3]]
+        request_mock.assert_request_count(2)
+
+    def test_paginated_iter_stop_early(self, request_mock):
+        def __patched_request(json, status_code, headers):
+            return DTResponse(json, status_code, headers), None
+
+        pages = [
+            {'nextPageToken': 'a', 'items': [1]},
+            {'nextPageToken': '', 'items': [2]},
+        ]
+        request_mock.request_patcher = request_mock._mocker.patch.object(
+            DTRequest,
+            '_request_wrapper',
+            side_effect=[__patched_request(p, 200, {}) for p in pages],
+        )
+
+        # Stopping after the first page should not request the next.
+        items = DTRequest.paginated_iter(url='', pagination_key='items')
+        assert next(items) == 1
+        items.close()
+        request_mock.assert_request_count(1)
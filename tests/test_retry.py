@@ -0,0 +1,133 @@
+from unittest import mock
+
+import pytest
+
+import disruptive
+import disruptive.errors as dterrors
+import disruptive.retry as dtretry
+import tests.api_responses as dtapiresponses
+
+
+class TestRetry():
+
+    def test_decorrelated_jitter_bounds(self):
+        policy = dtretry.RetryPolicy(base=1, cap=10)
+        backoff = policy.begin(request_attempts=100)
+
+        previous = 1
+        for _ in range(100):
+            sleeptime = backoff.next_sleep()
+            assert 1 <= sleeptime <= min(10, previous * 3)
+            previous = sleeptime
+
+    def test_sleeps_are_jittered(self):
+        policy = dtretry.RetryPolicy()
+        sleeps = {policy.begin(3).next_sleep() for _ in range(10)}
+        assert len(sleeps) > 1
+
+    def test_request_attempts(self):
+        backoff = dtretry.RetryPolicy().begin(request_attempts=2)
+        assert backoff.next_sleep() is not None
+        assert backoff.next_sleep() is not None
+        assert backoff.next_sleep() is None
+        assert backoff.attempt == 2
+
+    def test_retry_after_waited_out(self):
+        backoff = dtretry.RetryPolicy(base=0.1, cap=1).begin(3)
+        assert backoff.next_sleep(retry_after=20) == 20
+
+    def test_deadline(self):
+        policy = dtretry.RetryPolicy(base=1, cap=1, deadline=2.5)
+        with mock.patch('time.monotonic', return_value=100.0):
+            backoff = policy.begin(request_attempts=10)
+            assert backoff.next_sleep() == 1
+        with mock.patch('time.monotonic', return_value=101.0):
+            assert backoff.next_sleep() == 1
+        with mock.patch('time.monotonic', return_value=102.0):
+            assert backoff.next_sleep() is None
+
+    def test_budget(self):
+        budget = dtretry.RetryBudget(ratio=0.5, capacity=2)
+        policy = dtretry.RetryPolicy(budget=budget)
+
+        # Beginning a call deposits, but never past capacity.
+        backoff = policy.begin(request_attempts=10)
+        assert budget.balance == 2
+        assert backoff.next_sleep() is not None
+        assert backoff.next_sleep() is not None
+        assert backoff.next_sleep() is None
+
+        # Two calls earn another retry.
+        policy.begin(request_attempts=10)
+        backoff = policy.begin(request_attempts=10)
+        assert backoff.next_sleep() is not None
+        assert backoff.next_sleep() is None
+
+    def test_invalid_arguments(self):
+        with pytest.raises(dterrors.ConfigurationError):
+            dtretry.RetryPolicy(base=0)
+        with pytest.raises(dterrors.ConfigurationError):
+            dtretry.RetryPolicy(base=2, cap=1)
+        with pytest.raises(dterrors.ConfigurationError):
+            dtretry.RetryPolicy(deadline=0)
+        with pytest.raises(dterrors.ConfigurationError):
+            dtretry.RetryBudget(capacity=0)
+
+    def test_retry_after(self):
+        assert dtretry.retry_after(dterrors.TooManyRequests({}, 5)) == 5
+        assert dtretry.retry_after(dterrors.TooManyRequests({})) is None
+        assert dtretry.retry_after(dterrors.InternalServerError({})) is None
+        assert dtretry.retry_after(None) is None
+
+    def test_request_retry_policy_override(self, request_mock):
+        request_mock.status_code = 500
+        policy = dtretry.RetryPolicy(base=2, cap=2)
+
+        with pytest.raises(dterrors.InternalServerError):
+            disruptive.Device.get_device(
+                device_id='device_id',
+                retry_policy=policy,
+            )
+
+        # The override sets the sleeps, request_attempts the count.
+        n = disruptive.request_attempts
+        request_mock.assert_request_count(n + 1)
+        assert request_mock.sleep_patcher.call_args_list == \
+            [mock.call(2)] * n
+
+    def test_request_budget_exhausted(self, request_mock):
+        request_mock.status_code = 500
+        budget = dtretry.RetryBudget(ratio=0, capacity=1)
+        disruptive.retry_policy = dtretry.RetryPolicy(budget=budget)
+
+        # Only a single retry is left in the budget for both calls.
+        for _ in range(2):
+            with pytest.raises(dterrors.InternalServerError):
+                disruptive.Device.get_device(device_id='device_id')
+
+        request_mock.assert_request_count(3)
+
+    def test_stream_retry_policy(self, request_mock):
+        request_mock.status_code = 500
+        request_mock.request_patcher = request_mock._mocker.patch(
+            'requests.Session.request',
+            side_effect=dterrors.InternalServerError({}),
+        )
+
+        with pytest.raises(dterrors.InternalServerError):
+            for _ in disruptive.Stream.event_stream(
+                project_id='project_id',
+                retry_policy=dtretry.RetryPolicy(deadline=1e-9),
+            ):
+                pass
+
+        # The deadline has passed before the first retry.
+        request_mock.assert_request_count(1)
+
+    def test_request_success_without_sleep(self, request_mock):
+        request_mock.json = dtapiresponses.touch_sensor
+
+        device = disruptive.Device.get_device('device_id')
+
+        assert device._raw == dtapiresponses.touch_sensor
+        request_mock.sleep_patcher.assert_not_called()
@@ -8,6 +8,8 @@ import disruptive
 import disruptive.errors as dterrors
 import tests.api_responses as dtapiresponses
 from disruptive.events import Event
+from disruptive.requests import DTRequest
+from tests.framework import RequestsReponseMock
 
 
 class TestStream():
@@ -128,3 +130,187 @@ class TestStream():
 
         # Verify request is attempted the set number of times (+1).
         request_mock.assert_request_count(8)
+
+    def test_backfill_on_reconnect(self, request_mock):
+        ping = dtapiresponses.stream_ping
+        temp = dtapiresponses.stream_temperature_event
+        nstat = dtapiresponses.stream_networkstatus_event
+
+        def raw(line):
+            return json.loads(line.decode('ascii'))['result']['event']
+
+        class DroppedStreamMock(RequestsReponseMock):
+            def iter_lines(self, decode_unicode=False):
+                yield from self.iter_data
+                raise requests.exceptions.ConnectionError
+
+        # The first connection drops after a ping and the temperature event.
+        # The history holds both the already seen and the missed event.
+        streams = [
+            DroppedStreamMock({}, 200, {}, [ping, temp]),
+            RequestsReponseMock({}, 200, {}, [nstat]),
+        ]
+        history = {'nextPageToken': '', 'events': [raw(temp), raw(nstat)]}
+
+        def side_effect_override(**kwargs):
+            if kwargs['url'].endswith(':stream'):
+                return streams.pop(0)
+            return RequestsReponseMock(history, 200, {})
+
+        request_mock.request_patcher.side_effect = side_effect_override
+
+        events = list(disruptive.Stream.event_stream(
+            project_id='project_id',
+            device_ids=['device_id'],
+            backfill=True,
+        ))
+
+        # Verify the gap is fetched from the last received timestamp.
+        history_calls = [
+            c for c in request_mock.request_patcher.call_args_list
+            if c.kwargs['url'].endswith('/events')
+        ]
+        assert len(history_calls) == 1
+        assert history_calls[0].kwargs['params']['startTime'] \
+            == raw(temp)['timestamp']
+
+        # Each event is yielded once, whether streamed or backfilled.
+        assert [e.event_id for e in events] == [
+            raw(temp)['eventId'],
+            raw(nstat)['eventId'],
+        ]
+
+    def test_backfill_device_cursors(self, request_mock):
+        def line(device_id, event_id, timestamp):
+            return json.dumps({'result': {'event': {
+                'eventId': event_id,
+                'targetName': 'projects/p/devices/' + device_id,
+                'eventType': 'touch',
+                'data': {'touch': {'updateTime': timestamp}},
+                'timestamp': timestamp,
+            }}}).encode('ascii')
+
+        class DroppedStreamMock(RequestsReponseMock):
+            def iter_lines(self, decode_unicode=False):
+                yield from self.iter_data
+                raise requests.exceptions.ConnectionError
+
+        # The last event of d1 arrives late, after a ping.
+        streams = [
+            DroppedStreamMock({}, 200, {}, [
+                line('d1', 'e1', '2020-01-01T00:00:05Z'),
+                dtapiresponses.stream_ping,
+                line('d2', 'e2', '2020-01-01T00:00:01Z'),
+                line('d1', 'e3', '2020-01-01T00:00:00Z'),
+            ]),
+            RequestsReponseMock({}, 200, {}, []),
+        ]
+        history = {'nextPageToken': '', 'events': []}
+
+        def side_effect_override(**kwargs):
+            if kwargs['url'].endswith(':stream'):
+                return streams.pop(0)
+            return RequestsReponseMock(history, 200, {})
+
+        request_mock.request_patcher.side_effect = side_effect_override
+
+        list(disruptive.Stream.event_stream('p', backfill=True))
+
+        # Each device is backfilled from its own newest event.
+        starts = {
+            c.kwargs['url'].split('/')[-2]: c.kwargs['params']['startTime']
+            for c in request_mock.request_patcher.call_args_list
+            if c.kwargs['url'].endswith('/events')
+        }
+        assert starts == {
+            'd1': '2020-01-01T00:00:05Z',
+            'd2': '2020-01-01T00:00:01Z',
+        }
+
+    def test_backfill_error_closes_stream(self, request_mock):
+        temp = dtapiresponses.stream_temperature_event
+
+        class DroppedStreamMock(RequestsReponseMock):
+            def iter_lines(self, decode_unicode=False):
+                yield from self.iter_data
+                raise requests.exceptions.ConnectionError
+
+        streams = [
+            DroppedStreamMock({}, 200, {}, [temp]),
+            RequestsReponseMock({}, 200, {}, []),
+        ]
+        request_mock.request_patcher.side_effect = list(streams)
+
+        def backfill(cursors):
+            raise ValueError('backfill failed')
+
+        with pytest.raises(ValueError):
+            list(DTRequest.stream('/url', backfill=backfill))
+
+        # Both responses are closed, also the one left by the failure.
+        assert [s.closed for s in streams] == [True, True]
+
+    def test_batched_event_stream_size(self, request_mock):
+        temp = dtapiresponses.stream_temperature_event
+        request_mock.iter_data = [temp] * 5
+
+        # With a long latency, batches are only flushed when full
+        # and the remainder when the stream stops.
+        batches = list(disruptive.Stream.batched_event_stream(
+            project_id='project_id',
+            max_batch_size=2,
+            max_latency=3600,
+        ))
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+        for b in batches:
+            for e in b:
+                assert isinstance(e, Event)
+
+    def test_batched_event_stream_latency(self, request_mock):
+        ping = dtapiresponses.stream_ping
+        temp = dtapiresponses.stream_temperature_event
+        request_mock.iter_data = [temp, temp, ping, temp, ping, ping]
+
+        # Let 1 second pass between every message.
+        clock = iter(range(100))
+        with patch('time.monotonic', side_effect=lambda: next(clock)):
+            batches = list(disruptive.Stream.batched_event_stream(
+                project_id='project_id',
+                max_batch_size=100,
+                max_latency=2,
+            ))
+
+        # Pings should flush batches that have waited long enough.
+        assert [len(b) for b in batches] == [2, 1]
+
+    def test_batched_event_stream_error(self, request_mock):
+        temp = dtapiresponses.stream_temperature_event
+        unauthorized = json.dumps(
+            {'error': {'code': 401, 'message': 'unauthorized'}}
+        ).encode('utf-8')
+        request_mock.iter_data = [temp, temp, unauthorized]
+
+        batches = []
+        with pytest.raises(dterrors.Unauthorized):
+            for batch in disruptive.Stream.batched_event_stream(
+                project_id='project_id',
+                max_latency=3600,
+            ):
+                batches.append(batch)
+
+        # Buffered events are yielded before the error is raised.
+        assert [len(b) for b in batches] == [2]
+
+    def test_batched_event_stream_invalid(self, request_mock):
+        with pytest.raises(dterrors.ConfigurationError):
+            next(disruptive.Stream.batched_event_stream(
+                project_id='project_id',
+                max_batch_size=0,
+            ))
+
+        with pytest.raises(dterrors.ConfigurationError):
+            next(disruptive.Stream.batched_event_stream(
+                project_id='project_id',
+                max_latency=-1,
+            ))
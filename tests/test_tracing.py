@@ -0,0 +1,154 @@
+import pytest
+
+import disruptive
+import disruptive.errors as dterrors
+import disruptive.tracing as dttracing
+import tests.api_responses as dtapiresponses
+from disruptive.requests import DTRequest, DTResponse
+
+
+@pytest.fixture()
+def spans(mocker):
+    # Spans are exported to memory by a provider of the test's own,
+    # leaving the global tracer provider untouched.
+    sdk_trace = pytest.importorskip('opentelemetry.sdk.trace')
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    mocker.patch.object(
+        dttracing, '_tracer',
+        return_value=provider.get_tracer('test'),
+    )
+    yield exporter
+    disruptive.trace_requests = True
+
+
+class TestTracing():
+
+    def test_project_id(self):
+        assert dttracing.project_id('/projects/p1/devices/d') == 'p1'
+        assert dttracing.project_id('/projects/p1:move') == 'p1'
+        assert dttracing.project_id('/organizations/o') is None
+
+    def test_not_installed(self, request_mock, mocker):
+        mocker.patch.object(dttracing, '_installed', False)
+        request_mock.json = dtapiresponses.touch_sensor
+
+        assert dttracing.request_span('GET', '/url') is dttracing._NO_SPAN
+        assert dttracing.start_stream_span('/url', 0) is None
+
+        disruptive.Device.get_device('device_id', 'project_id')
+        headers = request_mock.request_patcher.call_args.kwargs['headers']
+        assert 'traceparent' not in headers
+
+    def test_request_span(self, request_mock, spans):
+        request_mock.json = dtapiresponses.touch_sensor
+
+        disruptive.Device.get_device('device_id', 'project_id')
+
+        span, = spans.get_finished_spans()
+        assert span.name == 'GET /projects/{}/devices/{}'
+        assert span.attributes['http.request.method'] == 'GET'
+        assert span.attributes['url.template'] == '/projects/{}/devices/{}'
+        assert span.attributes['disruptive.project_id'] == 'project_id'
+        assert span.attributes['http.response.status_code'] == 200
+        assert span.attributes['disruptive.retry_count'] == 0
+
+        # The trace context is propagated to the API.
+        headers = request_mock.request_patcher.call_args.kwargs['headers']
+        trace_id = '{:032x}'.format(span.context.trace_id)
+        assert headers['traceparent'].split('-')[1] == trace_id
+
+    def test_request_span_retries(self, request_mock, spans):
+        request_mock.status_code = 500
+
+        with pytest.raises(dterrors.InternalServerError):
+            disruptive.Device.get_device(
+                device_id='device_id',
+                request_attempts=1,
+            )
+
+        span, = spans.get_finished_spans()
+        assert span.attributes['http.response.status_code'] == 500
+        assert span.attributes['disruptive.retry_count'] == 1
+        assert not span.status.is_ok
+        assert span.events[0].name == 'exception'
+
+    def test_page_spans(self, request_mock, spans):
+        def __patched_request(json, status_code, headers):
+            return DTResponse(json, status_code, headers), None
+
+        pages = [
+            {'nextPageToken': 'a', 'items': [1, 2]},
+            {'nextPageToken': '', 'items': [3]},
+        ]
+        request_mock.request_patcher = request_mock._mocker.patch.object(
+            DTRequest,
+            '_request_wrapper',
+            side_effect=[__patched_request(p, 200, {}) for p in pages],
+        )
+
+        # Prefetched pages are traced in the caller's context.
+        tracer = dttracing._tracer()
+        with tracer.start_as_current_span('parent') as parent:
+            items = DTRequest.paginated_get(
+                url='/projects/p1/devices',
+                pagination_key='items',
+                prefetch=True,
+            )
+        assert items == [1, 2, 3]
+
+        finished = spans.get_finished_spans()
+        page_spans = [s for s in finished if s.name.startswith('paginated')]
+        assert [s.attributes['disruptive.page_count'] for s in page_spans] \
+            == [1, 2]
+        for span in page_spans:
+            assert span.parent.span_id == parent.context.span_id
+            assert span.attributes['disruptive.project_id'] == 'p1'
+
+        # Each page has a request span of its own.
+        request_spans = [s for s in finished if s.name.startswith('GET')]
+        assert [s.parent.span_id for s in request_spans] == \
+            [s.context.span_id for s in page_spans]
+
+    def test_stream_span(self, request_mock, spans):
+        request_mock.iter_data = [dtapiresponses.stream_ping]
+
+        for _ in disruptive.Stream.event_stream('project_id'):
+            pass
+
+        span, = spans.get_finished_spans()
+        assert span.name == 'stream connect /projects/{}/devices:stream'
+        assert span.attributes['disruptive.project_id'] == 'project_id'
+        assert span.attributes['disruptive.retry_count'] == 0
+        assert span.attributes['http.response.status_code'] == 200
+
+        headers = request_mock.request_patcher.call_args.kwargs['headers']
+        assert 'traceparent' in headers
+
+    def test_refresh_span(self, mocker, spans):
+        auth = disruptive.Auth.service_account('key_id', 'secret', 'email')
+        mocker.patch.object(
+            auth, '_get_access_token',
+            return_value={'access_token': 'token', 'expires_in': 3600},
+        )
+
+        auth.refresh()
+
+        span, = spans.get_finished_spans()
+        assert span.name == 'token refresh'
+        assert span.attributes['disruptive.token_endpoint'] == \
+            auth.token_endpoint
+
+    def test_disabled(self, request_mock, spans):
+        disruptive.trace_requests = False
+        request_mock.json = dtapiresponses.touch_sensor
+
+        disruptive.Device.get_device('device_id', 'project_id')
+
+        assert len(spans.get_finished_spans()) == 0
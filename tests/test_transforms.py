@@ -84,6 +84,20 @@ class TestTransforms():
         outp = datetime(1970, 1, 1, tzinfo=timezone(timedelta(hours=2)))
         assert dttrans.to_datetime(inp) == outp
 
+    def test_to_epoch_ns(self):
+        assert dttrans.to_epoch_ns('1970-01-01T00:00:01Z') == 10**9
+        assert dttrans.to_epoch_ns('1970-01-01T02:00:00+02:00') == 0
+        assert dttrans.to_epoch_ns(
+            '1970-01-01T00:00:00.123456789Z'
+        ) == 123456789
+        assert dttrans.to_epoch_ns(datetime(1970, 1, 1, 0, 0, 1)) == 10**9
+
+    def test_to_epoch_ns_invalid(self):
+        with pytest.raises(dterrors.FormatError):
+            dttrans.to_epoch_ns('1970-01-01T00:00:00')
+        with pytest.raises(TypeError):
+            dttrans.to_epoch_ns(0)
+
     def test_validate_iso8601_format_valid(self):
         inp1 = '1970-01-01T00:00:00Z'
         assert dttrans.validate_iso8601_format(inp1) is True
@@ -132,3 +146,56 @@ class TestTransforms():
         for test in tests:
             snake_case = dttrans.camel_to_snake_case(test.give_str)
             assert snake_case == test.want_str, test.name
+
+    def test_to_datetime_api_shape(self):
+        utc = timezone.utc
+        for inp, outp in [
+            ('2021-04-21T08:15:43Z', datetime(2021, 4, 21, 8, 15, 43,
+                                              tzinfo=utc)),
+            ('2021-04-21T08:15:43.512Z', datetime(2021, 4, 21, 8, 15, 43,
+                                                  512000, tzinfo=utc)),
+            ('2021-04-21T08:15:43.512330Z', datetime(2021, 4, 21, 8, 15, 43,
+                                                     512330, tzinfo=utc)),
+        ]:
+            assert dttrans.to_datetime(inp) == outp
+
+        # Same length as the fast path, but invalid.
+        with pytest.raises(dterrors.FormatError):
+            dttrans.to_datetime('2021-13-21T08:15:43Z')
+
+        # Same length and markers as the fast path, but not the same shape.
+        for inp in ['2020-W01-1T00:00:00Z', '2020-01-01T00:00:0\u0661Z']:
+            with pytest.raises(dterrors.FormatError):
+                dttrans._parse_iso8601(inp)
+
+    def test_timestamp_cache_size(self):
+        inp = '2021-04-21T08:15:43.512330Z'
+        try:
+            dttrans.set_timestamp_cache_size(16)
+            assert dttrans.to_datetime(inp) is dttrans.to_datetime(inp)
+        finally:
+            dttrans.set_timestamp_cache_size(0)
+
+        assert dttrans.to_datetime(inp) is not dttrans.to_datetime(inp)
+        with pytest.raises(dterrors.ConfigurationError):
+            dttrans.set_timestamp_cache_size(-1)
+
+    def test_to_datetime_batch(self):
+        np = pytest.importorskip('numpy')
+
+        out = dttrans.to_datetime_batch([
+            '2021-04-21T08:15:43.512330Z',
+            None,
+            '2021-04-21T10:15:43+02:00',
+        ])
+        assert out.dtype == np.dtype('datetime64[ns]')
+        assert out[0] == np.datetime64('2021-04-21T08:15:43.512330', 'ns')
+        assert np.isnat(out[1])
+        assert out[2] == np.datetime64('2021-04-21T08:15:43', 'ns')
+
+        with pytest.raises(dterrors.FormatError):
+            dttrans.to_datetime_batch(['2021-04-21T08:15:43'])
+
+        # Rejected as by the scalar parser, though NumPy would accept it.
+        with pytest.raises(dterrors.FormatError):
+            dttrans.to_datetime_batch(['2020-01-01Z'])